@@ -3,6 +3,28 @@ from dotenv import load_dotenv
 
 load_dotenv()
 DATABASE_URL = os.getenv("DATABASE_URL")
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL")
+DB_ENGINE_PROFILE = os.getenv("DB_ENGINE_PROFILE", "api").lower()
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() in ("1", "true", "yes")
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_API_POOL_SIZE = int(os.getenv("DB_API_POOL_SIZE", "10"))
+DB_API_MAX_OVERFLOW = int(os.getenv("DB_API_MAX_OVERFLOW", "10"))
+DB_API_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_API_STATEMENT_TIMEOUT_MS", "5000"))
+DB_WORKER_POOL_SIZE = int(os.getenv("DB_WORKER_POOL_SIZE", "4"))
+DB_WORKER_MAX_OVERFLOW = int(os.getenv("DB_WORKER_MAX_OVERFLOW", "4"))
+DB_WORKER_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_WORKER_STATEMENT_TIMEOUT_MS", "10000"))
+DB_AI_POOL_SIZE = int(os.getenv("DB_AI_POOL_SIZE", "4"))
+DB_AI_MAX_OVERFLOW = int(os.getenv("DB_AI_MAX_OVERFLOW", "2"))
+DB_AI_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_AI_STATEMENT_TIMEOUT_MS", "30000"))
+DB_READ_STICKY_MS = int(os.getenv("DB_READ_STICKY_MS", "5000"))
+PAGE_DEFAULT_LIMIT = int(os.getenv("PAGE_DEFAULT_LIMIT", "50"))
+PAGE_MAX_LIMIT = int(os.getenv("PAGE_MAX_LIMIT", "200"))
+PAGINATION_LEGACY_FULL_LIST = os.getenv("PAGINATION_LEGACY_FULL_LIST", "true").lower() in ("1", "true", "yes")
+TRANSCRIPT_ARCHIVE_DIR = os.getenv("TRANSCRIPT_ARCHIVE_DIR", "transcript_archive")
+TRANSCRIPT_ARCHIVE_CODEC = os.getenv("TRANSCRIPT_ARCHIVE_CODEC", "zstd").lower()
+TRANSCRIPT_ARCHIVE_AFTER_DAYS = int(os.getenv("TRANSCRIPT_ARCHIVE_AFTER_DAYS", "30"))
+SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "5"))
 JWT_SECRET = os.getenv("JWT_SECRET", "changeme")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
@@ -18,3 +40,53 @@ WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "cpu")
 STT_PROVIDER = os.getenv("STT_PROVIDER", "google").lower()
 STT_LANGUAGE = os.getenv("STT_LANGUAGE", "ko-KR")
 STT_POLL_INTERVAL = float(os.getenv("STT_POLL_INTERVAL", "0.1"))
+AUDIO_USER_RATE_PER_SEC = float(os.getenv("AUDIO_USER_RATE_PER_SEC", "20"))
+AUDIO_USER_BURST = int(os.getenv("AUDIO_USER_BURST", "40"))
+AUDIO_MEETING_RATE_PER_SEC = float(os.getenv("AUDIO_MEETING_RATE_PER_SEC", "100"))
+AUDIO_MEETING_BURST = int(os.getenv("AUDIO_MEETING_BURST", "200"))
+AUDIO_QUEUE_MAX_LEN = int(os.getenv("AUDIO_QUEUE_MAX_LEN", "500"))
+AUDIO_QUEUE_SHED_POLICY = os.getenv("AUDIO_QUEUE_SHED_POLICY", "drop_oldest").lower()
+AUDIO_QUEUE_TTL_SECONDS = int(os.getenv("AUDIO_QUEUE_TTL_SECONDS", "120"))
+AUDIO_QUEUE_RETRY_AFTER_MS = int(os.getenv("AUDIO_QUEUE_RETRY_AFTER_MS", "500"))
+STT_INTERIM_RESULTS = os.getenv("STT_INTERIM_RESULTS", "false").lower() in ("1", "true", "yes")
+STT_PARTIAL_INTERVAL_MS = int(os.getenv("STT_PARTIAL_INTERVAL_MS", "300"))
+STT_PREWARM_IDLE_SECONDS = float(os.getenv("STT_PREWARM_IDLE_SECONDS", "8"))
+STT_STREAM_ROTATE_SECONDS = float(os.getenv("STT_STREAM_ROTATE_SECONDS", "270"))
+STT_REPLAY_SECONDS = float(os.getenv("STT_REPLAY_SECONDS", "2.0"))
+STT_SEAM_WINDOW_SECONDS = float(os.getenv("STT_SEAM_WINDOW_SECONDS", "5.0"))
+STT_MIX_JITTER_MS = int(os.getenv("STT_MIX_JITTER_MS", "200"))
+STT_MIX_FRAME_MS = int(os.getenv("STT_MIX_FRAME_MS", "100"))
+STT_SILENCE_RMS_THRESHOLD = float(os.getenv("STT_SILENCE_RMS_THRESHOLD", "0"))
+AI_SUMMARY_WINDOW_TOKENS = int(os.getenv("AI_SUMMARY_WINDOW_TOKENS", "3000"))
+AI_SUMMARY_MAX_CONCURRENCY = int(os.getenv("AI_SUMMARY_MAX_CONCURRENCY", "4"))
+AI_WINDOW_CACHE_SIZE = int(os.getenv("AI_WINDOW_CACHE_SIZE", "512"))
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+LLM_CACHE_MAX_ENTRY_BYTES = int(os.getenv("LLM_CACHE_MAX_ENTRY_BYTES", "65536"))
+GEMINI_API_BASE = os.getenv("GEMINI_API_BASE", "https://generativelanguage.googleapis.com")
+LLM_HTTP_MAX_CONNECTIONS = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "20"))
+LLM_HTTP_MAX_KEEPALIVE = int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", "10"))
+LLM_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY", "60"))
+LLM_HTTP_CONNECT_TIMEOUT = float(os.getenv("LLM_HTTP_CONNECT_TIMEOUT", "5"))
+LLM_HTTP_READ_TIMEOUT = float(os.getenv("LLM_HTTP_READ_TIMEOUT", "60"))
+LLM_HTTP_WRITE_TIMEOUT = float(os.getenv("LLM_HTTP_WRITE_TIMEOUT", "10"))
+LLM_HTTP_POOL_TIMEOUT = float(os.getenv("LLM_HTTP_POOL_TIMEOUT", "5"))
+AI_JOB_TTL_SECONDS = int(os.getenv("AI_JOB_TTL_SECONDS", str(24 * 3600)))
+AI_WORKER_CONCURRENCY = int(os.getenv("AI_WORKER_CONCURRENCY", "4"))
+AI_JOB_VISIBILITY_TIMEOUT_SECONDS = int(os.getenv("AI_JOB_VISIBILITY_TIMEOUT_SECONDS", "600"))
+AI_JOB_MAX_ATTEMPTS = int(os.getenv("AI_JOB_MAX_ATTEMPTS", "3"))
+AI_COMBINED_COMPLETION = os.getenv("AI_COMBINED_COMPLETION", "false").lower() in ("1", "true", "yes")
+AI_PROMPT_MAX_TOKENS = int(os.getenv("AI_PROMPT_MAX_TOKENS", "12000"))
+AI_ROLLING_SUMMARY_EVERY_SEGMENTS = int(os.getenv("AI_ROLLING_SUMMARY_EVERY_SEGMENTS", "20"))
+AI_ROLLING_SUMMARY_DEBOUNCE_MS = int(os.getenv("AI_ROLLING_SUMMARY_DEBOUNCE_MS", "3000"))
+AI_ROLLING_SUMMARY_SETTLE_MS = int(os.getenv("AI_ROLLING_SUMMARY_SETTLE_MS", "2000"))
+AI_ROLLING_SUMMARY_LOCK_SECONDS = int(os.getenv("AI_ROLLING_SUMMARY_LOCK_SECONDS", "300"))
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+LLM_QUEUE_TIMEOUT_SECONDS = float(os.getenv("LLM_QUEUE_TIMEOUT_SECONDS", "10"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_RETRY_BASE_DELAY = float(os.getenv("LLM_RETRY_BASE_DELAY", "0.5"))
+LLM_RETRY_MAX_DELAY = float(os.getenv("LLM_RETRY_MAX_DELAY", "20"))
+LLM_RETRY_BUDGET_RATIO = float(os.getenv("LLM_RETRY_BUDGET_RATIO", "0.2"))
+LLM_RETRY_BUDGET_MIN = int(os.getenv("LLM_RETRY_BUDGET_MIN", "3"))
+LLM_BREAKER_FAILURE_THRESHOLD = int(os.getenv("LLM_BREAKER_FAILURE_THRESHOLD", "5"))
+LLM_BREAKER_RESET_SECONDS = float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30"))
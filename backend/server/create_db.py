@@ -1,11 +1,10 @@
 import asyncio
 
 from .db import engine
-from . import models
+from . import migrations
 
 async def init_models():
-    async with engine.begin() as conn:
-        await conn.run_sync(models.Base.metadata.create_all)
+    await migrations.upgrade(engine)
 
 if __name__ == "__main__":
     asyncio.run(init_models())
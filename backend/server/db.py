@@ -1,17 +1,168 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from .config import DATABASE_URL
+from __future__ import annotations
 
-engine = create_async_engine(
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from . import metrics, query_stats
+from .config import (
+    DATABASE_READ_URL,
     DATABASE_URL,
-    echo=True,
-    pool_pre_ping=True,
-    pool_size=1,
-    max_overflow=0,
-    pool_timeout=30,
+    DB_AI_MAX_OVERFLOW,
+    DB_AI_POOL_SIZE,
+    DB_AI_STATEMENT_TIMEOUT_MS,
+    DB_API_MAX_OVERFLOW,
+    DB_API_POOL_SIZE,
+    DB_API_STATEMENT_TIMEOUT_MS,
+    DB_ECHO,
+    DB_ENGINE_PROFILE,
+    DB_POOL_RECYCLE,
+    DB_POOL_TIMEOUT,
+    DB_READ_STICKY_MS,
+    DB_WORKER_MAX_OVERFLOW,
+    DB_WORKER_POOL_SIZE,
+    DB_WORKER_STATEMENT_TIMEOUT_MS,
+)
+from .redis import db_read_sticky_key, get_redis
+
+pool_wait = metrics.histogram("db_pool_wait_seconds", "Time spent waiting to check a connection out of the pool")
+pool_checked_out = metrics.gauge("db_pool_checked_out", "Connections currently checked out of the pool")
+read_routes = metrics.counter("db_read_routes_total", "Read-only requests by the engine that served them")
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    name: str
+    pool_size: int
+    max_overflow: int
+    statement_timeout_ms: int
+
+
+ENGINE_PROFILES = {
+    "api": EngineProfile("api", DB_API_POOL_SIZE, DB_API_MAX_OVERFLOW, DB_API_STATEMENT_TIMEOUT_MS),
+    "worker": EngineProfile("worker", DB_WORKER_POOL_SIZE, DB_WORKER_MAX_OVERFLOW, DB_WORKER_STATEMENT_TIMEOUT_MS),
+    "ai": EngineProfile("ai", DB_AI_POOL_SIZE, DB_AI_MAX_OVERFLOW, DB_AI_STATEMENT_TIMEOUT_MS),
+}
+
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a free connection."""
+
+    metric_labels: dict[str, str] = {}
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        finally:
+            pool_wait.observe(time.perf_counter() - started, **self.metric_labels)
+        pool_checked_out.set(self.checkedout(), **self.metric_labels)
+        return record
+
+    def _do_return_conn(self, record: Any) -> None:
+        super()._do_return_conn(record)
+        pool_checked_out.set(self.checkedout(), **self.metric_labels)
+
+
+def _timed_pool(profile: str, role: str) -> type[TimedQueuePool]:
+    # Labels live on the class so they survive the pool being recreated on dispose().
+    return type("TimedQueuePool", (TimedQueuePool,), {"metric_labels": {"profile": profile, "role": role}})
+
+
+def _statement_timeout_args(url: str, timeout_ms: int) -> dict[str, Any]:
+    if timeout_ms <= 0:
+        return {}
+    driver = make_url(url).get_driver_name()
+    if driver == "asyncpg":
+        return {"server_settings": {"statement_timeout": str(timeout_ms)}}
+    if driver.startswith("psycopg"):
+        return {"options": f"-c statement_timeout={timeout_ms}"}
+    return {}
+
+
+def create_engine_for(url: str, profile: EngineProfile, role: str = "primary") -> AsyncEngine:
+    """Build an engine sized and time-limited for ``profile``."""
+    kwargs: dict[str, Any] = {
+        "echo": DB_ECHO,
+        "pool_pre_ping": True,
+        "connect_args": _statement_timeout_args(url, profile.statement_timeout_ms),
+    }
+    parsed = make_url(url)
+    in_memory = parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:")
+    if not in_memory:
+        kwargs.update(
+            poolclass=_timed_pool(profile.name, role),
+            pool_size=profile.pool_size,
+            max_overflow=profile.max_overflow,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+        )
+    return create_async_engine(url, **kwargs)
+
+
+def _profile(name: str) -> EngineProfile:
+    try:
+        return ENGINE_PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown DB engine profile {name!r}; expected one of {sorted(ENGINE_PROFILES)}") from None
+
+
+query_stats.install()
+engine = create_engine_for(DATABASE_URL, _profile(DB_ENGINE_PROFILE))
+read_engine: Optional[AsyncEngine] = (
+    create_engine_for(DATABASE_READ_URL, _profile(DB_ENGINE_PROFILE), role="replica") if DATABASE_READ_URL else None
 )
 
 AsyncSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(bind=read_engine or engine, expire_on_commit=False)
+
+
+def configure_engines(profile: str) -> None:
+    """Rebuild the engines for ``profile``; call before the process opens any connection.
+
+    Workers use this to switch from the API profile they would otherwise
+    inherit at import time.
+    """
+    global engine, read_engine
+    selected = _profile(profile)
+    engine = create_engine_for(DATABASE_URL, selected)
+    read_engine = create_engine_for(DATABASE_READ_URL, selected, role="replica") if DATABASE_READ_URL else None
+    AsyncSessionLocal.configure(bind=engine)
+    AsyncReadSessionLocal.configure(bind=read_engine or engine)
+
 
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def mark_recent_write(subject: str) -> None:
+    """Pin ``subject``'s reads to the primary until the replica has caught up."""
+    if read_engine is None or DB_READ_STICKY_MS <= 0:
+        return
+    await get_redis().set(db_read_sticky_key(subject), "1", px=DB_READ_STICKY_MS)
+
+
+async def has_recent_write(subject: Optional[str]) -> bool:
+    if subject is None:
+        return False
+    try:
+        return bool(await get_redis().exists(db_read_sticky_key(subject)))
+    except Exception:
+        # Without the marker we cannot rule out a fresh write; stay on the primary.
+        return True
+
+
+async def open_read_session(subject: Optional[str]) -> AsyncSession:
+    """Session for read-only work: the replica unless ``subject`` wrote recently."""
+    if read_engine is None:
+        return AsyncSessionLocal()
+    if await has_recent_write(subject):
+        read_routes.inc(target="primary_sticky")
+        return AsyncSessionLocal()
+    read_routes.inc(target="replica")
+    return AsyncReadSessionLocal()
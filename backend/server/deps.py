@@ -1,13 +1,16 @@
-from fastapi import Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
 
 from .config import JWT_SECRET, JWT_ALGORITHM
-from .db import get_db
+from .db import get_db, open_read_session
 from .models import User, TeamMember, Meeting
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import and_, select
+from sqlalchemy.sql.base import ExecutableOption
 
 bearer_scheme = HTTPBearer()
 
@@ -40,6 +43,31 @@ async def get_current_user(
     return await authenticate_token(token, db)
 
 
+def token_subject(request: Request) -> Optional[str]:
+    """User id from the request's bearer token, without touching the database."""
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM]).get("sub")
+    except JWTError:
+        return None
+
+
+async def get_read_db(request: Request):
+    """Session for read-only routes, served by the replica when one is configured."""
+    async with await open_read_session(token_subject(request)) as session:
+        yield session
+
+
+async def get_current_reader(
+    creds: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_read_db),
+):
+    """``get_current_user`` for read-only routes; shares the route's read session."""
+    return await authenticate_token(creds.credentials, db)
+
+
 async def ensure_team_member(
     db: AsyncSession,
     team_id: UUID,
@@ -77,12 +105,23 @@ async def ensure_meeting_access(
     db: AsyncSession,
     meeting_id: UUID,
     user_id: UUID,
+    *options: ExecutableOption,
 ) -> Meeting:
-    stmt = select(Meeting).where(Meeting.id == meeting_id)
+    """Load a meeting the user's team owns; ``options`` (e.g. eager loads) apply to the meeting query."""
+    stmt = (
+        select(Meeting, TeamMember.id)
+        .outerjoin(TeamMember, and_(TeamMember.team_id == Meeting.team_id, TeamMember.user_id == user_id))
+        .where(Meeting.id == meeting_id)
+        .options(*options)
+    )
     res = await db.execute(stmt)
-    meeting = res.scalar_one_or_none()
-    if not meeting:
+    row = res.first()
+    if not row:
         raise HTTPException(status_code=404, detail="Meeting not found")
-
-    await ensure_team_member(db, meeting.team_id, user_id)
+    meeting, member_id = row
+    if member_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not a member of this team",
+        )
     return meeting
@@ -1,4 +1,13 @@
-from fastapi import FastAPI
+import contextlib
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
+
+from . import metrics
+from .db import mark_recent_write
+from .query_stats import report, track_queries
+from .deps import token_subject
 from .routers import (
     auth,
     teams,
@@ -12,8 +21,41 @@ from .routers import (
     ai,
     recordings,
 )
+from .services.llm import close_http_client
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    yield
+    await close_http_client()
+
+
+app = FastAPI(title="Team Meeting API", lifespan=lifespan)
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+@app.middleware("http")
+async def read_your_writes(request: Request, call_next):
+    response = await call_next(request)
+    if request.method in WRITE_METHODS and response.status_code < 400:
+        subject = token_subject(request)
+        if subject:
+            # Set before the response reaches the client so its next read sees the write.
+            with contextlib.suppress(Exception):
+                await mark_recent_write(subject)
+    return response
+
+
+@app.middleware("http")
+async def sql_instrumentation(request: Request, call_next):
+    with track_queries() as stats:
+        response = await call_next(request)
+    route = getattr(request.scope.get("route"), "path", "unmatched")
+    report(stats, route)
+    response.headers.append("Server-Timing", stats.server_timing())
+    return response
 
-app = FastAPI(title="Team Meeting API")
 
 app.include_router(auth.router)
 app.include_router(teams.router)
@@ -30,3 +72,11 @@ app.include_router(recordings.router)
 @app.get("/api/health")
 async def health():
     return {"status": "ok"}
+
+
+@app.get("/api/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint() -> str:
+    texts = [metrics.render_prometheus()]
+    with contextlib.suppress(Exception):
+        texts.extend(await metrics.collect_snapshots())
+    return "".join(texts)
@@ -0,0 +1,121 @@
+"""Ordered schema migrations applied on top of ``models.Base.metadata``.
+
+Each ``rNNNN_*.py`` module in this package defines ``revision``,
+``description`` and ``upgrade(connection)``. Revisions that must run outside a
+transaction (``CREATE INDEX CONCURRENTLY`` on Postgres) set
+``transactional = False`` and get an autocommit connection.
+
+A database without any tables is built from the models with ``create_all``
+and stamped at the latest revision; an existing database gets every revision
+it has not recorded in ``schema_migrations`` yet.
+"""
+from __future__ import annotations
+
+import importlib
+import logging
+import pkgutil
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Callable
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, inspect, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from ..models import Base, utcnow
+
+logger = logging.getLogger(__name__)
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("revision", String(32), primary_key=True),
+    Column("description", String(200), nullable=False),
+    Column("applied_at", DateTime, nullable=False, default=utcnow),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    revision: str
+    description: str
+    upgrade: Callable[[Connection], None]
+    transactional: bool = True
+
+
+def _load(module: ModuleType) -> Migration:
+    return Migration(
+        revision=module.revision,
+        description=module.description,
+        upgrade=module.upgrade,
+        transactional=getattr(module, "transactional", True),
+    )
+
+
+def discover() -> list[Migration]:
+    """All migrations in this package, ordered by revision."""
+    migrations = [
+        _load(importlib.import_module(f"{__name__}.{info.name}"))
+        for info in pkgutil.iter_modules(__path__)
+        if info.name.startswith("r")
+    ]
+    return sorted(migrations, key=lambda migration: migration.revision)
+
+
+def _state(connection: Connection) -> tuple[bool, set[str]]:
+    tables = set(inspect(connection).get_table_names())
+    fresh = not (tables & set(Base.metadata.tables))
+    if schema_migrations.name not in tables:
+        return fresh, set()
+    return fresh, set(connection.execute(select(schema_migrations.c.revision)).scalars())
+
+
+def _record(connection: Connection, migration: Migration) -> None:
+    connection.execute(
+        schema_migrations.insert().values(
+            revision=migration.revision, description=migration.description, applied_at=utcnow()
+        )
+    )
+
+
+async def pending(engine: AsyncEngine) -> list[Migration]:
+    async with engine.connect() as conn:
+        _, applied = await conn.run_sync(_state)
+    return [migration for migration in discover() if migration.revision not in applied]
+
+
+async def upgrade(engine: AsyncEngine) -> list[str]:
+    """Bring the database to the latest revision and return the revisions applied."""
+    migrations = discover()
+    async with engine.begin() as conn:
+        fresh, applied = await conn.run_sync(_state)
+        await conn.run_sync(schema_migrations.create, checkfirst=True)
+        if fresh:
+            # The models already describe the latest schema, so new databases
+            # only need to be stamped.
+            await conn.run_sync(Base.metadata.create_all)
+            for migration in migrations:
+                await conn.run_sync(_record, migration)
+            logger.info("Created schema at revision %s", migrations[-1].revision if migrations else "base")
+            return []
+        # Tables added to the models since the last deploy; indexes and columns
+        # on existing tables are the migrations' job.
+        await conn.run_sync(Base.metadata.create_all)
+
+    done: list[str] = []
+    for migration in migrations:
+        if migration.revision in applied:
+            continue
+        logger.info("Applying migration %s: %s", migration.revision, migration.description)
+        if migration.transactional:
+            async with engine.begin() as conn:
+                await conn.run_sync(migration.upgrade)
+                await conn.run_sync(_record, migration)
+        else:
+            async with engine.connect() as conn:
+                autocommit = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                await autocommit.run_sync(migration.upgrade)
+            async with engine.begin() as conn:
+                await conn.run_sync(_record, migration)
+        done.append(migration.revision)
+    return done
@@ -0,0 +1,25 @@
+import argparse
+import asyncio
+import logging
+
+from . import pending, upgrade
+
+
+async def main(command: str) -> None:
+    from ..db import engine
+
+    if command == "status":
+        for migration in await pending(engine):
+            print(f"pending {migration.revision}: {migration.description}")
+    else:
+        applied = await upgrade(engine)
+        print(f"applied {', '.join(applied)}" if applied else "up to date")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger(__package__).setLevel(logging.INFO)
+    parser = argparse.ArgumentParser(description="Apply schema migrations")
+    parser.add_argument("command", choices=("upgrade", "status"), nargs="?", default="upgrade")
+    asyncio.run(main(parser.parse_args().command))
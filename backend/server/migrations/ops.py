@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+def create_index(
+    connection: Connection,
+    name: str,
+    table: str,
+    columns: tuple[str, ...],
+    using: str | None = None,
+) -> None:
+    """Create an index if missing, without blocking writes on Postgres.
+
+    ``CONCURRENTLY`` needs an autocommit connection, so revisions calling this
+    on Postgres must set ``transactional = False``.
+    """
+    postgres = connection.dialect.name == "postgresql"
+    if postgres and not index_is_valid(connection, name):
+        # A failed concurrent build leaves an INVALID index that IF NOT EXISTS would keep.
+        drop_index(connection, name)
+    concurrently = " CONCURRENTLY" if postgres else ""
+    method = f" USING {using}" if using and postgres else ""
+    connection.exec_driver_sql(
+        f"CREATE INDEX{concurrently} IF NOT EXISTS {name} ON {table}{method} ({', '.join(columns)})"
+    )
+
+
+def index_is_valid(connection: Connection, name: str) -> bool:
+    """False only for a Postgres index that exists but is marked INVALID."""
+    valid = connection.execute(
+        text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"), {"name": name}
+    ).scalar()
+    return valid is not False
+
+
+def drop_index(connection: Connection, name: str) -> None:
+    concurrently = " CONCURRENTLY" if connection.dialect.name == "postgresql" else ""
+    connection.exec_driver_sql(f"DROP INDEX{concurrently} IF EXISTS {name}")
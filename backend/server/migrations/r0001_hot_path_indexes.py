@@ -0,0 +1,44 @@
+"""Secondary indexes for the hot read paths and transcript/action-item search."""
+from sqlalchemy.engine import Connection
+
+from ..models import fts5_backfill, fts5_ddl, tsvector_sql
+from .ops import create_index, drop_index
+
+revision = "0001"
+description = "hot path and search indexes"
+transactional = False
+
+INDEXES = (
+    ("ix_transcripts_meeting_created", "transcripts", ("meeting_id", "created_at")),
+    # Leading meeting_id also serves plain action_items(meeting_id) lookups.
+    ("ix_action_items_meeting_status_due", "action_items", ("meeting_id", "status", "due_date")),
+    ("ix_action_items_assignee_status_due", "action_items", ("assignee_user_id", "status", "due_date")),
+    ("ix_team_members_team_user", "team_members", ("team_id", "user_id")),
+    ("ix_team_members_user", "team_members", ("user_id",)),
+    ("ix_meetings_team_date_start", "meetings", ("team_id", '"date"', "start_time")),
+)
+
+SQLITE_FTS = (("transcripts", "text"), ("action_items", "content"))
+
+
+def _sqlite_fts(connection: Connection, table: str, column: str) -> None:
+    for statement in fts5_ddl(table, column) + fts5_backfill(table, column):
+        connection.exec_driver_sql(statement)
+
+
+def upgrade(connection: Connection) -> None:
+    # Superseded by ix_meetings_team_date_start.
+    drop_index(connection, "ix_meetings_team_date")
+    for name, table, columns in INDEXES:
+        create_index(connection, name, table, columns)
+
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        for table, column in SQLITE_FTS:
+            _sqlite_fts(connection, table, column)
+    elif dialect == "postgresql":
+        connection.exec_driver_sql("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        # An expression index builds concurrently; a generated column would rewrite the table under lock.
+        create_index(connection, "ix_transcripts_text_tsv", "transcripts", (tsvector_sql("text"),), using="gin")
+        create_index(connection, "ix_transcripts_text_trgm", "transcripts", ("text gin_trgm_ops",), using="gin")
+        create_index(connection, "ix_action_items_content_trgm", "action_items", ("content gin_trgm_ops",), using="gin")
@@ -0,0 +1,15 @@
+"""Denormalized action-item counter on meetings for the dashboard list."""
+from sqlalchemy.engine import Connection
+
+revision = "0002"
+description = "meetings.action_items_count"
+
+
+def upgrade(connection: Connection) -> None:
+    connection.exec_driver_sql(
+        "ALTER TABLE meetings ADD COLUMN action_items_count INTEGER NOT NULL DEFAULT 0"
+    )
+    connection.exec_driver_sql(
+        "UPDATE meetings SET action_items_count = "
+        "(SELECT count(*) FROM action_items WHERE action_items.meeting_id = meetings.id)"
+    )
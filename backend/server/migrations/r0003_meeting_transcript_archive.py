@@ -0,0 +1,9 @@
+"""Pointer from a meeting to its archived transcript file."""
+from sqlalchemy.engine import Connection
+
+revision = "0003"
+description = "meetings.transcript_archive"
+
+
+def upgrade(connection: Connection) -> None:
+    connection.exec_driver_sql("ALTER TABLE meetings ADD COLUMN transcript_archive VARCHAR(255)")
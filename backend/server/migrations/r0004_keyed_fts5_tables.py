@@ -0,0 +1,29 @@
+"""Rebuild SQLite FTS5 search tables keyed by an INTEGER PRIMARY KEY instead of rowid.
+
+Databases that ran revision 0001 before it switched to keyed tables still have
+external-content FTS5 tables on the implicit rowid, which ``VACUUM`` may
+renumber. Those are dropped and rebuilt from the table contents.
+"""
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection
+
+from ..models import fts5_backfill, fts5_ddl
+from .r0001_hot_path_indexes import SQLITE_FTS
+
+revision = "0004"
+description = "keyed FTS5 search tables"
+
+
+def upgrade(connection: Connection) -> None:
+    if connection.dialect.name != "sqlite":
+        return
+    tables = set(inspect(connection).get_table_names())
+    for table, column in SQLITE_FTS:
+        fts = f"{table}_fts"
+        if f"{fts}_keys" in tables:
+            continue
+        for suffix in ("ai", "ad", "au"):
+            connection.exec_driver_sql(f"DROP TRIGGER IF EXISTS {fts}_{suffix}")
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {fts}")
+        for statement in fts5_ddl(table, column) + fts5_backfill(table, column):
+            connection.exec_driver_sql(statement)
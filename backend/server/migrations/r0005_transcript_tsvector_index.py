@@ -0,0 +1,22 @@
+"""Replace the stored ``transcripts.search_vector`` column with an expression index.
+
+Databases that ran revision 0001 before the change got a generated column,
+which rewrote the table under an ACCESS EXCLUSIVE lock. The expression index
+is built concurrently; dropping the column afterwards only touches the catalog.
+"""
+from sqlalchemy.engine import Connection
+
+from ..models import tsvector_sql
+from .ops import create_index, drop_index
+
+revision = "0005"
+description = "transcript tsvector expression index"
+transactional = False
+
+
+def upgrade(connection: Connection) -> None:
+    if connection.dialect.name != "postgresql":
+        return
+    create_index(connection, "ix_transcripts_text_tsv", "transcripts", (tsvector_sql("text"),), using="gin")
+    drop_index(connection, "ix_transcripts_search_vector")
+    connection.exec_driver_sql("ALTER TABLE transcripts DROP COLUMN IF EXISTS search_vector")
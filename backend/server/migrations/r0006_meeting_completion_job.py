@@ -0,0 +1,9 @@
+"""Record which AI job applied a meeting's completion results."""
+from sqlalchemy.engine import Connection
+
+revision = "0006"
+description = "meetings.completion_job_id"
+
+
+def upgrade(connection: Connection) -> None:
+    connection.exec_driver_sql("ALTER TABLE meetings ADD COLUMN completion_job_id VARCHAR(64)")
@@ -2,6 +2,7 @@ from datetime import datetime, date, time
 import uuid
 
 from sqlalchemy import (
+    DDL,
     Column,
     String,
     Text,
@@ -11,7 +12,9 @@ from sqlalchemy import (
     Integer,
     ForeignKey,
     Float,
+    Index,
     UniqueConstraint,
+    event,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import declarative_base, relationship
@@ -55,6 +58,10 @@ class Team(Base):
 
 class TeamMember(Base):
     __tablename__ = "team_members"
+    __table_args__ = (
+        Index("ix_team_members_team_user", "team_id", "user_id"),
+        Index("ix_team_members_user", "user_id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     team_id = Column(UUID(as_uuid=True), ForeignKey("teams.id", ondelete="CASCADE"))
@@ -68,6 +75,9 @@ class TeamMember(Base):
 
 class Meeting(Base):
     __tablename__ = "meetings"
+    __table_args__ = (
+        Index("ix_meetings_team_date_start", "team_id", "date", "start_time"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     team_id = Column(UUID(as_uuid=True), ForeignKey("teams.id", ondelete="CASCADE"), nullable=False)
@@ -79,6 +89,12 @@ class Meeting(Base):
     summary = Column(Text, nullable=True)
     recording_url = Column(Text, nullable=True)
     status = Column(String(20), nullable=False, default="scheduled")
+    # Maintained alongside action item writes; see services/action_item_counts.py.
+    action_items_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # File name under TRANSCRIPT_ARCHIVE_DIR once the transcript rows were archived.
+    transcript_archive = Column(String(255), nullable=True)
+    # AI job whose summary and action items were applied; a redelivered job skips them.
+    completion_job_id = Column(String(64), nullable=True)
     created_at = Column(DateTime, default=utcnow)
     updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
 
@@ -91,6 +107,9 @@ class Meeting(Base):
 
 class Transcript(Base):
     __tablename__ = "transcripts"
+    __table_args__ = (
+        Index("ix_transcripts_meeting_created", "meeting_id", "created_at"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     meeting_id = Column(UUID(as_uuid=True), ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False)
@@ -106,6 +125,10 @@ class Transcript(Base):
 
 class ActionItem(Base):
     __tablename__ = "action_items"
+    __table_args__ = (
+        Index("ix_action_items_meeting_status_due", "meeting_id", "status", "due_date"),
+        Index("ix_action_items_assignee_status_due", "assignee_user_id", "status", "due_date"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     meeting_id = Column(UUID(as_uuid=True), ForeignKey("meetings.id", ondelete="CASCADE"), nullable=False)
@@ -155,3 +178,74 @@ class SpeakerStatistic(Base):
     updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
 
     meeting = relationship("Meeting", back_populates="speaker_stats")
+
+
+# Text search indexes live outside the ORM columns because each dialect needs
+# its own structure: FTS5 trigram tables kept in sync by triggers on SQLite,
+# and pg_trgm (plus a tsvector expression index for transcripts) on Postgres. The
+# migrations build existing databases from these same definitions.
+def fts5_ddl(table: str, column: str) -> tuple[str, ...]:
+    """Contentless FTS5 trigram index over ``table.column`` and its sync triggers.
+
+    The implicit rowid of a UUID-keyed table can be renumbered by ``VACUUM``,
+    so FTS rows are keyed by ``<table>_fts_keys.docid``, an INTEGER PRIMARY KEY
+    mapped to the row's ``id``.
+    """
+    fts, keys = f"{table}_fts", f"{table}_fts_keys"
+    delete_old = (
+        f"INSERT INTO {fts}({fts}, rowid, {column}) "
+        f"SELECT 'delete', docid, old.{column} FROM {keys} WHERE key = old.id; "
+    )
+    insert_new = f"INSERT INTO {fts}(rowid, {column}) SELECT docid, new.{column} FROM {keys} WHERE key = new.id; "
+    return (
+        f"CREATE TABLE IF NOT EXISTS {keys} (docid INTEGER PRIMARY KEY, key NOT NULL UNIQUE)",
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({column}, content='', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {keys}(key) VALUES (new.id); {insert_new}END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+        f"{delete_old}DELETE FROM {keys} WHERE key = old.id; END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {column} ON {table} BEGIN "
+        f"{delete_old}{insert_new}END",
+    )
+
+
+def fts5_backfill(table: str, column: str) -> tuple[str, ...]:
+    """Index rows that existed before ``fts5_ddl`` was applied."""
+    fts, keys = f"{table}_fts", f"{table}_fts_keys"
+    return (
+        f"INSERT OR IGNORE INTO {keys}(key) SELECT id FROM {table}",
+        f"INSERT INTO {fts}(rowid, {column}) SELECT k.docid, t.{column} FROM {keys} k JOIN {table} t ON t.id = k.key",
+    )
+
+
+def tsvector_sql(column: str) -> str:
+    """The tsvector expression indexed for transcripts; queries must repeat it exactly."""
+    return f"to_tsvector('simple', coalesce({column}, ''))"
+
+
+def trgm_ddl(table: str, column: str) -> tuple[str, ...]:
+    return (
+        "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+        f"CREATE INDEX IF NOT EXISTS ix_{table}_{column}_trgm ON {table} USING gin ({column} gin_trgm_ops)",
+    )
+
+
+SEARCH_DDL = {
+    Transcript.__table__: {
+        "sqlite": fts5_ddl("transcripts", "text"),
+        "postgresql": (
+            *trgm_ddl("transcripts", "text"),
+            f"CREATE INDEX IF NOT EXISTS ix_transcripts_text_tsv ON transcripts USING gin ({tsvector_sql('text')})",
+        ),
+    },
+    ActionItem.__table__: {
+        "sqlite": fts5_ddl("action_items", "content"),
+        "postgresql": trgm_ddl("action_items", "content"),
+    },
+}
+
+for _table, _by_dialect in SEARCH_DDL.items():
+    for _dialect, _statements in _by_dialect.items():
+        for _statement in _statements:
+            event.listen(_table, "after_create", DDL(_statement).execute_if(dialect=_dialect))
+
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from typing import Any, Callable, Optional, Sequence
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import Select, and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from .config import PAGE_DEFAULT_LIMIT, PAGINATION_LEGACY_FULL_LIST
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    """Pack keyset values into an opaque, URL-safe cursor string."""
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        values = None
+    if not isinstance(values, dict):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return values
+
+
+def _optional(parse: Callable[[str], Any]) -> Callable[[Any], Any]:
+    return lambda value: None if value is None else parse(value)
+
+
+parse_uuid = _optional(lambda value: UUID(str(value)))
+parse_date = _optional(date.fromisoformat)
+parse_time = _optional(time.fromisoformat)
+parse_datetime = _optional(datetime.fromisoformat)
+parse_bool = _optional(bool)
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One column of a keyset ordering; ``name`` is its field in the cursor."""
+
+    name: str
+    column: ColumnElement[Any]
+    descending: bool = False
+    parse: Callable[[Any], Any] = lambda value: value
+
+
+def page_limit(cursor: Optional[str], limit: Optional[int]) -> Optional[int]:
+    """Page size for a list request, or ``None`` for a legacy full listing.
+
+    Clients that send neither ``cursor`` nor ``limit`` keep getting every row
+    while ``PAGINATION_LEGACY_FULL_LIST`` is on.
+    """
+    if cursor is None and limit is None and PAGINATION_LEGACY_FULL_LIST:
+        return None
+    return limit or PAGE_DEFAULT_LIMIT
+
+
+def _after(keys: Sequence[SortKey], values: dict[str, Any]) -> ColumnElement[bool]:
+    # (k1, k2, ...) strictly after the cursor in lexicographic order; equality
+    # uses IS NOT DISTINCT FROM so nullable keys compare like the ORDER BY does.
+    clauses = []
+    for index, key in enumerate(keys):
+        value = values[key.name]
+        if value is None:
+            continue
+        prefix = [k.column.is_not_distinct_from(values[k.name]) for k in keys[:index]]
+        if isinstance(value, bool):
+            # Booleans only support IS: false < true, so only one side has successors.
+            if value != key.descending:
+                continue
+            step = key.column.is_(not value)
+        else:
+            step = key.column < value if key.descending else key.column > value
+        clauses.append(and_(*prefix, step))
+    return or_(*clauses)
+
+
+def cursor_values(keys: Sequence[SortKey], cursor: Optional[str]) -> Optional[dict[str, Any]]:
+    """Decode ``cursor`` into parsed values for ``keys``; ``None`` for the first page."""
+    if cursor is None:
+        return None
+    raw = decode_cursor(cursor)
+    try:
+        return {key.name: key.parse(raw[key.name]) for key in keys}
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from None
+
+
+def paginate(stmt: Select, keys: Sequence[SortKey], cursor: Optional[str], limit: Optional[int]) -> Select:
+    """Order ``stmt`` by ``keys`` and, when ``limit`` is set, fetch one row past the page."""
+    stmt = stmt.order_by(*(key.column.desc() if key.descending else key.column.asc() for key in keys))
+    values = cursor_values(keys, cursor)
+    if values is not None:
+        stmt = stmt.where(_after(keys, values))
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
+    return stmt
+
+
+def next_cursor(
+    rows: list[Any], limit: Optional[int], values: Callable[[Any], dict[str, Any]]
+) -> tuple[list[Any], Optional[str]]:
+    """Trim the look-ahead row and return the page with the cursor for the next one."""
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(values(page[-1]))
@@ -0,0 +1,124 @@
+"""Per-request SQL accounting: statement count, DB time and repeated statement shapes.
+
+``track_queries()`` opens a scope in the current context and the cursor event
+hooks from ``install()`` add every statement executed inside it, on any
+engine. The API wraps each request in a scope (see ``main.py``); tests use
+``query_budget`` to pin how many statements an endpoint may issue.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from . import metrics
+from .config import SQL_N_PLUS_ONE_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+queries_per_request = metrics.histogram(
+    "db_queries_per_request",
+    "SQL statements issued while serving one request",
+    buckets=(1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+query_seconds_per_request = metrics.histogram(
+    "db_query_seconds_per_request", "Total SQL execution time while serving one request"
+)
+n_plus_one = metrics.counter(
+    "db_n_plus_one_total", "Requests that repeated one statement shape more than the N+1 threshold"
+)
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize ``statement`` so executions that differ only in bound values compare equal."""
+    shape = _PLACEHOLDER.sub("?", _WHITESPACE.sub(" ", statement).strip())
+    return _PLACEHOLDER_LIST.sub("(?)", shape)
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    seconds: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+    parent: Optional["QueryStats"] = field(default=None, repr=False)
+
+    def record(self, statement: str, seconds: float) -> None:
+        shape = statement_shape(statement)
+        stats: Optional[QueryStats] = self
+        while stats is not None:
+            stats.count += 1
+            stats.seconds += seconds
+            stats.shapes[shape] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        return {shape: count for shape, count in self.shapes.items() if count > threshold}
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.seconds * 1000:.1f};desc="{self.count} queries"'
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count the statements executed in this context; nested scopes also count toward outer ones."""
+    stats = QueryStats(parent=_current.get())
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context: Any, executemany) -> None:
+    if _current.get() is not None and context is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context: Any, executemany) -> None:
+    stats = _current.get()
+    started = getattr(context, "_query_started", None)
+    if stats is not None and started is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+def install() -> None:
+    """Hook statement timing into every engine; idempotent."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def report(stats: QueryStats, route: str) -> None:
+    """Export one request's stats and warn about likely N+1 query patterns."""
+    queries_per_request.observe(stats.count, route=route)
+    query_seconds_per_request.observe(stats.seconds, route=route)
+    repeated = stats.repeated(SQL_N_PLUS_ONE_THRESHOLD)
+    if repeated:
+        n_plus_one.inc(route=route)
+    for shape, count in repeated.items():
+        logger.warning("Possible N+1 on %s: statement ran %d times: %s", route, count, shape[:300])
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """Fail with ``AssertionError`` if the block issues more than ``max_queries`` statements."""
+    with track_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        listing = "\n".join(f"  {count}x {shape}" for shape, count in stats.shapes.most_common())
+        raise AssertionError(f"{stats.count} queries issued, budget is {max_queries}:\n{listing}")
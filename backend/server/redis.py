@@ -27,6 +27,59 @@ def meeting_audio_key(meeting_id: UUID) -> str:
     return f"meeting:{meeting_id}:audio"
 
 
+def rolling_summary_key(meeting_id: UUID) -> str:
+    return f"meeting:{meeting_id}:rolling_summary"
+
+
+def rolling_summary_pending_key(meeting_id: UUID) -> str:
+    return f"meeting:{meeting_id}:rolling_summary:pending"
+
+
+def rolling_summary_new_segments_key(meeting_id: UUID) -> str:
+    return f"meeting:{meeting_id}:rolling_summary:new_segments"
+
+
+def rolling_summary_lock_key(meeting_id: UUID) -> str:
+    return f"meeting:{meeting_id}:rolling_summary:lock"
+
+
+def db_read_sticky_key(subject: str) -> str:
+    """Marks a user who wrote recently so their reads skip the replica."""
+    return f"db:read_sticky:{subject}"
+
+
+def audio_rate_key(scope: str, ident: UUID | str) -> str:
+    """Token-bucket state for audio ingest, e.g. ``ratelimit:audio:user:<id>``."""
+    return f"ratelimit:audio:{scope}:{ident}"
+
+
+def ai_job_queue_key() -> str:
+    return "ai:jobs"
+
+
+def ai_job_processing_key() -> str:
+    """Jobs claimed by a worker and not yet acknowledged."""
+    return "ai:jobs:processing"
+
+
+def ai_job_key(job_id: str) -> str:
+    return f"ai:job:{job_id}"
+
+
+def stt_control_key() -> str:
+    return "stt:control"
+
+
 def serialize_message(message_type: str, data: dict[str, Any]) -> str:
     """Helper to keep Redis pub/sub payloads consistent."""
     return json.dumps({"type": message_type, "data": data})
+
+
+async def request_stt_prewarm(meeting_id: UUID) -> None:
+    """Ask the STT worker to open a streaming session before audio arrives."""
+    client = get_redis()
+    await client.rpush(
+        stt_control_key(),
+        serialize_message("prewarm", {"meetingId": str(meeting_id)}),
+    )
+    await client.expire(stt_control_key(), 60)
@@ -4,12 +4,23 @@ from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..config import PAGE_MAX_LIMIT
 from ..db import get_db
-from ..deps import ensure_meeting_access, ensure_team_member, get_current_user
+from ..deps import ensure_meeting_access, ensure_team_member, get_current_reader, get_current_user, get_read_db
 from ..models import ActionItem, Meeting, User
+from ..pagination import (
+    SortKey,
+    next_cursor,
+    page_limit,
+    paginate,
+    parse_bool,
+    parse_date,
+    parse_datetime,
+    parse_uuid,
+)
 from ..schemas import (
     ActionItemCreateRequest,
     ActionItemListItem,
@@ -17,36 +28,70 @@ from ..schemas import (
     ActionItemResponse,
     ActionItemUpdateRequest,
 )
+from ..services.action_item_counts import adjust_action_items_count
+from ..services.text_search import contains_all
 
 router = APIRouter(prefix="/api", tags=["action-items"])
 
 
-@router.get("/teams/{team_id}/action-items", response_model=ActionItemListResponse)
-async def list_team_action_items(
-    team_id: UUID,
-    assignee: Optional[UUID] = Query(None),
-    status_filter: Optional[str] = Query(None, alias="status"),
-    search: Optional[str] = Query(None),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-) -> ActionItemListResponse:
-    await ensure_team_member(db, team_id, current_user.id)
+# ``due_date IS NULL`` leads so undated items sort last on every dialect.
+ACTION_ITEM_SORT = (
+    SortKey("dueNull", ActionItem.due_date.is_(None), parse=parse_bool),
+    SortKey("dueDate", ActionItem.due_date, parse=parse_date),
+    SortKey("createdAt", ActionItem.created_at, descending=True, parse=parse_datetime),
+    SortKey("id", ActionItem.id, parse=parse_uuid),
+)
+
 
+def _action_item_cursor(row) -> dict:
+    action = row[0]
+    return {
+        "dueNull": action.due_date is None,
+        "dueDate": action.due_date,
+        "createdAt": action.created_at,
+        "id": action.id,
+    }
+
+
+def team_action_items_query(
+    dialect: str,
+    team_id: UUID,
+    assignee: Optional[UUID] = None,
+    status_filter: Optional[str] = None,
+    search: Optional[str] = None,
+) -> Select:
     stmt = (
         select(ActionItem, Meeting)
         .join(Meeting, Meeting.id == ActionItem.meeting_id)
         .where(Meeting.team_id == team_id)
-        .order_by(ActionItem.due_date.asc().nullslast(), ActionItem.created_at.desc())
     )
     if assignee:
         stmt = stmt.where(ActionItem.assignee_user_id == assignee)
     if status_filter:
         stmt = stmt.where(ActionItem.status == status_filter)
-    if search:
-        stmt = stmt.where(ActionItem.content.ilike(f"%{search}%"))
+    if search and search.strip():
+        stmt = stmt.where(*contains_all(dialect, ActionItem.content, search))
+    return stmt
+
+
+@router.get("/teams/{team_id}/action-items", response_model=ActionItemListResponse)
+async def list_team_action_items(
+    team_id: UUID,
+    assignee: Optional[UUID] = Query(None),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    search: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=PAGE_MAX_LIMIT),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_reader),
+) -> ActionItemListResponse:
+    await ensure_team_member(db, team_id, current_user.id)
 
+    page_size = page_limit(cursor, limit)
+    stmt = team_action_items_query(db.get_bind().dialect.name, team_id, assignee, status_filter, search)
+    stmt = paginate(stmt, ACTION_ITEM_SORT, cursor, page_size)
     res = await db.execute(stmt)
-    rows = res.all()
+    rows, following = next_cursor(res.all(), page_size, _action_item_cursor)
 
     return ActionItemListResponse(
         action_items=[
@@ -63,7 +108,8 @@ async def list_team_action_items(
                 due_date=action.due_date,
             )
             for action, meeting in rows
-        ]
+        ],
+        next_cursor=following,
     )
 
 
@@ -91,6 +137,7 @@ async def create_action_item(
         due_date=payload.due_date,
     )
     db.add(action_item)
+    await adjust_action_items_count(db, meeting.id, 1)
     await db.commit()
     await db.refresh(action_item)
 
@@ -173,6 +220,7 @@ async def delete_action_item(
     await ensure_team_member(db, meeting.team_id, current_user.id)
 
     await db.delete(action_item)
+    await adjust_action_items_count(db, meeting.id, -1)
     await db.commit()
 
     return {"message": "Deleted successfully"}
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import json
+import logging
+import time
 from datetime import datetime, date, timedelta
-from typing import List
+from typing import Any, AsyncIterator, List
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..db import get_db
+from ..db import AsyncSessionLocal, get_db
 from ..deps import ensure_meeting_access, get_current_user
-from ..models import ActionItem, Meeting, Transcript, User
+from ..models import ActionItem, Meeting, User
 from ..schemas import (
+    AIJobResponse,
     ActionItemExtractionRequest,
     ActionItemExtractionResponse,
     ActionItemSuggestion,
@@ -18,19 +23,20 @@ from ..schemas import (
     SummarizeResponse,
     TranscriptChunk,
 )
-from ..services.llm import llm_service
+from ..redis import get_redis, meeting_channel, serialize_message
+from ..services.action_item_counts import adjust_action_items_count
+from ..services.ai_jobs import get_job
+from ..services.bulk_write import action_item_row, bulk_insert_returning
+from ..services.llm import PROMPT_VERSION, LLMUnavailableError, get_llm_service
+from ..services.llm_cache import cached_extract_action_items, cached_summarize, get_cached, store_cached
+from ..services.transcript_archive import load_transcript
 
 router = APIRouter(prefix="/api/ai", tags=["ai"])
+logger = logging.getLogger(__name__)
 
 
 async def _load_transcript_for_meeting(db: AsyncSession, meeting: Meeting) -> List[TranscriptChunk]:
-    stmt = (
-        select(Transcript)
-        .where(Transcript.meeting_id == meeting.id)
-        .order_by(Transcript.created_at.asc())
-    )
-    res = await db.execute(stmt)
-    rows = res.scalars().all()
+    rows = await load_transcript(db, meeting)
     return [
         TranscriptChunk(
             speaker=row.speaker,
@@ -57,7 +63,12 @@ async def summarize_meeting(
     if not transcript:
         raise HTTPException(status_code=400, detail="Transcript data is required.")
 
-    summary = await llm_service.summarize([chunk.model_dump() for chunk in transcript])
+    llm_service = get_llm_service()
+    summary, cached = await cached_summarize(
+        llm_service,
+        [chunk.model_dump() for chunk in transcript],
+        bypass=payload.bypass_cache,
+    )
 
     source = llm_service.provider or "heuristic"
     if meeting:
@@ -68,7 +79,122 @@ async def summarize_meeting(
         await db.refresh(meeting)
         source = f"{source}-persisted"
 
-    return SummarizeResponse(meeting_id=payload.meeting_id, summary=summary, source=source)
+    return SummarizeResponse(
+        meeting_id=payload.meeting_id,
+        summary=summary,
+        source=source,
+        cached=cached,
+    )
+
+
+def _sse(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _publish(meeting_id: UUID | None, message_type: str, data: dict[str, Any]) -> None:
+    if meeting_id is None:
+        return
+    try:
+        await get_redis().publish(meeting_channel(meeting_id), serialize_message(message_type, data))
+    except Exception as exc:
+        logger.warning("Failed to publish %s for meeting %s: %s", message_type, meeting_id, exc)
+
+
+async def _stream_summary_events(
+    transcript: list[dict[str, Any]],
+    meeting_id: UUID | None,
+    bypass_cache: bool,
+) -> AsyncIterator[str]:
+    llm_service = get_llm_service()
+    cached = False
+    summary = ""
+    model = llm_service.model or ""
+    if llm_service.provider and not bypass_cache:
+        summary, cached = await get_cached("summary", transcript, model, PROMPT_VERSION)
+        summary = summary if cached and isinstance(summary, str) else ""
+
+    async def replay(text: str) -> AsyncIterator[str]:
+        yield text
+
+    started = time.perf_counter()
+    chunks = replay(summary) if cached else llm_service.stream_summary(transcript)
+
+    parts: list[str] = []
+    degraded = False
+    try:
+        async for chunk in chunks:
+            index = len(parts)
+            parts.append(chunk)
+            yield _sse("delta", {"index": index, "text": chunk})
+            await _publish(
+                meeting_id,
+                "summary_delta",
+                {"meetingId": str(meeting_id), "index": index, "delta": chunk},
+            )
+    except LLMUnavailableError as exc:
+        if parts:
+            yield _sse("error", {"detail": str(exc)})
+            return
+        logger.warning("LLM unavailable, streaming heuristic summary: %s", exc)
+        degraded = True
+        parts.append(llm_service._fallback_summary(transcript))
+        yield _sse("delta", {"index": 0, "text": parts[0]})
+    except Exception as exc:
+        logger.exception("Streaming summary failed")
+        yield _sse("error", {"detail": str(exc) or exc.__class__.__name__})
+        return
+
+    summary = "".join(parts).strip()
+    if not cached and not degraded and llm_service.provider and summary:
+        await store_cached("summary", transcript, model, PROMPT_VERSION, summary, time.perf_counter() - started)
+
+    source = llm_service.provider or "heuristic"
+    if meeting_id is not None and summary:
+        # The request-scoped session is already closed once the response streams.
+        async with AsyncSessionLocal() as session:
+            meeting = await session.get(Meeting, meeting_id)
+            if meeting is not None:
+                meeting.summary = summary
+                meeting.updated_at = datetime.utcnow()
+                await session.commit()
+                source = f"{source}-persisted"
+        await _publish(meeting_id, "summary_update", {"meetingId": str(meeting_id), "summary": summary})
+
+    yield _sse(
+        "done",
+        SummarizeResponse(
+            meeting_id=meeting_id,
+            summary=summary,
+            source=source,
+            cached=cached,
+        ).model_dump(mode="json", by_alias=True),
+    )
+
+
+@router.post("/summarize/stream")
+async def stream_summarize_meeting(
+    payload: SummarizeRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    transcript = payload.transcript or []
+
+    if payload.meeting_id:
+        meeting = await ensure_meeting_access(db, payload.meeting_id, current_user.id)
+        transcript = await _load_transcript_for_meeting(db, meeting)
+
+    if not transcript:
+        raise HTTPException(status_code=400, detail="Transcript data is required.")
+
+    return StreamingResponse(
+        _stream_summary_events(
+            [chunk.model_dump() for chunk in transcript],
+            payload.meeting_id,
+            payload.bypass_cache,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post("/extract-action-items", response_model=ActionItemExtractionResponse)
@@ -87,14 +213,17 @@ async def extract_action_items(
     if not transcript:
         raise HTTPException(status_code=400, detail="Transcript data is required.")
 
-    suggestions = await llm_service.extract_action_items(
-        [chunk.model_dump() for chunk in transcript]
+    suggestions, cached = await cached_extract_action_items(
+        get_llm_service(),
+        [chunk.model_dump() for chunk in transcript],
+        bypass=payload.bypass_cache,
     )
     if not suggestions:
         return ActionItemExtractionResponse(
             meeting_id=payload.meeting_id,
             action_items=[],
             persisted=False,
+            cached=cached,
         )
 
     if not meeting:
@@ -104,45 +233,67 @@ async def extract_action_items(
                 ActionItemSuggestion(**item) for item in suggestions
             ],
             persisted=False,
+            cached=cached,
         )
 
-    created: list[ActionItemSuggestion] = []
     now = datetime.utcnow()
-    for suggestion in suggestions:
-        action_item = ActionItem(
-            meeting_id=meeting.id,
-            type=suggestion.get("type") or "task",
-            assignee=suggestion.get("assignee") or "Unassigned",
-            content=suggestion.get("content") or "Action item",
-            status="pending",
-            due_date=_parse_due_date(
-                suggestion.get("dueDate"),
-                reference_date=meeting.date if meeting else None,
-            ),
-            created_at=now,
-            updated_at=now,
-        )
-        db.add(action_item)
-        await db.flush()
-        created.append(
-            ActionItemSuggestion(
-                id=action_item.id,
-                meeting_id=meeting.id,
-                type=action_item.type,
-                assignee=action_item.assignee,
-                content=action_item.content,
-                status=action_item.status,
-                due_date=action_item.due_date.isoformat() if action_item.due_date else None,
-            )
+    rows = [
+        action_item_row(
+            meeting.id,
+            suggestion,
+            now,
+            due_date=_parse_due_date(suggestion.get("dueDate"), reference_date=meeting.date),
         )
-
+        for suggestion in suggestions
+    ]
+    inserted = await bulk_insert_returning(db, ActionItem, rows)
+    await adjust_action_items_count(db, meeting.id, len(inserted))
     await db.commit()
 
+    created = [
+        ActionItemSuggestion(
+            id=action_item.id,
+            meeting_id=meeting.id,
+            type=action_item.type,
+            assignee=action_item.assignee,
+            content=action_item.content,
+            status=action_item.status,
+            due_date=action_item.due_date.isoformat() if action_item.due_date else None,
+        )
+        for action_item in inserted
+    ]
+
     return ActionItemExtractionResponse(
         meeting_id=meeting.id,
         action_items=created,
         persisted=True,
+        cached=cached,
     )
+
+
+@router.get("/jobs/{job_id}", response_model=AIJobResponse)
+async def get_ai_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> AIJobResponse:
+    job = await get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    await ensure_meeting_access(db, UUID(job["meetingId"]), current_user.id)
+
+    return AIJobResponse(
+        id=job["id"],
+        type=job.get("type", ""),
+        meeting_id=job["meetingId"],
+        status=job.get("status", ""),
+        error=job.get("error"),
+        created_at=job.get("createdAt"),
+        updated_at=job.get("updatedAt"),
+    )
+
+
 def _parse_due_date(value: str | None, reference_date: date | None = None) -> date | None:
     if not value:
         return None
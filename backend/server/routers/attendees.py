@@ -7,7 +7,7 @@ from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..db import get_db
-from ..deps import ensure_meeting_access, get_current_user
+from ..deps import ensure_meeting_access, get_current_reader, get_current_user, get_read_db
 from ..models import MeetingAttendee, User
 from ..schemas import (
     MeetingAttendeeCreateRequest,
@@ -65,8 +65,8 @@ async def add_attendee(
 @router.get("/{meeting_id}/attendees", response_model=MeetingAttendeeListResponse)
 async def list_attendees(
     meeting_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_reader),
 ) -> MeetingAttendeeListResponse:
     meeting = await ensure_meeting_access(db, meeting_id, current_user.id)
 
@@ -1,16 +1,21 @@
+import contextlib
+import logging
 import uuid
 from datetime import datetime, date, time
 from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from ..config import PAGE_MAX_LIMIT
 from ..db import get_db
-from ..deps import ensure_meeting_access, ensure_team_member, get_current_user
-from ..models import ActionItem, Meeting, Transcript, User
+from ..deps import ensure_meeting_access, ensure_team_member, get_current_reader, get_current_user, get_read_db
+from ..models import Meeting, User
+from ..pagination import SortKey, next_cursor, page_limit, paginate, parse_date, parse_time, parse_uuid
+from ..redis import request_stt_prewarm
 from ..schemas import (
     MeetingCreateRequest,
     MeetingListResponse,
@@ -24,7 +29,10 @@ from ..schemas import (
     ActionItemResponse,
     SpeakerStatisticResponse,
 )
-from ..services.llm import llm_service
+from ..services.ai_jobs import JOB_MEETING_COMPLETION, enqueue_job
+from ..services.transcript_archive import load_transcript
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["meetings"])
 
@@ -52,35 +60,41 @@ def serialize_meeting(meeting: Meeting) -> MeetingResponse:
     )
 
 
+MEETING_SORT = (
+    SortKey("date", Meeting.date, descending=True, parse=parse_date),
+    SortKey("startTime", Meeting.start_time, descending=True, parse=parse_time),
+    SortKey("id", Meeting.id, descending=True, parse=parse_uuid),
+)
+
+
 @router.get("/teams/{team_id}/meetings", response_model=MeetingListResponse)
 async def list_team_meetings(
     team_id: UUID,
     status_filter: Optional[str] = Query(None, alias="status"),
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=PAGE_MAX_LIMIT),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_reader),
 ) -> MeetingListResponse:
     await ensure_team_member(db, team_id, current_user.id)
 
-    stmt = (
-        select(
-            Meeting,
-            func.count(ActionItem.id).label("action_items_count"),
-        )
-        .outerjoin(ActionItem, ActionItem.meeting_id == Meeting.id)
-        .where(Meeting.team_id == team_id)
-        .group_by(Meeting.id)
-        .order_by(Meeting.date.desc(), Meeting.start_time.desc())
-    )
+    stmt = select(Meeting).where(Meeting.team_id == team_id)
     if status_filter:
         stmt = stmt.where(Meeting.status == status_filter)
     else:
         stmt = stmt.where(Meeting.status != "scheduled")
+    page_size = page_limit(cursor, limit)
+    stmt = paginate(stmt, MEETING_SORT, cursor, page_size)
 
     res = await db.execute(stmt)
-    meetings = res.all()
+    meetings, following = next_cursor(
+        list(res.scalars().all()),
+        page_size,
+        lambda meeting: {"date": meeting.date, "startTime": meeting.start_time, "id": meeting.id},
+    )
 
     items: list[MeetingListItem] = []
-    for meeting, action_items_count in meetings:
+    for meeting in meetings:
         items.append(
             MeetingListItem(
                 id=meeting.id,
@@ -92,11 +106,11 @@ async def list_team_meetings(
                 duration=meeting.duration,
                 status=meeting.status,
                 summary=meeting.summary,
-                action_items_count=action_items_count or 0,
+                action_items_count=meeting.action_items_count,
             )
         )
 
-    return MeetingListResponse(meetings=items)
+    return MeetingListResponse(meetings=items, next_cursor=following)
 
 
 @router.post("/teams/{team_id}/meetings", response_model=MeetingEnvelope, status_code=status.HTTP_201_CREATED)
@@ -126,29 +140,27 @@ async def create_meeting(
     await db.commit()
     await db.refresh(meeting)
 
+    # Best effort: meeting creation must not fail because Redis is unavailable.
+    with contextlib.suppress(Exception):
+        await request_stt_prewarm(meeting.id)
+
     return MeetingEnvelope(meeting=serialize_meeting(meeting))
 
 
 @router.get("/meetings/{meeting_id}", response_model=MeetingDetailEnvelope)
 async def get_meeting(
     meeting_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_reader),
 ) -> MeetingDetailEnvelope:
-    meeting = await ensure_meeting_access(db, meeting_id, current_user.id)
-
-    stmt = (
-        select(Meeting)
-        .options(
-            selectinload(Meeting.transcripts),
-            selectinload(Meeting.action_items),
-            selectinload(Meeting.speaker_stats),
-            selectinload(Meeting.attendees),
-        )
-        .where(Meeting.id == meeting.id)
+    meeting = await ensure_meeting_access(
+        db,
+        meeting_id,
+        current_user.id,
+        selectinload(Meeting.action_items),
+        selectinload(Meeting.speaker_stats),
     )
-    res = await db.execute(stmt)
-    meeting = res.scalar_one()
+    segments = await load_transcript(db, meeting)
 
     transcripts = [
         TranscriptItem(
@@ -159,7 +171,7 @@ async def get_meeting(
             start_time=t.start_time,
             end_time=t.end_time,
         )
-        for t in sorted(meeting.transcripts, key=lambda item: item.created_at)
+        for t in segments
     ]
 
     action_items = [
@@ -236,43 +248,13 @@ async def update_meeting(
     await db.commit()
     await db.refresh(meeting)
 
-    # Auto-generate summary and action items on completion
+    # Summary and action items are generated by the AI worker on completion,
+    # which also bumps meetings.action_items_count in the same transaction.
+    ai_job_id: Optional[str] = None
     if previous_status != "completed" and meeting.status == "completed":
-        transcript_stmt = (
-            select(Transcript)
-            .where(Transcript.meeting_id == meeting.id)
-            .order_by(Transcript.created_at.asc())
-        )
-        res = await db.execute(transcript_stmt)
-        transcripts = res.scalars().all()
-
-        transcript_payload = [
-            {"speaker": t.speaker, "text": t.text, "timestamp": t.timestamp}
-            for t in transcripts
-        ]
-
-        if transcript_payload:
-            summary = await llm_service.summarize(transcript_payload)
-            meeting.summary = summary
-            db.add(meeting)
-            await db.commit()
-            await db.refresh(meeting)
-
-            suggestions = await llm_service.extract_action_items(transcript_payload)
-            if suggestions:
-                now = datetime.utcnow()
-                for suggestion in suggestions:
-                    action_item = ActionItem(
-                        meeting_id=meeting.id,
-                        type=suggestion.get("type") or "task",
-                        assignee=suggestion.get("assignee") or "Unassigned",
-                        content=suggestion.get("content") or "Action item",
-                        status="pending",
-                        due_date=None,
-                        created_at=now,
-                        updated_at=now,
-                    )
-                    db.add(action_item)
-                await db.commit()
+        try:
+            ai_job_id = await enqueue_job(JOB_MEETING_COMPLETION, meeting.id)
+        except Exception as exc:
+            logger.warning("Failed to enqueue completion job for meeting %s: %s", meeting.id, exc)
 
-    return MeetingEnvelope(meeting=serialize_meeting(meeting))
+    return MeetingEnvelope(meeting=serialize_meeting(meeting), ai_job_id=ai_job_id)
@@ -12,7 +12,9 @@ from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, st
 
 from ..db import AsyncSessionLocal
 from ..deps import authenticate_token, ensure_meeting_access
-from ..redis import get_redis, meeting_audio_key, meeting_channel, serialize_message
+from ..redis import get_redis, meeting_channel, request_stt_prewarm
+from ..services.audio_admission import admit_audio_chunk
+from ..services.rolling_summary import get_rolling_state, request_rolling_summary
 
 router = APIRouter(tags=["realtime"])
 
@@ -59,7 +61,6 @@ async def meeting_ws(websocket: WebSocket, meeting_id: UUID) -> None:
 
     redis = get_redis()
     channel = meeting_channel(meeting.id)
-    audio_key = meeting_audio_key(meeting.id)
     pubsub = redis.pubsub()
     await pubsub.subscribe(channel)
 
@@ -74,6 +75,9 @@ async def meeting_ws(websocket: WebSocket, meeting_id: UUID) -> None:
             },
         }
     )
+    if meeting.status == "in-progress":
+        with contextlib.suppress(Exception):
+            await request_stt_prewarm(meeting.id)
 
     try:
         while True:
@@ -91,8 +95,10 @@ async def meeting_ws(websocket: WebSocket, meeting_id: UUID) -> None:
                     )
                     continue
 
-                await redis.rpush(
-                    audio_key,
+                admission = await admit_audio_chunk(
+                    redis,
+                    meeting.id,
+                    user.id,
                     json.dumps(
                         {
                             "userId": str(user.id),
@@ -101,20 +107,52 @@ async def meeting_ws(websocket: WebSocket, meeting_id: UUID) -> None:
                         }
                     ),
                 )
+                if not admission.admitted:
+                    await websocket.send_json(
+                        {
+                            "type": "throttled",
+                            "data": {
+                                "reason": admission.reason,
+                                "retryAfterMs": admission.retry_after_ms,
+                            },
+                        }
+                    )
+                    continue
 
                 await websocket.send_json(
                     {
                         "type": "ack",
-                        "data": {"message": "audio_chunk queued"},
+                        "data": {
+                            "message": "audio_chunk queued",
+                            "shed": admission.dropped,
+                        },
                     }
                 )
             elif message_type == "summary_request":
-                summary_stub = {
-                    "summary": payload.get("prompt")
-                    or "Summary generation has been queued for this meeting.",
-                    "requestedAt": datetime.utcnow().isoformat(),
-                }
-                await redis.publish(channel, serialize_message("summary_update", summary_stub))
+                job_id = await request_rolling_summary(meeting_id)
+                state = await get_rolling_state(meeting_id)
+                if state.get("summary"):
+                    # Show the latest rolling summary right away; the fold result follows on the channel.
+                    await websocket.send_json(
+                        {
+                            "type": "summary_update",
+                            "data": {
+                                "meetingId": str(meeting_id),
+                                "summary": state["summary"],
+                                "rolling": True,
+                                "segments": int(state.get("segments") or 0),
+                            },
+                        }
+                    )
+                await websocket.send_json(
+                    {
+                        "type": "ack",
+                        "data": {
+                            "message": "summary_request queued" if job_id else "summary_request already pending",
+                            "jobId": job_id,
+                        },
+                    }
+                )
             elif message_type == "ping":
                 await websocket.send_json({"type": "pong"})
             else:
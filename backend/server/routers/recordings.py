@@ -2,12 +2,11 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from google.cloud import storage
-
 from ..config import STORAGE_BASE_URL, STORAGE_BUCKET
 from ..db import get_db
 from ..deps import ensure_meeting_access, get_current_user
@@ -17,6 +16,14 @@ from ..schemas import RecordingUploadResponse
 router = APIRouter(prefix="/api/meetings", tags=["recordings"])
 
 
+@lru_cache(maxsize=1)
+def get_storage_client():
+    """Import the Cloud Storage SDK and build its client on the first upload request."""
+    from google.cloud import storage
+
+    return storage.Client()
+
+
 @router.post("/{meeting_id}/recording", response_model=RecordingUploadResponse)
 async def request_recording_upload(
     meeting_id: uuid.UUID,
@@ -34,7 +41,7 @@ async def request_recording_upload(
     object_key = f"{meeting.id}/{uuid.uuid4()}.wav"
 
     try:
-        client = storage.Client()
+        client = get_storage_client()
         bucket = client.bucket(STORAGE_BUCKET)
         blob = bucket.blob(object_key)
         upload_url = blob.generate_signed_url(
@@ -1,16 +1,18 @@
 import uuid
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from ..config import PAGE_MAX_LIMIT
 from ..db import get_db
-from ..deps import get_current_user, ensure_team_member, ensure_team_owner
+from ..deps import ensure_team_member, ensure_team_owner, get_current_reader, get_current_user, get_read_db
 from ..models import Team, TeamMember, User
+from ..pagination import SortKey, next_cursor, page_limit, paginate, parse_datetime, parse_uuid
 from ..schemas import (
     TeamListResponse,
     TeamResponse,
@@ -32,8 +34,8 @@ def serialize_team(team: Team) -> TeamResponse:
 
 @router.get("", response_model=TeamListResponse)
 async def list_my_teams(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_reader),
 ) -> TeamListResponse:
     stmt = (
         select(Team)
@@ -81,17 +83,21 @@ async def create_team(
     return TeamEnvelope(team=serialize_team(team))
 
 
+MEMBER_SORT = (
+    SortKey("joinedAt", TeamMember.joined_at, parse=parse_datetime),
+    SortKey("id", TeamMember.id, parse=parse_uuid),
+)
+
+
 @router.get("/{team_id}", response_model=TeamDetailEnvelope)
 async def get_team(
     team_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=PAGE_MAX_LIMIT),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_reader),
 ) -> TeamDetailEnvelope:
-    stmt = (
-        select(Team)
-        .options(selectinload(Team.members).selectinload(TeamMember.user))
-        .where(Team.id == team_id)
-    )
+    stmt = select(Team).where(Team.id == team_id)
     res = await db.execute(stmt)
     team = res.scalar_one_or_none()
     if not team:
@@ -99,8 +105,20 @@ async def get_team(
 
     await ensure_team_member(db, team.id, current_user.id)
 
+    page_size = page_limit(cursor, limit)
+    member_stmt = paginate(
+        select(TeamMember).options(selectinload(TeamMember.user)).where(TeamMember.team_id == team.id),
+        MEMBER_SORT,
+        cursor,
+        page_size,
+    )
+    member_res = await db.execute(member_stmt)
+    page, following = next_cursor(
+        list(member_res.scalars().all()), page_size, lambda member: {"joinedAt": member.joined_at, "id": member.id}
+    )
+
     members: List[TeamMemberResponse] = []
-    for member in team.members:
+    for member in page:
         members.append(
             TeamMemberResponse(
                 id=member.user.id if member.user else member.id,
@@ -117,6 +135,7 @@ async def get_team(
             name=team.name,
             invite_code=team.invite_code,
             members=members,
+            next_cursor=following,
         )
     )
 
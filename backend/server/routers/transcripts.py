@@ -1,19 +1,41 @@
 import uuid
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..config import PAGE_MAX_LIMIT
 from ..db import get_db
-from ..deps import ensure_meeting_access, get_current_user
+from ..deps import ensure_meeting_access, ensure_team_member, get_current_reader, get_current_user, get_read_db
 from ..models import Transcript, User
-from ..schemas import TranscriptCreateRequest, TranscriptEnvelope, TranscriptListResponse, TranscriptItem
+from ..pagination import (
+    SortKey,
+    cursor_values,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+    page_limit,
+    paginate,
+    parse_datetime,
+    parse_uuid,
+)
+from ..schemas import (
+    TranscriptCreateRequest,
+    TranscriptEnvelope,
+    TranscriptItem,
+    TranscriptListResponse,
+    TranscriptSearchHit,
+    TranscriptSearchResponse,
+)
+from ..services.transcript_archive import merge_segments, read_archive
+from ..services.transcript_search import count_archived_meetings, search_transcripts
 
-router = APIRouter(prefix="/api/meetings", tags=["transcript"])
+router = APIRouter(prefix="/api", tags=["transcript"])
 
 
-@router.post("/{meeting_id}/transcript", response_model=TranscriptEnvelope, status_code=status.HTTP_201_CREATED)
+@router.post("/meetings/{meeting_id}/transcript", response_model=TranscriptEnvelope, status_code=status.HTTP_201_CREATED)
 async def add_transcript_segment(
     meeting_id: UUID,
     payload: TranscriptCreateRequest,
@@ -47,21 +69,37 @@ async def add_transcript_segment(
     )
 
 
-@router.get("/{meeting_id}/transcript", response_model=TranscriptListResponse)
+TRANSCRIPT_SORT = (
+    SortKey("createdAt", Transcript.created_at, parse=parse_datetime),
+    SortKey("id", Transcript.id, parse=parse_uuid),
+)
+
+
+@router.get("/meetings/{meeting_id}/transcript", response_model=TranscriptListResponse)
 async def get_transcript(
     meeting_id: UUID,
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None),
+    limit: Optional[int] = Query(None, ge=1, le=PAGE_MAX_LIMIT),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_reader),
 ) -> TranscriptListResponse:
-    await ensure_meeting_access(db, meeting_id, current_user.id)
+    meeting = await ensure_meeting_access(db, meeting_id, current_user.id)
 
-    stmt = (
-        select(Transcript)
-        .where(Transcript.meeting_id == meeting_id)
-        .order_by(Transcript.created_at.asc())
-    )
+    page_size = page_limit(cursor, limit)
+    stmt = paginate(select(Transcript).where(Transcript.meeting_id == meeting_id), TRANSCRIPT_SORT, cursor, page_size)
     res = await db.execute(stmt)
-    rows = res.scalars().all()
+    rows = list(res.scalars().all())
+    if meeting.transcript_archive:
+        after = cursor_values(TRANSCRIPT_SORT, cursor)
+        archived = await read_archive(
+            meeting,
+            after=(after["createdAt"], after["id"]) if after else None,
+            limit=page_size + 1 if page_size is not None else None,
+        )
+        rows = merge_segments(archived, rows)
+        if page_size is not None:
+            rows = rows[: page_size + 1]
+    rows, following = next_cursor(rows, page_size, lambda row: {"createdAt": row.created_at, "id": row.id})
 
     return TranscriptListResponse(
         transcript=[
@@ -74,5 +112,40 @@ async def get_transcript(
                 end_time=row.end_time,
             )
             for row in rows
-        ]
+        ],
+        next_cursor=following,
+    )
+
+
+@router.get("/teams/{team_id}/transcripts/search", response_model=TranscriptSearchResponse)
+async def search_team_transcripts(
+    team_id: UUID,
+    q: str = Query(..., min_length=1, max_length=200),
+    cursor: Optional[str] = Query(None),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_reader),
+) -> TranscriptSearchResponse:
+    await ensure_team_member(db, team_id, current_user.id)
+
+    after = decode_cursor(cursor) if cursor else None
+    hits, next_after = await search_transcripts(db, team_id, q.strip(), limit, after)
+
+    return TranscriptSearchResponse(
+        hits=[
+            TranscriptSearchHit(
+                id=hit.id,
+                meeting_id=hit.meeting_id,
+                meeting_title=hit.meeting_title,
+                meeting_date=hit.meeting_date,
+                speaker=hit.speaker,
+                text=hit.text,
+                highlight=hit.highlight,
+                timestamp=hit.timestamp,
+                score=hit.score,
+            )
+            for hit in hits
+        ],
+        next_cursor=encode_cursor(next_after) if next_after else None,
+        archived_meetings=await count_archived_meetings(db, team_id),
     )
@@ -27,7 +27,14 @@ from .meeting import (
     MeetingDetailEnvelope,
     MeetingUpdateRequest,
 )
-from .transcript import TranscriptCreateRequest, TranscriptItem, TranscriptListResponse, TranscriptEnvelope
+from .transcript import (
+    TranscriptCreateRequest,
+    TranscriptItem,
+    TranscriptListResponse,
+    TranscriptEnvelope,
+    TranscriptSearchHit,
+    TranscriptSearchResponse,
+)
 from .action_item import (
     ActionItemCreateRequest,
     ActionItemResponse,
@@ -53,5 +60,6 @@ from .ai import (
     ActionItemExtractionRequest,
     ActionItemExtractionResponse,
     ActionItemSuggestion,
+    AIJobResponse,
 )
 from .recording import RecordingUploadResponse
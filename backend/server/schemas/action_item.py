@@ -43,3 +43,4 @@ class ActionItemListItem(ActionItemResponse):
 
 class ActionItemListResponse(SchemaBase):
     action_items: List[ActionItemListItem] = Field(..., alias="actionItems")
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
@@ -17,17 +17,20 @@ class TranscriptChunk(SchemaBase):
 class SummarizeRequest(SchemaBase):
     meeting_id: Optional[UUID] = Field(None, alias="meetingId")
     transcript: Optional[List[TranscriptChunk]] = None
+    bypass_cache: bool = Field(False, alias="bypassCache")
 
 
 class SummarizeResponse(SchemaBase):
     meeting_id: Optional[UUID] = Field(None, alias="meetingId")
     summary: str
     source: str
+    cached: bool = False
 
 
 class ActionItemExtractionRequest(SchemaBase):
     meeting_id: Optional[UUID] = Field(None, alias="meetingId")
     transcript: Optional[List[TranscriptChunk]] = None
+    bypass_cache: bool = Field(False, alias="bypassCache")
 
 
 class ActionItemSuggestion(SchemaBase):
@@ -45,3 +48,14 @@ class ActionItemExtractionResponse(SchemaBase):
     meeting_id: Optional[UUID] = Field(None, alias="meetingId")
     action_items: List[ActionItemSuggestion] = Field(default_factory=list, alias="actionItems")
     persisted: bool = False
+    cached: bool = False
+
+
+class AIJobResponse(SchemaBase):
+    id: str
+    type: str
+    meeting_id: UUID = Field(..., alias="meetingId")
+    status: str
+    error: Optional[str] = None
+    created_at: Optional[str] = Field(None, alias="createdAt")
+    updated_at: Optional[str] = Field(None, alias="updatedAt")
@@ -40,6 +40,7 @@ class MeetingListItem(SchemaBase):
 
 class MeetingListResponse(SchemaBase):
     meetings: List[MeetingListItem]
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
 
 
 class MeetingResponse(SchemaBase):
@@ -57,6 +58,7 @@ class MeetingResponse(SchemaBase):
 
 class MeetingEnvelope(SchemaBase):
     meeting: MeetingResponse
+    ai_job_id: Optional[str] = Field(None, alias="aiJobId")
 
 
 class MeetingDetailResponse(SchemaBase):
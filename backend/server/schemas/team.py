@@ -37,6 +37,7 @@ class TeamDetailResponse(SchemaBase):
     name: str
     invite_code: str = Field(..., alias="inviteCode")
     members: List[TeamMemberResponse]
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
 
 
 class TeamUpdateRequest(SchemaBase):
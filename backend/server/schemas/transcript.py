@@ -1,3 +1,4 @@
+from datetime import date
 from typing import List, Optional
 from uuid import UUID
 
@@ -25,7 +26,27 @@ class TranscriptItem(SchemaBase):
 
 class TranscriptListResponse(SchemaBase):
     transcript: List[TranscriptItem]
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
 
 
 class TranscriptEnvelope(SchemaBase):
     transcript: TranscriptItem
+
+
+class TranscriptSearchHit(SchemaBase):
+    id: UUID
+    meeting_id: UUID = Field(..., alias="meetingId")
+    meeting_title: str = Field(..., alias="meetingTitle")
+    meeting_date: date = Field(..., alias="meetingDate")
+    speaker: str
+    text: str
+    highlight: str
+    timestamp: str
+    score: float
+
+
+class TranscriptSearchResponse(SchemaBase):
+    hits: List[TranscriptSearchHit]
+    next_cursor: Optional[str] = Field(None, alias="nextCursor")
+    # Meetings left out of the search because their transcript is archived.
+    archived_meetings: int = Field(0, alias="archivedMeetings")
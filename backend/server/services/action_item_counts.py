@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import ActionItem, Meeting
+
+
+async def adjust_action_items_count(session: AsyncSession, meeting_id: UUID, delta: int) -> None:
+    """Add ``delta`` to the meeting's counter in the caller's transaction.
+
+    Call this next to every insert or delete of action items so the counter
+    commits or rolls back with them.
+    """
+    if not delta:
+        return
+    await session.execute(
+        update(Meeting)
+        .where(Meeting.id == meeting_id)
+        .values(action_items_count=Meeting.action_items_count + delta)
+    )
+
+
+async def recount_action_items(session: AsyncSession, meeting_ids: Optional[Iterable[UUID]] = None) -> int:
+    """Recompute counters from ``action_items`` and return how many meetings were wrong."""
+    actual = (
+        select(func.count(ActionItem.id))
+        .where(ActionItem.meeting_id == Meeting.id)
+        .scalar_subquery()
+    )
+    stmt = update(Meeting).where(Meeting.action_items_count != actual).values(action_items_count=actual)
+    if meeting_ids is not None:
+        stmt = stmt.where(Meeting.id.in_(list(meeting_ids)))
+    result = await session.execute(stmt.execution_options(synchronize_session=False))
+    return result.rowcount or 0
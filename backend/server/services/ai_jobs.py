@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import json
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Optional
+from uuid import UUID
+
+from ..config import AI_JOB_MAX_ATTEMPTS, AI_JOB_TTL_SECONDS, AI_JOB_VISIBILITY_TIMEOUT_SECONDS
+from ..redis import ai_job_key, ai_job_processing_key, ai_job_queue_key, get_redis
+
+JOB_MEETING_COMPLETION = "meeting_completion"
+JOB_ROLLING_SUMMARY = "rolling_summary"
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+# KEYS = processing list, queue, job hash; ARGV = job payload, attempts, now.
+# Only the caller that removes the claim pushes the job back, so concurrent
+# reapers requeue it once and never touch a job another worker finished.
+_REQUEUE_LUA = """
+if redis.call('LREM', KEYS[1], 1, ARGV[1]) == 0 then
+  return 0
+end
+redis.call('RPUSH', KEYS[2], ARGV[1])
+redis.call('HSET', KEYS[3], 'status', 'queued', 'attempts', ARGV[2], 'updatedAt', ARGV[3])
+return 1
+"""
+
+_requeue_script = None
+
+
+def _get_script(client):
+    global _requeue_script
+    if _requeue_script is None or _requeue_script.registered_client is not client:
+        _requeue_script = client.register_script(_REQUEUE_LUA)
+    return _requeue_script
+
+
+async def enqueue_job(job_type: str, meeting_id: UUID, **extra: Any) -> str:
+    """Record a job's status hash and push it onto the AI worker queue."""
+    job_id = uuid.uuid4().hex
+    now = datetime.utcnow().isoformat()
+    redis = get_redis()
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.hset(
+            ai_job_key(job_id),
+            mapping={
+                "id": job_id,
+                "type": job_type,
+                "meetingId": str(meeting_id),
+                "status": STATUS_QUEUED,
+                "createdAt": now,
+                "updatedAt": now,
+            },
+        )
+        pipe.expire(ai_job_key(job_id), AI_JOB_TTL_SECONDS)
+        pipe.rpush(
+            ai_job_queue_key(),
+            json.dumps({"jobId": job_id, "type": job_type, "meetingId": str(meeting_id), **extra}),
+        )
+        await pipe.execute()
+    return job_id
+
+
+async def update_job(job_id: str, status: str, error: Optional[str] = None) -> None:
+    fields = {"status": status, "updatedAt": datetime.utcnow().isoformat()}
+    if error:
+        fields["error"] = error[:500]
+    redis = get_redis()
+    await redis.hset(ai_job_key(job_id), mapping=fields)
+    await redis.expire(ai_job_key(job_id), AI_JOB_TTL_SECONDS)
+
+
+async def get_job(job_id: str) -> Optional[dict[str, str]]:
+    redis = get_redis()
+    job = await redis.hgetall(ai_job_key(job_id))
+    return job or None
+
+
+async def claim_job(timeout: float) -> Optional[str]:
+    """Move the next queued job onto the processing list and return its payload.
+
+    The job stays there until ``ack_job``, so a job whose worker dies is
+    found by ``requeue_stale_jobs`` instead of being lost.
+    """
+    return await get_redis().blmove(ai_job_queue_key(), ai_job_processing_key(), timeout, "LEFT", "RIGHT")
+
+
+async def ack_job(raw: str) -> None:
+    await get_redis().lrem(ai_job_processing_key(), 1, raw)
+
+
+async def touch_job(job_id: str) -> None:
+    """Refresh ``updatedAt`` of a running job so it is not taken for abandoned."""
+    await get_redis().hset(ai_job_key(job_id), "updatedAt", datetime.utcnow().isoformat())
+
+
+async def requeue_stale_jobs() -> int:
+    """Put claimed jobs back on the queue once their worker stops updating them.
+
+    A claim is stale when the job's ``updatedAt`` is older than
+    ``AI_JOB_VISIBILITY_TIMEOUT_SECONDS``; after ``AI_JOB_MAX_ATTEMPTS`` stale
+    claims the job is marked failed instead. Returns the number requeued.
+    """
+    redis = get_redis()
+    deadline = datetime.utcnow() - timedelta(seconds=AI_JOB_VISIBILITY_TIMEOUT_SECONDS)
+    requeued = 0
+    for raw in await redis.lrange(ai_job_processing_key(), 0, -1):
+        try:
+            job_id = str(json.loads(raw)["jobId"])
+        except (ValueError, KeyError, TypeError):
+            await ack_job(raw)
+            continue
+        job = await get_job(job_id)
+        if job is None or job.get("status") in (STATUS_COMPLETED, STATUS_FAILED):
+            # Expired, or finished by a worker that died before acknowledging it.
+            await ack_job(raw)
+            continue
+        updated_at = job.get("updatedAt")
+        if updated_at and datetime.fromisoformat(updated_at) > deadline:
+            continue
+
+        attempts = int(job.get("attempts") or 0) + 1
+        if attempts >= AI_JOB_MAX_ATTEMPTS:
+            await update_job(job_id, STATUS_FAILED, error=f"Abandoned by the worker {attempts} times")
+            await ack_job(raw)
+            continue
+        requeued += await _get_script(redis)(
+            keys=[ai_job_processing_key(), ai_job_queue_key(), ai_job_key(job_id)],
+            args=[raw, attempts, datetime.utcnow().isoformat()],
+        )
+    return requeued
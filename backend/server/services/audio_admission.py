@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from uuid import UUID
+
+import redis.asyncio as redis
+
+from ..config import (
+    AUDIO_MEETING_BURST,
+    AUDIO_MEETING_RATE_PER_SEC,
+    AUDIO_QUEUE_MAX_LEN,
+    AUDIO_QUEUE_RETRY_AFTER_MS,
+    AUDIO_QUEUE_SHED_POLICY,
+    AUDIO_QUEUE_TTL_SECONDS,
+    AUDIO_USER_BURST,
+    AUDIO_USER_RATE_PER_SEC,
+)
+from ..redis import audio_rate_key, meeting_audio_key
+
+SHED_REJECT = "reject"
+SHED_DROP_OLDEST = "drop_oldest"
+
+# KEYS: user bucket, meeting bucket, audio queue
+# ARGV: user rate/s, user burst, meeting rate/s, meeting burst,
+#       max queue length, shed policy, queue ttl (s), queue retry-after (ms), payload
+# Returns {admitted, retry_after_ms, reason, dropped}
+_ADMIT_AUDIO_LUA = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + math.floor(tonumber(now_parts[2]) / 1000)
+
+local function refill(key, rate, burst)
+  local state = redis.call('HMGET', key, 'tokens', 'ts')
+  local tokens = tonumber(state[1])
+  local ts = tonumber(state[2])
+  if tokens == nil or ts == nil then
+    return burst
+  end
+  local elapsed = math.max(0, now - ts)
+  return math.min(burst, tokens + elapsed * rate / 1000)
+end
+
+local function retry_after(tokens, rate)
+  if rate <= 0 then
+    return -1
+  end
+  return math.ceil((1 - tokens) * 1000 / rate)
+end
+
+local user_rate = tonumber(ARGV[1])
+local user_burst = tonumber(ARGV[2])
+local meeting_rate = tonumber(ARGV[3])
+local meeting_burst = tonumber(ARGV[4])
+local max_len = tonumber(ARGV[5])
+local policy = ARGV[6]
+local queue_ttl = tonumber(ARGV[7])
+local queue_retry_ms = tonumber(ARGV[8])
+
+local user_tokens = refill(KEYS[1], user_rate, user_burst)
+if user_tokens < 1 then
+  return {0, retry_after(user_tokens, user_rate), 'user_rate', 0}
+end
+local meeting_tokens = refill(KEYS[2], meeting_rate, meeting_burst)
+if meeting_tokens < 1 then
+  return {0, retry_after(meeting_tokens, meeting_rate), 'meeting_rate', 0}
+end
+
+local dropped = 0
+if max_len > 0 then
+  local length = redis.call('LLEN', KEYS[3])
+  if length >= max_len then
+    if policy ~= 'drop_oldest' then
+      return {0, queue_retry_ms, 'queue_full', 0}
+    end
+    dropped = length - max_len + 1
+    redis.call('LTRIM', KEYS[3], dropped, -1)
+  end
+end
+
+local function store(key, tokens, rate, burst)
+  redis.call('HSET', key, 'tokens', tokens, 'ts', now)
+  local ttl = 60000
+  if rate > 0 then
+    ttl = math.ceil(burst * 1000 / rate) * 2
+  end
+  redis.call('PEXPIRE', key, ttl)
+end
+
+store(KEYS[1], user_tokens - 1, user_rate, user_burst)
+store(KEYS[2], meeting_tokens - 1, meeting_rate, meeting_burst)
+
+redis.call('RPUSH', KEYS[3], ARGV[9])
+if queue_ttl > 0 then
+  redis.call('EXPIRE', KEYS[3], queue_ttl)
+end
+
+if dropped > 0 then
+  return {1, 0, 'shed_oldest', dropped}
+end
+return {1, 0, 'ok', 0}
+"""
+
+
+@dataclass
+class AdmissionResult:
+    admitted: bool
+    retry_after_ms: int
+    reason: str
+    dropped: int = 0
+
+
+_admit_script = None
+
+
+def _get_script(client: redis.Redis):
+    global _admit_script
+    if _admit_script is None or _admit_script.registered_client is not client:
+        _admit_script = client.register_script(_ADMIT_AUDIO_LUA)
+    return _admit_script
+
+
+async def admit_audio_chunk(
+    client: redis.Redis,
+    meeting_id: UUID,
+    user_id: UUID,
+    payload: str,
+) -> AdmissionResult:
+    """Rate-limit and enqueue an audio chunk in a single atomic Redis call.
+
+    Per-user and per-meeting token buckets must both have a token available.
+    When the meeting queue is at ``AUDIO_QUEUE_MAX_LEN`` the shed policy
+    decides between rejecting the new chunk and dropping the oldest ones.
+    Every accepted push refreshes the queue TTL so orphaned queues expire.
+    """
+    policy = SHED_DROP_OLDEST if AUDIO_QUEUE_SHED_POLICY == SHED_DROP_OLDEST else SHED_REJECT
+    script = _get_script(client)
+    admitted, retry_after_ms, reason, dropped = await script(
+        keys=[
+            audio_rate_key("user", user_id),
+            audio_rate_key("meeting", meeting_id),
+            meeting_audio_key(meeting_id),
+        ],
+        args=[
+            AUDIO_USER_RATE_PER_SEC,
+            AUDIO_USER_BURST,
+            AUDIO_MEETING_RATE_PER_SEC,
+            AUDIO_MEETING_BURST,
+            AUDIO_QUEUE_MAX_LEN,
+            policy,
+            AUDIO_QUEUE_TTL_SECONDS,
+            AUDIO_QUEUE_RETRY_AFTER_MS,
+            payload,
+        ],
+    )
+    return AdmissionResult(
+        admitted=bool(int(admitted)),
+        retry_after_ms=int(retry_after_ms),
+        reason=str(reason),
+        dropped=int(dropped),
+    )
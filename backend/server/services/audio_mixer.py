@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import numpy as np
+
+
+@dataclass
+class MixedFrame:
+    audio: bytes
+    speaker_id: Optional[str]
+    energy: dict[str, float]
+    meta: dict[str, Any]
+
+
+@dataclass
+class _Track:
+    start: int
+    data: "np.ndarray"
+    meta: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def end(self) -> int:
+        return self.start + int(self.data.size)
+
+
+class AudioMixer:
+    """Mix participants' PCM into one timestamp-aligned stream per meeting.
+
+    Chunks are positioned on a shared sample clock by their arrival time,
+    snapped to the end of the participant's previous chunk when they are
+    contiguous. Frames are only emitted once they are older than the jitter
+    window, so chunks from other participants that arrive slightly later can
+    still be summed into the same frame. Per-participant RMS is kept for
+    every frame to attribute the mixed audio to a speaker. With
+    ``silence_rms`` set, mixed frames quieter than that int16 RMS are treated
+    like gaps, so quiet participants still count towards the mix.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        jitter_seconds: float = 0.2,
+        frame_seconds: float = 0.1,
+        snap_seconds: float = 0.3,
+        silence_fill_seconds: float = 1.0,
+        silence_rms: float = 0.0,
+    ) -> None:
+        self.sample_rate = sample_rate
+        self.jitter_samples = int(sample_rate * jitter_seconds)
+        self.frame_samples = max(1, int(sample_rate * frame_seconds))
+        self.snap_samples = int(sample_rate * snap_seconds)
+        self.silence_fill_samples = int(sample_rate * silence_fill_seconds)
+        self.silence_rms = silence_rms / 32768.0
+        self._tracks: dict[str, _Track] = {}
+        self._cursor: Optional[int] = None
+        self._last_voiced_end: Optional[int] = None
+
+    def _to_samples(self, seconds: float) -> int:
+        return int(round(seconds * self.sample_rate))
+
+    def push(
+        self,
+        participant_id: str,
+        pcm: bytes,
+        arrival: float,
+        meta: Optional[dict[str, Any]] = None,
+    ) -> None:
+        """Buffer a little-endian int16 chunk that finished arriving at ``arrival`` (epoch seconds)."""
+        if len(pcm) % 2:
+            pcm = pcm[:-1]
+        samples = np.frombuffer(pcm, dtype="<i2").astype(np.float32) / 32768.0
+        if samples.size == 0:
+            return
+
+        start = self._to_samples(arrival) - int(samples.size)
+        track = self._tracks.get(participant_id)
+        if track is not None and abs(start - track.end) <= self.snap_samples:
+            start = track.end
+        if self._cursor is not None and start < self._cursor:
+            # Late chunk: shift it to the mixing cursor rather than dropping audio.
+            start = self._cursor
+
+        if track is None or track.data.size == 0:
+            self._tracks[participant_id] = _Track(start=start, data=samples, meta=dict(meta or {}))
+            return
+
+        if start < track.end:
+            start = track.end
+        gap = start - track.end
+        parts = [track.data]
+        if gap > 0:
+            parts.append(np.zeros(gap, dtype=np.float32))
+        parts.append(samples)
+        track.data = np.concatenate(parts)
+        if meta:
+            track.meta = dict(meta)
+
+    def pop_ready(self, now: float) -> list[MixedFrame]:
+        """Return mixed frames that are older than the jitter window at ``now``."""
+        return self._emit(self._to_samples(now) - self.jitter_samples)
+
+    def flush(self) -> list[MixedFrame]:
+        """Mix everything that is buffered, ignoring the jitter window."""
+        live = [track for track in self._tracks.values() if track.data.size]
+        if not live:
+            return []
+        cursor = self._cursor if self._cursor is not None else min(t.start for t in live)
+        remainder = (max(t.end for t in live) - cursor) % self.frame_samples
+        ready_until = max(t.end for t in live)
+        if remainder:
+            ready_until += self.frame_samples - remainder
+        return self._emit(ready_until)
+
+    def _emit(self, ready_until: int) -> list[MixedFrame]:
+        frames: list[MixedFrame] = []
+        if self._cursor is None:
+            starts = [t.start for t in self._tracks.values() if t.data.size]
+            if not starts:
+                return frames
+            self._cursor = min(starts)
+
+        while self._cursor + self.frame_samples <= ready_until:
+            frame_start = self._cursor
+            frame_end = frame_start + self.frame_samples
+            covering = {
+                participant_id: track
+                for participant_id, track in self._tracks.items()
+                if track.data.size and track.start < frame_end and track.end > frame_start
+            }
+            if not covering:
+                upcoming = [t.start for t in self._tracks.values() if t.data.size and t.end > frame_start]
+                if not upcoming and not self._fills_pause(frame_start):
+                    break
+                frames.extend(self._skip_frame(frame_start, upcoming))
+                continue
+
+            mix = np.zeros(self.frame_samples, dtype=np.float32)
+            energy: dict[str, float] = {}
+            for participant_id, track in covering.items():
+                lo = max(frame_start, track.start)
+                hi = min(frame_end, track.end)
+                segment = track.data[lo - track.start : hi - track.start]
+                mix[lo - frame_start : hi - frame_start] += segment
+                energy[participant_id] = float(np.sqrt(np.mean(np.square(segment))))
+
+            if self.silence_rms and float(np.sqrt(np.mean(np.square(mix)))) < self.silence_rms:
+                frames.extend(self._skip_frame(frame_start, [frame_end]))
+                continue
+
+            peak = float(np.max(np.abs(mix)))
+            if peak > 1.0:
+                mix /= peak
+            speaker_id = max(energy, key=energy.get)
+            frames.append(
+                MixedFrame(
+                    audio=(mix * 32767.0).astype("<i2").tobytes(),
+                    speaker_id=speaker_id,
+                    energy=energy,
+                    meta=dict(covering[speaker_id].meta),
+                )
+            )
+            self._cursor = frame_end
+            self._last_voiced_end = frame_end
+
+        self._trim()
+        return frames
+
+    def _fills_pause(self, frame_start: int) -> bool:
+        return self._last_voiced_end is not None and frame_start - self._last_voiced_end < self.silence_fill_samples
+
+    def _skip_frame(self, frame_start: int, upcoming: list[int]) -> list[MixedFrame]:
+        """Advance past a frame without voice, sending it as silence during short pauses."""
+        if self._fills_pause(frame_start):
+            # Short pauses are sent as silence so the recognizer can endpoint.
+            self._cursor = frame_start + self.frame_samples
+            return [MixedFrame(audio=bytes(self.frame_samples * 2), speaker_id=None, energy={}, meta={})]
+        # Long pause: jump to the next buffered audio on a frame boundary.
+        skip = (min(upcoming) - frame_start) // self.frame_samples
+        self._cursor = frame_start + max(1, skip) * self.frame_samples
+        return []
+
+    def _trim(self) -> None:
+        if self._cursor is None:
+            return
+        for participant_id in list(self._tracks):
+            track = self._tracks[participant_id]
+            if track.end <= self._cursor:
+                track.data = track.data[:0]
+                track.start = self._cursor
+                continue
+            if track.start < self._cursor:
+                track.data = track.data[self._cursor - track.start :]
+                track.start = self._cursor
+
+    def is_empty(self) -> bool:
+        return all(track.data.size == 0 for track in self._tracks.values())
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Iterable, Optional, TypeVar
+from uuid import UUID
+
+from sqlalchemy import delete, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import SpeakerStatistic, utcnow
+
+ModelT = TypeVar("ModelT")
+
+SPEAKER_STAT_FIELDS = ("speak_time", "speak_count", "participation_rate", "avg_length")
+
+
+def _dialect_insert(session: AsyncSession):
+    """Return the dialect's ``insert`` construct when it supports ``ON CONFLICT``."""
+    name = session.get_bind().dialect.name
+    if name == "postgresql":
+        return postgresql.insert
+    if name == "sqlite":
+        return sqlite.insert
+    return None
+
+
+async def bulk_insert_returning(
+    session: AsyncSession, model: type[ModelT], rows: list[dict[str, Any]]
+) -> list[ModelT]:
+    """Insert ``rows`` with one multi-row ``INSERT ... RETURNING`` and return ORM objects.
+
+    Rows come back in input order. The caller owns the transaction.
+    """
+    if not rows:
+        return []
+    result = await session.scalars(insert(model).returning(model, sort_by_parameter_order=True), rows)
+    return list(result.all())
+
+
+def action_item_row(
+    meeting_id: UUID,
+    suggestion: dict[str, Any],
+    now: datetime,
+    due_date: Optional[date] = None,
+) -> dict[str, Any]:
+    """Column values for a pending action item built from an AI suggestion."""
+    return {
+        "meeting_id": meeting_id,
+        "type": suggestion.get("type") or "task",
+        "assignee": suggestion.get("assignee") or "Unassigned",
+        "content": suggestion.get("content") or "Action item",
+        "status": "pending",
+        "due_date": due_date,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+async def replace_speaker_stats(
+    session: AsyncSession, meeting_id: UUID, stats: Iterable[dict[str, Any]]
+) -> list[SpeakerStatistic]:
+    """Make ``stats`` the meeting's full set of speaker statistics.
+
+    Speakers missing from ``stats`` are deleted and the rest are upserted on
+    ``uq_meeting_speaker_stat`` so existing rows keep their ids. Returns the
+    rows in input order; a repeated speaker keeps its last values.
+    """
+    by_speaker: dict[str, dict[str, Any]] = {}
+    for stat in stats:
+        by_speaker[stat["speaker"]] = stat
+    speakers = list(by_speaker)
+
+    cleanup = delete(SpeakerStatistic).where(SpeakerStatistic.meeting_id == meeting_id)
+    if speakers:
+        cleanup = cleanup.where(SpeakerStatistic.speaker.not_in(speakers))
+    await session.execute(cleanup)
+    if not speakers:
+        return []
+
+    now = utcnow()
+    rows = [
+        {
+            "meeting_id": meeting_id,
+            "speaker": speaker,
+            **{field: by_speaker[speaker].get(field) for field in SPEAKER_STAT_FIELDS},
+            "created_at": now,
+            "updated_at": now,
+        }
+        for speaker in speakers
+    ]
+
+    dialect_insert = _dialect_insert(session)
+    if dialect_insert is not None:
+        stmt = dialect_insert(SpeakerStatistic).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SpeakerStatistic.meeting_id, SpeakerStatistic.speaker],
+            set_={
+                **{field: getattr(stmt.excluded, field) for field in SPEAKER_STAT_FIELDS},
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ).returning(SpeakerStatistic)
+        result = await session.scalars(stmt, execution_options={"populate_existing": True})
+        saved = list(result.all())
+    else:
+        await session.execute(
+            delete(SpeakerStatistic).where(SpeakerStatistic.meeting_id == meeting_id)
+        )
+        saved = await bulk_insert_returning(session, SpeakerStatistic, rows)
+
+    order = {speaker: index for index, speaker in enumerate(speakers)}
+    return sorted(saved, key=lambda stat: order[stat.speaker])
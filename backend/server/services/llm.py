@@ -1,31 +1,118 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import importlib.util
 import json
-from typing import Any, List, Optional, cast
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, List, Optional, cast
 
 try:
     import httpx
 except ImportError:
     httpx = cast(Any, None)
 
-try:
-    from langchain_core.prompts import ChatPromptTemplate
-    from langchain_core.output_parsers import StrOutputParser
-    from langchain_google_genai import ChatGoogleGenerativeAI
-
-    LANGCHAIN_AVAILABLE = True
-except ImportError:
-    LANGCHAIN_AVAILABLE = False
-
-from ..config import AI_PREFERRED_MODEL, GEMINI_API_KEY
+from .. import metrics
+from ..config import (
+    AI_PREFERRED_MODEL,
+    AI_PROMPT_MAX_TOKENS,
+    AI_SUMMARY_MAX_CONCURRENCY,
+    AI_SUMMARY_WINDOW_TOKENS,
+    AI_WINDOW_CACHE_SIZE,
+    GEMINI_API_BASE,
+    GEMINI_API_KEY,
+    LLM_HTTP_CONNECT_TIMEOUT,
+    LLM_HTTP_KEEPALIVE_EXPIRY,
+    LLM_HTTP_MAX_CONNECTIONS,
+    LLM_HTTP_MAX_KEEPALIVE,
+    LLM_HTTP_POOL_TIMEOUT,
+    LLM_HTTP_READ_TIMEOUT,
+    LLM_HTTP_WRITE_TIMEOUT,
+)
+from .llm_guard import LLMUnavailableError, is_retryable, llm_guard
+from .transcript_compaction import compact_transcript, estimate_tokens, format_segments, split_segment
+
+logger = logging.getLogger(__name__)
 
 TranscriptPayload = List[dict[str, str]]
 
+# Bump when prompt wording changes so cached results are not reused.
+PROMPT_VERSION = "v2"
+
+llm_fallbacks = metrics.counter(
+    "llm_fallbacks_total",
+    "Heuristic results served because the LLM provider was unavailable, by kind",
+)
+completion_latency = metrics.histogram(
+    "llm_completion_latency_seconds",
+    "Latency of producing summary and action items for one transcript, by mode",
+)
+summary_ttft = metrics.histogram(
+    "llm_summary_time_to_first_token_seconds",
+    "Time from a streaming summary request to its first text chunk",
+)
+combined_fallbacks = metrics.counter(
+    "llm_combined_fallbacks_total",
+    "Combined completions that failed to parse and fell back to two calls",
+)
+combined_prompt_tokens = metrics.counter(
+    "llm_combined_prompt_tokens_total",
+    "Estimated input tokens sent by combined summary + action-item prompts",
+)
+combined_tokens_saved = metrics.counter(
+    "llm_combined_tokens_saved_total",
+    "Estimated input tokens saved by the combined prompt versus two separate prompts",
+)
+
+
+def langchain_available() -> bool:
+    """Check for LangChain without importing it; the import itself happens in ``_init_langchain_chains``."""
+    return all(
+        importlib.util.find_spec(name) is not None
+        for name in ("langchain_core", "langchain_google_genai")
+    )
+
 
 class LLMNotConfiguredError(RuntimeError):
     ...
 
 
+_http_client: Optional["httpx.AsyncClient"] = None
+
+
+def get_http_client() -> "httpx.AsyncClient":
+    """Return the process-wide pooled client used for LLM HTTP calls."""
+    global _http_client
+    if httpx is None:
+        raise RuntimeError("httpx is required for Gemini calls. Install httpx>=0.25.")
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            base_url=GEMINI_API_BASE,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=LLM_HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=LLM_HTTP_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                connect=LLM_HTTP_CONNECT_TIMEOUT,
+                read=LLM_HTTP_READ_TIMEOUT,
+                write=LLM_HTTP_WRITE_TIMEOUT,
+                pool=LLM_HTTP_POOL_TIMEOUT,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 class LLMService:
     def __init__(self) -> None:
         self.provider: Optional[str] = None
@@ -37,26 +124,51 @@ class LLMService:
             self.api_key = None
 
         self.use_langchain = False
+        self.llm = None
         self.summary_chain = None
         self.action_chain = None
+        self.window_tokens = AI_SUMMARY_WINDOW_TOKENS
+        self.max_concurrency = AI_SUMMARY_MAX_CONCURRENCY
+        self._window_cache: OrderedDict[str, str] = OrderedDict()
 
-        if LANGCHAIN_AVAILABLE and self.provider and self.api_key:
+        if self.provider and self.api_key and langchain_available():
             try:
                 self._init_langchain_chains()
                 self.use_langchain = True
             except Exception:
                 self.use_langchain = False
 
-    async def summarize(self, transcript: TranscriptPayload) -> str:
+    async def summarize(self, transcript: TranscriptPayload, fallback: bool = True) -> str:
+        """Summarize a transcript.
+
+        When the provider is unavailable the heuristic summary is returned, or
+        ``LLMUnavailableError`` is raised if ``fallback`` is false so callers
+        such as the result cache can avoid storing degraded output.
+        """
         if not transcript:
             return "현재까지 기록된 발화가 없습니다."
+        try:
+            return await self._summarize(transcript)
+        except LLMUnavailableError as exc:
+            if not fallback:
+                raise
+            logger.warning("LLM unavailable, using heuristic summary: %s", exc)
+            llm_fallbacks.inc(kind="summary")
+            return self._fallback_summary(transcript)
+
+    async def _summarize(self, transcript: TranscriptPayload) -> str:
+        transcript = self._compact(transcript, kind="summary")
+        if self.provider and estimate_tokens(self._build_summary_prompt(transcript)) > self.window_tokens:
+            return await self._map_reduce_summary(transcript)
 
         if self.use_langchain and self.summary_chain is not None:
             formatted = self._format_transcript(transcript)
             try:
-                return await self.summary_chain.ainvoke({"transcript": formatted})
-            except Exception:
-                pass
+                return await llm_guard.call(lambda: self.summary_chain.ainvoke({"transcript": formatted}))
+            except LLMUnavailableError:
+                raise
+            except Exception as exc:
+                logger.warning("LangChain summary failed, calling Gemini directly: %s", exc)
 
         prompt = self._build_summary_prompt(transcript)
 
@@ -65,19 +177,59 @@ class LLMService:
 
         return self._fallback_summary(transcript)
 
-    async def extract_action_items(self, transcript: TranscriptPayload) -> list[dict[str, Any]]:
+    async def extract_action_items(
+        self, transcript: TranscriptPayload, fallback: bool = True
+    ) -> list[dict[str, Any]]:
         if not transcript:
             return []
+        try:
+            return await self._extract_action_items(transcript)
+        except LLMUnavailableError as exc:
+            if not fallback:
+                raise
+            logger.warning("LLM unavailable, using heuristic action items: %s", exc)
+            llm_fallbacks.inc(kind="action_items")
+            return self._fallback_actions(transcript)
 
+    async def _extract_action_items(self, transcript: TranscriptPayload) -> list[dict[str, Any]]:
+        transcript = self._compact(transcript, kind="action_items")
+        if not self.provider:
+            return self._fallback_actions(transcript)
+
+        budget = AI_PROMPT_MAX_TOKENS - estimate_tokens(self._build_action_item_prompt([]))
+        windows = self._split_windows(transcript, max(1, budget))
+        if len(windows) == 1:
+            return await self._extract_window(windows[0])
+
+        # Long meetings are extracted window by window so early items are not cut off.
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def run(window: TranscriptPayload) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self._extract_window(window)
+
+        results = await asyncio.gather(*(run(window) for window in windows))
+        seen: set[tuple[str, str]] = set()
+        merged: list[dict[str, Any]] = []
+        for item in (item for result in results for item in result):
+            key = (str(item.get("assignee") or "").strip(), " ".join(str(item.get("content") or "").split()))
+            if key not in seen:
+                seen.add(key)
+                merged.append(item)
+        return merged
+
+    async def _extract_window(self, transcript: TranscriptPayload) -> list[dict[str, Any]]:
         if self.use_langchain and self.action_chain is not None:
             formatted = self._format_transcript(transcript)
             try:
-                response = await self.action_chain.ainvoke({"transcript": formatted})
+                response = await llm_guard.call(lambda: self.action_chain.ainvoke({"transcript": formatted}))
                 parsed = self._try_parse_action_json(response)
                 if parsed is not None:
                     return parsed
-            except Exception:
-                pass
+            except LLMUnavailableError:
+                raise
+            except Exception as exc:
+                logger.warning("LangChain action-item extraction failed, calling Gemini directly: %s", exc)
 
         prompt = self._build_action_item_prompt(transcript)
 
@@ -90,10 +242,297 @@ class LLMService:
 
         return self._fallback_actions(transcript)
 
+    async def summarize_and_extract(
+        self, transcript: TranscriptPayload, fallback: bool = True
+    ) -> tuple[str, list[dict[str, Any]]]:
+        """Produce the summary and action items with a single LLM call.
+
+        Falls back to the two-call path when the transcript needs map-reduce
+        summarization or when the combined output cannot be parsed.
+        """
+        if not transcript:
+            return await self.summarize(transcript, fallback=fallback), []
+
+        started = time.perf_counter()
+        compacted = self._compact(transcript, kind="combined")
+        combined_prompt = self._build_combined_prompt(compacted)
+        if self.provider and estimate_tokens(combined_prompt) <= self.window_tokens:
+            try:
+                parsed = self._try_parse_combined_json(
+                    await self._complete(combined_prompt, temperature=0.2)
+                )
+            except LLMUnavailableError:
+                if not fallback:
+                    raise
+                parsed = None
+            except Exception as exc:
+                logger.warning("Combined completion failed, using separate prompts: %s", exc)
+                parsed = None
+            if parsed is not None:
+                split_tokens = estimate_tokens(self._build_summary_prompt(compacted)) + estimate_tokens(
+                    self._build_action_item_prompt(compacted)
+                )
+                combined_tokens = estimate_tokens(combined_prompt)
+                combined_prompt_tokens.inc(combined_tokens)
+                combined_tokens_saved.inc(max(0, split_tokens - combined_tokens))
+                completion_latency.observe(time.perf_counter() - started, mode="combined")
+                return parsed
+            combined_fallbacks.inc()
+
+        summary, actions = await asyncio.gather(
+            self.summarize(transcript, fallback=fallback),
+            self.extract_action_items(transcript, fallback=fallback),
+        )
+        completion_latency.observe(time.perf_counter() - started, mode="split")
+        return summary, actions
+
+    async def fold_summary(
+        self, previous_summary: str, new_segments: TranscriptPayload, fallback: bool = True
+    ) -> str:
+        """Update a running summary with only the segments added since it was made.
+
+        Without a provider, or while it is unavailable, the previous summary is
+        kept; with ``fallback`` false ``LLMUnavailableError`` is raised instead.
+        """
+        if not previous_summary:
+            return await self.summarize(new_segments, fallback=fallback)
+        if not new_segments:
+            return previous_summary
+        if not self.provider:
+            return previous_summary
+        try:
+            return await self._fold_summary(previous_summary, new_segments)
+        except LLMUnavailableError as exc:
+            if not fallback:
+                raise
+            logger.warning("LLM unavailable, keeping the previous rolling summary: %s", exc)
+            llm_fallbacks.inc(kind="rolling")
+            return previous_summary
+
+    async def _fold_summary(self, previous_summary: str, new_segments: TranscriptPayload) -> str:
+        new_segments = self._compact(new_segments, kind="rolling")
+        formatted = self._format_transcript(new_segments)
+        if estimate_tokens(self._build_fold_prompt(previous_summary, formatted)) > self.window_tokens:
+            # Condense a large backlog first so the fold prompt stays within one window.
+            formatted = await self._map_reduce_summary(new_segments)
+        return await self._complete(self._build_fold_prompt(previous_summary, formatted), temperature=0.3)
+
+    async def stream_summary(self, transcript: TranscriptPayload) -> AsyncIterator[str]:
+        """Yield the summary as text chunks while the model generates it.
+
+        Long transcripts summarize their windows first and stream only the
+        final reduce step; without a provider the heuristic summary is yielded
+        as a single chunk.
+        """
+        started = time.perf_counter()
+        first = True
+        async for chunk in self._stream_summary_chunks(transcript):
+            if not chunk:
+                continue
+            if first:
+                summary_ttft.observe(time.perf_counter() - started)
+                first = False
+            yield chunk
+
+    async def _stream_summary_chunks(self, transcript: TranscriptPayload) -> AsyncIterator[str]:
+        if not transcript:
+            yield "현재까지 기록된 발화가 없습니다."
+            return
+
+        transcript = self._compact(transcript, kind="summary")
+        if not self.provider:
+            yield self._fallback_summary(transcript)
+            return
+
+        if estimate_tokens(self._build_summary_prompt(transcript)) > self.window_tokens:
+            windows = self._split_windows(transcript, self._window_budget())
+            semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+            async def run(window: TranscriptPayload) -> str:
+                async with semaphore:
+                    return await self._summarize_window(window)
+
+            partials = list(await asyncio.gather(*(run(window) for window in windows)))
+            if len(partials) == 1:
+                yield partials[0]
+                return
+            reduce_prompt = self._build_reduce_prompt(partials)
+            if estimate_tokens(reduce_prompt) > self.window_tokens:
+                yield await self._reduce_summaries(partials)
+                return
+            async for chunk in self._stream_complete(reduce_prompt, temperature=0.3):
+                yield chunk
+            return
+
+        if self.use_langchain and self.summary_chain is not None:
+            emitted = False
+            try:
+                async for chunk in self._guarded_stream(
+                    self.summary_chain.astream({"transcript": self._format_transcript(transcript)})
+                ):
+                    emitted = True
+                    yield chunk
+                return
+            except LLMUnavailableError:
+                raise
+            except Exception as exc:
+                if emitted:
+                    raise
+                logger.warning("LangChain summary stream failed, calling Gemini directly: %s", exc)
+
+        async for chunk in self._stream_complete(self._build_summary_prompt(transcript), temperature=0.3):
+            yield chunk
+
+    async def _stream_complete(self, prompt: str, temperature: float = 0.2) -> AsyncIterator[str]:
+        if self.use_langchain and self.llm is not None:
+            emitted = False
+            try:
+                async for message in self._guarded_stream(self.llm.astream(prompt)):
+                    content = getattr(message, "content", message)
+                    if isinstance(content, str) and content:
+                        emitted = True
+                        yield content
+                if emitted:
+                    return
+            except LLMUnavailableError:
+                raise
+            except Exception as exc:
+                if emitted:
+                    raise
+                logger.warning("LangChain stream failed, calling Gemini directly: %s", exc)
+        if self.provider == "gemini":
+            async for chunk in self._guarded_stream(self._stream_gemini(prompt, temperature=temperature)):
+                yield chunk
+            return
+        raise LLMNotConfiguredError("LLM provider is not configured")
+
+    @staticmethod
+    async def _guarded_stream(source: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        """Stream under the LLM guard; streams are not retried once started."""
+        async with llm_guard.slot():
+            try:
+                async for item in source:
+                    yield item
+            except Exception as exc:
+                if is_retryable(exc):
+                    llm_guard.breaker.record_failure()
+                    raise LLMUnavailableError(f"Streaming completion failed: {exc}") from exc
+                llm_guard.breaker.release()
+                raise
+            except BaseException:
+                llm_guard.breaker.release()
+                raise
+            llm_guard.breaker.record_success()
+
+    async def _map_reduce_summary(self, transcript: TranscriptPayload) -> str:
+        """Summarize token-budgeted windows concurrently, then reduce them.
+
+        Windows are cut greedily from the start of the meeting, so appending
+        segments only changes the last window and earlier window summaries
+        come from the content-hash cache.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def run(window: TranscriptPayload) -> str:
+            async with semaphore:
+                return await self._summarize_window(window)
+
+        windows = self._split_windows(transcript, self._window_budget())
+        partials = list(await asyncio.gather(*(run(window) for window in windows)))
+        return await self._reduce_summaries(partials)
+
+    async def _summarize_window(self, window: TranscriptPayload) -> str:
+        formatted = self._format_transcript(window)
+        key = self._cache_key("window", formatted)
+        cached = self._window_cache.get(key)
+        if cached is not None:
+            self._window_cache.move_to_end(key)
+            return cached
+
+        summary = await self._complete(self._build_window_prompt(formatted), temperature=0.2)
+        self._window_cache[key] = summary
+        while len(self._window_cache) > AI_WINDOW_CACHE_SIZE:
+            self._window_cache.popitem(last=False)
+        return summary
+
+    async def _reduce_summaries(self, partials: list[str]) -> str:
+        if len(partials) == 1:
+            return partials[0]
+        # Reduce hierarchically when the partial summaries do not fit one prompt.
+        budget = self.window_tokens - estimate_tokens(self._build_reduce_prompt([]))
+        groups: list[list[str]] = [[]]
+        used = 0
+        for partial in partials:
+            # Each partial goes out under a "[구간 n]" header.
+            tokens = estimate_tokens(partial) + 6
+            if groups[-1] and used + tokens > budget:
+                groups.append([])
+                used = 0
+            groups[-1].append(partial)
+            used += tokens
+        # A group per partial cannot shrink any further, so it is sent as is.
+        if 1 < len(groups) < len(partials):
+            reduced = [await self._reduce_summaries(group) for group in groups]
+            return await self._reduce_summaries(reduced)
+        return await self._complete(self._build_reduce_prompt(partials), temperature=0.3)
+
+    async def _complete(self, prompt: str, temperature: float = 0.2) -> str:
+        if self.use_langchain and self.llm is not None:
+            try:
+                message = await llm_guard.call(lambda: self.llm.ainvoke(prompt))
+                content = getattr(message, "content", message)
+                if isinstance(content, str) and content.strip():
+                    return content.strip()
+            except LLMUnavailableError:
+                raise
+            except Exception as exc:
+                logger.warning("LangChain completion failed, calling Gemini directly: %s", exc)
+        if self.provider == "gemini":
+            return await self._call_gemini(prompt, temperature=temperature)
+        raise LLMNotConfiguredError("LLM provider is not configured")
+
+    @staticmethod
+    def _compact(
+        transcript: TranscriptPayload, kind: str, max_tokens: Optional[int] = None
+    ) -> TranscriptPayload:
+        result = compact_transcript(transcript, max_tokens=max_tokens, kind=kind)
+        # A transcript made only of fillers still gets sent as-is rather than as nothing.
+        return result.segments or transcript
+
+    def _cache_key(self, kind: str, content: str) -> str:
+        digest = hashlib.sha256()
+        for part in (kind, self.model or "", PROMPT_VERSION, content):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    @classmethod
+    def _split_windows(cls, transcript: TranscriptPayload, budget: int) -> list[TranscriptPayload]:
+        windows: list[TranscriptPayload] = [[]]
+        used = 0
+        # Merged monologues can exceed a window on their own, so they are cut first.
+        pieces = (piece for item in transcript for piece in split_segment(item, max(1, budget - 1)))
+        for item in pieces:
+            tokens = estimate_tokens(cls._format_transcript([item])) + 1
+            if windows[-1] and used + tokens > budget:
+                windows.append([])
+                used = 0
+            windows[-1].append(item)
+            used += tokens
+        return windows
+
+    def _window_budget(self) -> int:
+        """Transcript tokens a map window can hold next to its instructions."""
+        return max(1, self.window_tokens - estimate_tokens(self._build_window_prompt("")))
+
     def _init_langchain_chains(self) -> None:
         if not self.provider or not self.api_key:
             raise LLMNotConfiguredError("LLM provider is not configured")
 
+        from langchain_core.output_parsers import StrOutputParser
+        from langchain_core.prompts import ChatPromptTemplate
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
         if self.provider == "gemini":
             llm = ChatGoogleGenerativeAI(
                 model=self.model or "gemini-pro",
@@ -135,28 +574,27 @@ class LLMService:
         )
 
         parser = StrOutputParser()
+        self.llm = llm
         self.summary_chain = summary_prompt | llm | parser
         self.action_chain = action_prompt | llm | parser
 
     async def _call_gemini(self, prompt: str, temperature: float = 0.2) -> str:
-        if not GEMINI_API_KEY:
+        if not self.api_key:
             raise LLMNotConfiguredError("GEMINI_API_KEY is not configured")
-        if httpx is None:
-            raise RuntimeError("httpx is required for Gemini calls. Install httpx>=0.25.")
 
-        url = (
-            f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent"
-        )
-        params = {"key": GEMINI_API_KEY}
+        url = f"/v1beta/models/{self.model}:generateContent"
+        params = {"key": self.api_key}
         payload = {
             "contents": [{"role": "user", "parts": [{"text": prompt}]}],
             "generationConfig": {"temperature": temperature, "topK": 32, "topP": 0.95},
         }
 
-        async with httpx.AsyncClient(timeout=60) as client:
-            res = await client.post(url, params=params, json=payload)
+        async def post() -> dict[str, Any]:
+            res = await get_http_client().post(url, params=params, json=payload)
             res.raise_for_status()
-            data = res.json()
+            return res.json()
+
+        data = await llm_guard.call(post)
 
         try:
             text = data["candidates"][0]["content"]["parts"][0]["text"]
@@ -164,9 +602,34 @@ class LLMService:
             text = ""
         return text.strip() or "요약을 생성하지 못했습니다."
 
+    async def _stream_gemini(self, prompt: str, temperature: float = 0.2) -> AsyncIterator[str]:
+        if not self.api_key:
+            raise LLMNotConfiguredError("GEMINI_API_KEY is not configured")
+
+        url = f"/v1beta/models/{self.model}:streamGenerateContent"
+        params = {"key": self.api_key, "alt": "sse"}
+        payload = {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            "generationConfig": {"temperature": temperature, "topK": 32, "topP": 0.95},
+        }
+
+        async with get_http_client().stream("POST", url, params=params, json=payload) as res:
+            res.raise_for_status()
+            async for line in res.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                try:
+                    data = json.loads(line[len("data:") :])
+                    parts = data["candidates"][0]["content"]["parts"]
+                except (json.JSONDecodeError, KeyError, IndexError, TypeError):
+                    continue
+                text = "".join(part.get("text", "") for part in parts if isinstance(part, dict))
+                if text:
+                    yield text
+
     @staticmethod
     def _build_summary_prompt(transcript: TranscriptPayload) -> str:
-        lines = "\n".join(f"{item.get('speaker', 'Speaker')}: {item.get('text', '')}" for item in transcript)
+        lines = LLMService._format_transcript(transcript)
         return (
             "다음 회의 대화록을 한국어로 3~5개의 bullet 요약으로 정리해줘. "
             "결정사항과 다음 단계가 있다면 강조해줘.\n\n"
@@ -174,11 +637,37 @@ class LLMService:
         )
 
     @staticmethod
-    def _build_action_item_prompt(transcript: TranscriptPayload) -> str:
-        lines = "\n".join(
-            f"{item.get('speaker', 'Speaker')}: {item.get('text', '')}"
-            for item in transcript
+    def _build_window_prompt(formatted: str) -> str:
+        return (
+            "다음은 긴 회의 대화록의 일부야. 이 구간에서 논의된 내용, 결정사항, "
+            "담당자와 할 일을 한국어 bullet로 빠짐없이 간결하게 정리해줘.\n\n"
+            f"{formatted}"
+        )
+
+    @staticmethod
+    def _build_reduce_prompt(partials: list[str]) -> str:
+        sections = "\n\n".join(
+            f"[구간 {index}]\n{partial}" for index, partial in enumerate(partials, start=1)
         )
+        return (
+            "다음은 한 회의를 시간 순서대로 구간별로 요약한 내용이야. "
+            "전체 회의를 한국어로 3~5개의 bullet 요약으로 통합해줘. "
+            "결정사항과 다음 단계가 있다면 강조해줘.\n\n"
+            f"{sections}"
+        )
+
+    @staticmethod
+    def _build_fold_prompt(previous_summary: str, formatted: str) -> str:
+        return (
+            "다음은 진행 중인 회의의 기존 요약과 그 이후에 새로 나온 대화야. "
+            "기존 요약에 새 대화 내용을 반영해서 전체 회의를 한국어 3~5개의 bullet 요약으로 갱신해줘. "
+            "결정사항과 다음 단계가 있다면 강조해줘.\n\n"
+            f"[기존 요약]\n{previous_summary}\n\n[새 대화]\n{formatted}"
+        )
+
+    @staticmethod
+    def _build_action_item_prompt(transcript: TranscriptPayload) -> str:
+        lines = LLMService._format_transcript(transcript)
         return (
             "다음 회의 대화록에서 실행 항목을 JSON 배열로 추출해줘. "
             "각 항목은 {\"type\": \"task\", \"assignee\": \"이름\", "
@@ -188,6 +677,46 @@ class LLMService:
             f"{lines}"
         )
 
+    @staticmethod
+    def _build_combined_prompt(transcript: TranscriptPayload) -> str:
+        lines = LLMService._format_transcript(transcript)
+        return (
+            "다음 회의 대화록을 분석해서 JSON 객체 하나만 출력해. 다른 텍스트는 쓰지 마. "
+            "형식: {\"summary\": [\"한국어 요약 bullet\", ...], "
+            "\"actionItems\": [{\"type\": \"task\", \"assignee\": \"이름\", "
+            "\"content\": \"API 문서 정리 처럼 짧은 명사형 작업명\", "
+            "\"dueDate\": \"YYYY-MM-DD\" 혹은 \"이번주 목요일\" 같은 상대 날짜 표현}]}. "
+            "summary는 3~5개의 bullet로 결정사항과 다음 단계를 강조하고, "
+            "dueDate는 비워두지 말고 발화에서 유추되는 가장 그럴듯한 날짜를 반드시 넣어.\n\n"
+            f"{lines}"
+        )
+
+    @staticmethod
+    def _try_parse_combined_json(
+        raw_text: str,
+    ) -> Optional[tuple[str, list[dict[str, Any]]]]:
+        raw_text = (raw_text or "").strip()
+        start = raw_text.find("{")
+        end = raw_text.rfind("}")
+        if start == -1 or end == -1:
+            return None
+        try:
+            data = json.loads(raw_text[start : end + 1])
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, dict):
+            return None
+        summary = data.get("summary")
+        actions = data.get("actionItems", data.get("action_items"))
+        if isinstance(summary, list):
+            bullets = [str(item).strip() for item in summary if str(item).strip()]
+            summary = "\n".join(
+                bullet if bullet.startswith(("-", "•", "*")) else f"- {bullet}" for bullet in bullets
+            )
+        if not isinstance(summary, str) or not summary.strip() or not isinstance(actions, list):
+            return None
+        return summary.strip(), [item for item in actions if isinstance(item, dict)]
+
     @staticmethod
     def _fallback_summary(transcript: TranscriptPayload) -> str:
         excerpts = []
@@ -201,10 +730,7 @@ class LLMService:
 
     @staticmethod
     def _format_transcript(transcript: TranscriptPayload) -> str:
-        return "\n".join(
-            f"{item.get('speaker', 'Speaker')}: {item.get('text', '')}"
-            for item in transcript
-        )
+        return format_segments(transcript)
 
     @staticmethod
     def _fallback_actions(transcript: TranscriptPayload) -> list[dict[str, Any]]:
@@ -248,4 +774,12 @@ class LLMService:
         return None
 
 
-llm_service = LLMService()
+_llm_service: Optional[LLMService] = None
+
+
+def get_llm_service() -> LLMService:
+    """Return the shared service, building it (and any LangChain chains) on first use."""
+    global _llm_service
+    if _llm_service is None:
+        _llm_service = LLMService()
+    return _llm_service
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, TypeVar
+
+from .. import metrics
+from ..config import LLM_CACHE_MAX_ENTRIES, LLM_CACHE_MAX_ENTRY_BYTES, LLM_CACHE_TTL_SECONDS
+from ..redis import get_redis
+from .llm import PROMPT_VERSION, LLMService, LLMUnavailableError, TranscriptPayload, llm_fallbacks
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CACHE_PREFIX = "llm:cache:"
+CACHE_INDEX_KEY = "llm:cache:index"
+
+cache_hits = metrics.counter("llm_cache_hits_total", "LLM results served from the result cache")
+cache_misses = metrics.counter("llm_cache_misses_total", "LLM results computed because the cache had no entry")
+cache_bypassed = metrics.counter("llm_cache_bypassed_total", "LLM calls that explicitly skipped the cache")
+cache_saved_seconds = metrics.counter(
+    "llm_cache_saved_seconds_total",
+    "LLM latency avoided by cache hits, based on the latency of the original call",
+)
+
+
+def normalize_transcript(transcript: list[dict[str, Any]]) -> str:
+    """Canonical text for hashing: speaker and whitespace-collapsed text per segment."""
+    lines = []
+    for item in transcript:
+        speaker = " ".join(str(item.get("speaker") or "").split())
+        text = " ".join(str(item.get("text") or "").split())
+        if text:
+            lines.append(f"{speaker}\t{text}")
+    return "\n".join(lines)
+
+
+def cache_key(kind: str, transcript: list[dict[str, Any]], model: str, prompt_version: str) -> str:
+    digest = hashlib.sha256()
+    for part in (kind, model, prompt_version, normalize_transcript(transcript)):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return f"{CACHE_PREFIX}{kind}:{digest.hexdigest()}"
+
+
+async def get_cached(
+    kind: str, transcript: list[dict[str, Any]], model: str, prompt_version: str
+) -> tuple[Any, bool]:
+    """Return ``(value, found)``; lookup failures count as a miss."""
+    key = cache_key(kind, transcript, model, prompt_version)
+    try:
+        raw = await get_redis().get(key)
+    except Exception as exc:
+        logger.warning("LLM cache lookup failed: %s", exc)
+        raw = None
+    if raw:
+        try:
+            entry = json.loads(raw)
+            cache_hits.inc(kind=kind)
+            cache_saved_seconds.inc(float(entry.get("latency") or 0.0), kind=kind)
+            return entry["value"], True
+        except (json.JSONDecodeError, KeyError, TypeError):
+            pass
+    cache_misses.inc(kind=kind)
+    return None, False
+
+
+async def store_cached(
+    kind: str,
+    transcript: list[dict[str, Any]],
+    model: str,
+    prompt_version: str,
+    value: Any,
+    latency: float,
+) -> None:
+    key = cache_key(kind, transcript, model, prompt_version)
+    payload = json.dumps({"value": value, "latency": latency}, ensure_ascii=False)
+    if len(payload.encode("utf-8")) > LLM_CACHE_MAX_ENTRY_BYTES:
+        return
+    redis = get_redis()
+    try:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.set(key, payload, ex=LLM_CACHE_TTL_SECONDS)
+            pipe.zadd(CACHE_INDEX_KEY, {key: time.time()})
+            pipe.zcard(CACHE_INDEX_KEY)
+            results = await pipe.execute()
+        overflow = int(results[-1]) - LLM_CACHE_MAX_ENTRIES
+        if overflow > 0:
+            evicted = await redis.zpopmin(CACHE_INDEX_KEY, overflow)
+            if evicted:
+                await redis.delete(*[member for member, _ in evicted])
+    except Exception as exc:
+        logger.warning("LLM cache store failed: %s", exc)
+
+
+async def cached_call(
+    kind: str,
+    transcript: list[dict[str, Any]],
+    model: str,
+    prompt_version: str,
+    compute: Callable[[], Awaitable[T]],
+    bypass: bool = False,
+) -> tuple[T, bool]:
+    """Return ``(value, hit)`` for an LLM result keyed by transcript content.
+
+    Redis problems never fail the call; the result is simply computed.
+    """
+    if bypass:
+        cache_bypassed.inc(kind=kind)
+    else:
+        value, found = await get_cached(kind, transcript, model, prompt_version)
+        if found:
+            return value, True
+
+    started = time.perf_counter()
+    value = await compute()
+    await store_cached(kind, transcript, model, prompt_version, value, time.perf_counter() - started)
+    return value, False
+
+
+async def cached_summarize(service: LLMService, transcript: TranscriptPayload, bypass: bool = False) -> tuple[str, bool]:
+    if not service.provider:
+        return await service.summarize(transcript), False
+    try:
+        return await cached_call(
+            "summary",
+            transcript,
+            service.model or "",
+            PROMPT_VERSION,
+            lambda: service.summarize(transcript, fallback=False),
+            bypass=bypass,
+        )
+    except LLMUnavailableError as exc:
+        # Degraded results are served but never cached.
+        logger.warning("LLM unavailable, using heuristic summary: %s", exc)
+        llm_fallbacks.inc(kind="summary")
+        return service._fallback_summary(transcript), False
+
+
+async def cached_extract_action_items(
+    service: LLMService, transcript: TranscriptPayload, bypass: bool = False
+) -> tuple[list[dict[str, Any]], bool]:
+    if not service.provider:
+        return await service.extract_action_items(transcript), False
+    try:
+        return await cached_call(
+            "action_items",
+            transcript,
+            service.model or "",
+            PROMPT_VERSION,
+            lambda: service.extract_action_items(transcript, fallback=False),
+            bypass=bypass,
+        )
+    except LLMUnavailableError as exc:
+        logger.warning("LLM unavailable, using heuristic action items: %s", exc)
+        llm_fallbacks.inc(kind="action_items")
+        return service._fallback_actions(transcript), False
+
+
+async def cached_summarize_and_extract(
+    service: LLMService, transcript: TranscriptPayload, bypass: bool = False
+) -> tuple[tuple[str, list[dict[str, Any]]], bool]:
+    if not service.provider:
+        return await service.summarize_and_extract(transcript), False
+    try:
+        value, hit = await cached_call(
+            "combined",
+            transcript,
+            service.model or "",
+            PROMPT_VERSION,
+            lambda: service.summarize_and_extract(transcript, fallback=False),
+            bypass=bypass,
+        )
+    except LLMUnavailableError as exc:
+        logger.warning("LLM unavailable, using heuristic summary and action items: %s", exc)
+        llm_fallbacks.inc(kind="combined")
+        return (service._fallback_summary(transcript), service._fallback_actions(transcript)), False
+    summary, actions = value
+    return (summary, actions), hit
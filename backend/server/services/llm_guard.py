@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar, cast
+
+try:
+    import httpx
+except ImportError:
+    httpx = cast(Any, None)
+
+from .. import metrics
+from ..config import (
+    LLM_BREAKER_FAILURE_THRESHOLD,
+    LLM_BREAKER_RESET_SECONDS,
+    LLM_MAX_CONCURRENCY,
+    LLM_MAX_RETRIES,
+    LLM_QUEUE_TIMEOUT_SECONDS,
+    LLM_RETRY_BASE_DELAY,
+    LLM_RETRY_BUDGET_MIN,
+    LLM_RETRY_BUDGET_RATIO,
+    LLM_RETRY_MAX_DELAY,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+
+STATE_CLOSED = "closed"
+STATE_HALF_OPEN = "half_open"
+STATE_OPEN = "open"
+_STATE_VALUES = {STATE_CLOSED: 0, STATE_HALF_OPEN: 1, STATE_OPEN: 2}
+
+circuit_state = metrics.gauge("llm_circuit_state", "LLM circuit breaker state (0 closed, 1 half-open, 2 open)")
+circuit_rejections = metrics.counter("llm_circuit_rejections_total", "LLM calls rejected while the circuit was open")
+inflight = metrics.gauge("llm_inflight_requests", "LLM calls currently holding a concurrency slot")
+queue_wait = metrics.histogram("llm_queue_wait_seconds", "Time spent waiting for an LLM concurrency slot")
+queue_timeouts = metrics.counter("llm_queue_timeouts_total", "LLM calls that gave up waiting for a concurrency slot")
+retries = metrics.counter("llm_retries_total", "LLM call retries, labelled by reason")
+budget_exhausted = metrics.counter(
+    "llm_retry_budget_exhausted_total",
+    "Retryable LLM failures that were not retried because the retry budget was spent",
+)
+
+
+class LLMUnavailableError(RuntimeError):
+    """The provider is unhealthy or saturated; callers should degrade instead of waiting."""
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None:
+        status = getattr(exc, "code", None)
+    try:
+        return int(status) if status is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, (asyncio.TimeoutError, ConnectionError)):
+        return True
+    # Connect/read timeouts and protocol errors carry no status code.
+    if httpx is not None and isinstance(exc, httpx.TransportError):
+        return True
+    status = _status_code(exc)
+    return status in RETRYABLE_STATUS
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta seconds or HTTP date) from an HTTP error."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker with a single half-open probe."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._set_state(STATE_CLOSED)
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        circuit_state.set(_STATE_VALUES[state], provider=self.name)
+
+    def allow(self) -> bool:
+        if self.state == STATE_OPEN:
+            if self._clock() - self._opened_at < self.reset_timeout:
+                return False
+            self._set_state(STATE_HALF_OPEN)
+        if self.state == STATE_HALF_OPEN:
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._probe_in_flight = False
+        if self.state != STATE_CLOSED:
+            logger.info("LLM circuit %s closed", self.name)
+            self._set_state(STATE_CLOSED)
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        self._probe_in_flight = False
+        if self.state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != STATE_OPEN:
+                logger.warning("LLM circuit %s opened after %d failures", self.name, self._failures)
+            self._opened_at = self._clock()
+            self._set_state(STATE_OPEN)
+
+    def release(self) -> None:
+        """Give back a half-open probe whose outcome says nothing about provider health."""
+        self._probe_in_flight = False
+
+
+class RetryBudget:
+    """Allow retries up to ``ratio`` of recent requests, with a small floor."""
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries: int = 3,
+        window_seconds: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window_seconds = window_seconds
+        self._clock = clock
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+
+    def _prune(self, now: float) -> None:
+        for events in (self._requests, self._retries):
+            while events and now - events[0] > self.window_seconds:
+                events.popleft()
+
+    def record_request(self) -> None:
+        self._requests.append(self._clock())
+
+    def try_withdraw(self) -> bool:
+        now = self._clock()
+        self._prune(now)
+        if len(self._retries) >= max(self.min_retries, self.ratio * len(self._requests)):
+            return False
+        self._retries.append(now)
+        return True
+
+
+class LLMGuard:
+    """Bound concurrent provider calls, retry transient failures and trip a breaker."""
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        queue_timeout: float,
+        max_retries: int,
+        base_delay: float,
+        max_delay: float,
+        breaker: CircuitBreaker,
+        budget: RetryBudget,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        self.name = name
+        self.max_concurrency = max(1, max_concurrency)
+        self.queue_timeout = queue_timeout
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker
+        self.budget = budget
+        self._sleep = sleep
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one concurrency slot, failing fast when the circuit is open."""
+        if not self.breaker.allow():
+            circuit_rejections.inc(provider=self.name)
+            raise LLMUnavailableError(f"{self.name} circuit is open")
+        semaphore = self._get_semaphore()
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.breaker.release()
+            queue_timeouts.inc(provider=self.name)
+            raise LLMUnavailableError(f"Timed out waiting for a {self.name} slot") from None
+        queue_wait.observe(time.perf_counter() - started, provider=self.name)
+        inflight.inc(provider=self.name)
+        try:
+            yield
+        finally:
+            inflight.dec(provider=self.name)
+            semaphore.release()
+
+    def _backoff(self, attempt: int, exc: BaseException) -> float:
+        retry_after = retry_after_seconds(exc)
+        if retry_after is not None:
+            return min(self.max_delay, retry_after)
+        # Full jitter keeps retries from many workers from synchronizing.
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2**attempt)))
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` under the guard; transient failures end as ``LLMUnavailableError``."""
+        self.budget.record_request()
+        attempt = 0
+        while True:
+            try:
+                async with self.slot():
+                    result = await fn()
+            except LLMUnavailableError:
+                raise
+            except asyncio.CancelledError:
+                self.breaker.release()
+                raise
+            except Exception as exc:
+                if not is_retryable(exc):
+                    self.breaker.release()
+                    raise
+                self.breaker.record_failure()
+                if attempt >= self.max_retries:
+                    raise LLMUnavailableError(f"{self.name} failed after {attempt + 1} attempts: {exc}") from exc
+                if not self.budget.try_withdraw():
+                    budget_exhausted.inc(provider=self.name)
+                    raise LLMUnavailableError(f"{self.name} retry budget exhausted: {exc}") from exc
+                delay = self._backoff(attempt, exc)
+                status = _status_code(exc)
+                retries.inc(provider=self.name, reason=str(status) if status else exc.__class__.__name__)
+                logger.warning(
+                    "%s call failed (%s); retry %d/%d in %.2fs", self.name, exc, attempt + 1, self.max_retries, delay
+                )
+                attempt += 1
+                await self._sleep(delay)
+                continue
+            self.breaker.record_success()
+            return result
+
+
+llm_guard = LLMGuard(
+    "gemini",
+    max_concurrency=LLM_MAX_CONCURRENCY,
+    queue_timeout=LLM_QUEUE_TIMEOUT_SECONDS,
+    max_retries=LLM_MAX_RETRIES,
+    base_delay=LLM_RETRY_BASE_DELAY,
+    max_delay=LLM_RETRY_MAX_DELAY,
+    breaker=CircuitBreaker("gemini", LLM_BREAKER_FAILURE_THRESHOLD, LLM_BREAKER_RESET_SECONDS),
+    budget=RetryBudget(LLM_RETRY_BUDGET_RATIO, LLM_RETRY_BUDGET_MIN),
+)
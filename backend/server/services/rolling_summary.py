@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from .. import metrics
+from ..config import (
+    AI_JOB_TTL_SECONDS,
+    AI_ROLLING_SUMMARY_DEBOUNCE_MS,
+    AI_ROLLING_SUMMARY_EVERY_SEGMENTS,
+    AI_ROLLING_SUMMARY_LOCK_SECONDS,
+)
+from ..redis import (
+    get_redis,
+    rolling_summary_key,
+    rolling_summary_lock_key,
+    rolling_summary_new_segments_key,
+    rolling_summary_pending_key,
+)
+from .ai_jobs import JOB_ROLLING_SUMMARY, enqueue_job
+
+rolling_requests = metrics.counter(
+    "ai_rolling_summary_requests_total",
+    "Rolling summary requests, labelled by trigger and whether they were collapsed",
+)
+
+Cursor = tuple[datetime, Optional[UUID]]
+
+# KEYS[1] = state hash; ARGV = expected cursor, summary, new cursor, segments, ttl.
+# The state is only written when nobody advanced the cursor since it was read.
+_SAVE_STATE_LUA = """
+local current = redis.call('HGET', KEYS[1], 'cursor') or ''
+if current ~= ARGV[1] then
+  return 0
+end
+redis.call('HSET', KEYS[1], 'summary', ARGV[2], 'cursor', ARGV[3], 'segments', ARGV[4])
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[5]))
+return 1
+"""
+
+_save_script = None
+
+
+def _get_script(client):
+    global _save_script
+    if _save_script is None or _save_script.registered_client is not client:
+        _save_script = client.register_script(_SAVE_STATE_LUA)
+    return _save_script
+
+
+def encode_cursor(created_at: datetime, segment_id: UUID) -> str:
+    """Serialize the ``(created_at, id)`` position of the last folded segment."""
+    return f"{created_at.isoformat()}|{segment_id}"
+
+
+def decode_cursor(value: Optional[str]) -> Optional[Cursor]:
+    """Parse a stored cursor; states written before ids were kept carry only the timestamp."""
+    if not value:
+        return None
+    created_at, _, segment_id = value.partition("|")
+    return datetime.fromisoformat(created_at), UUID(segment_id) if segment_id else None
+
+
+async def request_rolling_summary(meeting_id: UUID, trigger: str = "request") -> Optional[str]:
+    """Queue a rolling summary job unless one is already pending for the meeting.
+
+    The pending marker is a ``SET NX PX`` key, so requests from many
+    participants within the debounce window collapse into a single job.
+    Returns the new job id, or ``None`` when the request was collapsed.
+    """
+    redis = get_redis()
+    acquired = await redis.set(
+        rolling_summary_pending_key(meeting_id),
+        trigger,
+        nx=True,
+        px=max(1, AI_ROLLING_SUMMARY_DEBOUNCE_MS),
+    )
+    if not acquired:
+        rolling_requests.inc(trigger=trigger, collapsed="true")
+        return None
+    rolling_requests.inc(trigger=trigger, collapsed="false")
+    return await enqueue_job(JOB_ROLLING_SUMMARY, meeting_id)
+
+
+async def note_new_segment(meeting_id: UUID) -> Optional[str]:
+    """Count a persisted transcript segment and fold every N new segments."""
+    if AI_ROLLING_SUMMARY_EVERY_SEGMENTS <= 0:
+        return None
+    redis = get_redis()
+    key = rolling_summary_new_segments_key(meeting_id)
+    count = await redis.incr(key)
+    if count == 1:
+        await redis.expire(key, AI_JOB_TTL_SECONDS)
+    if count < AI_ROLLING_SUMMARY_EVERY_SEGMENTS:
+        return None
+    return await request_rolling_summary(meeting_id, trigger="segments")
+
+
+def fold_lock(meeting_id: UUID):
+    """Per-meeting lock held for a whole fold so concurrent jobs run one after another."""
+    return get_redis().lock(
+        rolling_summary_lock_key(meeting_id),
+        timeout=AI_ROLLING_SUMMARY_LOCK_SECONDS,
+        blocking_timeout=AI_ROLLING_SUMMARY_LOCK_SECONDS,
+    )
+
+
+async def begin_fold(meeting_id: UUID) -> None:
+    """Release the debounce marker and reset the segment counter for a running job.
+
+    Segments persisted while the job runs start a new count, so they are folded
+    by the next job instead of being lost.
+    """
+    redis = get_redis()
+    async with redis.pipeline(transaction=True) as pipe:
+        pipe.delete(rolling_summary_pending_key(meeting_id))
+        pipe.delete(rolling_summary_new_segments_key(meeting_id))
+        await pipe.execute()
+
+
+async def get_rolling_state(meeting_id: UUID) -> dict[str, str]:
+    return await get_redis().hgetall(rolling_summary_key(meeting_id))
+
+
+async def save_rolling_state(
+    meeting_id: UUID, summary: str, cursor: str, segments: int, expected_cursor: str = ""
+) -> bool:
+    """Store the folded state if the cursor is still ``expected_cursor``.
+
+    Returns ``False`` without writing when another fold advanced the cursor in
+    the meantime, so a stale job cannot overwrite a newer summary.
+    """
+    script = _get_script(get_redis())
+    saved = await script(
+        keys=[rolling_summary_key(meeting_id)],
+        args=[expected_cursor, summary, cursor, segments, AI_JOB_TTL_SECONDS],
+    )
+    return bool(saved)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import html
+import re
+
+from sqlalchemy import column, literal_column, select, table
+from sqlalchemy.sql.elements import ColumnElement
+
+# The FTS5 trigram tokenizer can only use its index for terms of three or more
+# characters; shorter terms are matched with LIKE on the candidate rows.
+MIN_INDEXED_TERM_CHARS = 3
+SNIPPET_CONTEXT_CHARS = 60
+
+
+def search_terms(query: str) -> list[str]:
+    return [term for term in query.split() if term]
+
+
+def split_terms(terms: list[str]) -> tuple[list[str], list[str]]:
+    """Split terms into those the trigram index can serve and those it cannot."""
+    indexed = [term for term in terms if len(term) >= MIN_INDEXED_TERM_CHARS]
+    short = [term for term in terms if len(term) < MIN_INDEXED_TERM_CHARS]
+    return indexed, short
+
+
+def escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def contains(col, term: str) -> ColumnElement[bool]:
+    return col.ilike(f"%{escape_like(term)}%", escape="\\")
+
+
+def fts_query(terms: list[str]) -> str:
+    """Build an FTS5 MATCH expression requiring every term as a quoted phrase."""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def fts_table(name: str):
+    return table(f"{name}_fts", column("rowid"))
+
+
+def fts_keys(name: str):
+    """The ``docid -> id`` map that keys ``<name>_fts`` rows (see ``models.fts5_ddl``)."""
+    return table(f"{name}_fts_keys", column("docid"), column("key"))
+
+
+def fts_match(table_name: str, terms: list[str]) -> ColumnElement[bool]:
+    return literal_column(f"{table_name}_fts").op("MATCH")(fts_query(terms))
+
+
+def contains_all(dialect: str, col, query: str) -> list[ColumnElement[bool]]:
+    """Conditions matching rows whose ``col`` contains every term of ``query``.
+
+    On SQLite, terms long enough for the FTS5 trigram index are resolved through
+    ``<table>_fts``; on Postgres, ``ILIKE`` is served by the pg_trgm GIN index.
+    """
+    terms = search_terms(query)
+    if dialect != "sqlite":
+        return [contains(col, term) for term in terms]
+    indexed, short = split_terms(terms)
+    conditions = [contains(col, term) for term in short]
+    if indexed:
+        table_name = col.table.name
+        fts, keys = fts_table(table_name), fts_keys(table_name)
+        conditions.append(
+            col.table.c.id.in_(
+                select(keys.c.key)
+                .select_from(fts)
+                .join(keys, keys.c.docid == fts.c.rowid)
+                .where(fts_match(table_name, indexed))
+            )
+        )
+    return conditions
+
+
+def highlight(text: str, terms: list[str], context: int = SNIPPET_CONTEXT_CHARS) -> str:
+    """HTML-escape ``text``, wrap matched terms in ``<mark>`` and trim to the first match."""
+    if not terms:
+        return html.escape(text)
+    pattern = re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    first = pattern.search(text)
+    start, end = 0, len(text)
+    if first is not None:
+        start = max(0, first.start() - context)
+        end = min(len(text), first.end() + context)
+    window = text[start:end]
+    pieces: list[str] = []
+    last = 0
+    for match in pattern.finditer(window):
+        pieces.append(html.escape(window[last : match.start()]))
+        pieces.append(f"<mark>{html.escape(match.group(0))}</mark>")
+        last = match.end()
+    pieces.append(html.escape(window[last:]))
+    return ("…" if start > 0 else "") + "".join(pieces) + ("…" if end < len(text) else "")
@@ -0,0 +1,303 @@
+"""Cold storage for the transcripts of completed meetings.
+
+A completed meeting's segments are written oldest first as NDJSON into a
+compressed file under ``TRANSCRIPT_ARCHIVE_DIR`` (zstd when ``zstandard`` is
+installed, gzip otherwise), the rows are deleted and
+``meetings.transcript_archive`` keeps the file name. Every ``CHUNK_SIZE``
+segments are compressed as their own gzip member or zstd frame, and a
+``.idx.json`` file next to the archive records each chunk's byte offset and
+last position, so a page read seeks to its chunk instead of decompressing from
+the start. Readers go through ``load_transcript`` or ``read_archive``, which
+stream the file back and merge it with any rows still in the table.
+"""
+from __future__ import annotations
+
+import asyncio
+import bisect
+import gzip
+import heapq
+import io
+import json
+import logging
+import os
+import tempfile
+from contextlib import contextmanager, suppress
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, cast
+from uuid import UUID
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = cast(Any, None)
+
+from sqlalchemy import delete, exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .. import metrics
+from ..config import TRANSCRIPT_ARCHIVE_CODEC, TRANSCRIPT_ARCHIVE_DIR
+from ..models import Meeting, Transcript, utcnow
+
+logger = logging.getLogger(__name__)
+
+SUFFIXES = {"zstd": ".ndjson.zst", "gzip": ".ndjson.gz"}
+ZSTD_LEVEL = 10
+BATCH_SIZE = 1000
+CHUNK_SIZE = 500
+INDEX_SUFFIX = ".idx.json"
+
+archived_segments = metrics.counter("transcript_archived_segments_total", "Transcript rows moved into archive files")
+archive_size = metrics.histogram(
+    "transcript_archive_bytes",
+    "Compressed size of an archived meeting transcript",
+    buckets=(1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+)
+
+Position = tuple[datetime, UUID]
+
+
+def archive_codec() -> str:
+    if TRANSCRIPT_ARCHIVE_CODEC == "zstd" and zstandard is not None:
+        return "zstd"
+    return "gzip"
+
+
+def archive_path(name: str) -> Path:
+    return Path(TRANSCRIPT_ARCHIVE_DIR) / name
+
+
+def index_path(name: str) -> Path:
+    return archive_path(name + INDEX_SUFFIX)
+
+
+def _codec_for(name: str) -> str:
+    for codec, suffix in SUFFIXES.items():
+        if name.endswith(suffix):
+            return codec
+    raise ValueError(f"Unknown transcript archive format: {name}")
+
+
+def position(row: Transcript) -> Position:
+    """Sort key matching ``ORDER BY created_at, id`` on the table."""
+    return (row.created_at or datetime.min, row.id)
+
+
+@contextmanager
+def _text_writer(fileobj: BinaryIO, codec: str) -> Iterator[io.TextIOWrapper]:
+    if codec == "zstd":
+        raw = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(fileobj, closefd=False)
+    else:
+        raw = gzip.GzipFile(fileobj=fileobj, mode="wb")
+    with io.TextIOWrapper(raw, encoding="utf-8") as text:
+        yield text
+
+
+def iter_archive(name: str, offset: int = 0) -> Iterator[dict[str, Any]]:
+    """Yield the records of an archive from the chunk at ``offset``, decompressing as it is read."""
+    codec = _codec_for(name)
+    if codec == "zstd" and zstandard is None:
+        raise RuntimeError(f"zstandard is not installed; cannot read {name}. Run `pip install zstandard`.")
+    with archive_path(name).open("rb") as fileobj:
+        fileobj.seek(offset)
+        if codec == "zstd":
+            raw = zstandard.ZstdDecompressor().stream_reader(fileobj, read_across_frames=True)
+        else:
+            raw = gzip.GzipFile(fileobj=fileobj, mode="rb")
+        with io.TextIOWrapper(raw, encoding="utf-8") as text:
+            for line in text:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _load_index(name: str) -> list[dict[str, Any]]:
+    try:
+        return json.loads(index_path(name).read_text(encoding="utf-8"))["chunks"]
+    except FileNotFoundError:
+        return []
+
+
+def _chunk_offset(name: str, after: Optional[Position]) -> int:
+    """Byte offset of the first chunk that can hold a segment past ``after``."""
+    chunks = _load_index(name) if after is not None else []
+    if not chunks:
+        return 0
+    lasts = [_position(chunk["last"]) for chunk in chunks]
+    found = bisect.bisect_right(lasts, after)
+    if found == len(chunks):
+        return archive_path(name).stat().st_size
+    return chunks[found]["offset"]
+
+
+def _position(value: list[Optional[str]]) -> Position:
+    created_at, segment_id = value
+    return (datetime.fromisoformat(created_at) if created_at else datetime.min, UUID(segment_id))
+
+
+def _record(row: Transcript) -> dict[str, Any]:
+    return {
+        "id": str(row.id),
+        "speaker": row.speaker,
+        "text": row.text,
+        "timestamp": row.timestamp,
+        "startTime": row.start_time,
+        "endTime": row.end_time,
+        "createdAt": row.created_at.isoformat() if row.created_at else None,
+    }
+
+
+def _write_chunk(fileobj: BinaryIO, codec: str, records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Compress ``records`` as one self-contained gzip member or zstd frame."""
+    offset = fileobj.tell()
+    with _text_writer(fileobj, codec) as out:
+        for record in records:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return {"offset": offset, "last": [records[-1]["createdAt"], records[-1]["id"]]}
+
+
+def _write_index(name: str, chunks: list[dict[str, Any]]) -> None:
+    target = index_path(name)
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as out:
+        json.dump({"chunkSize": CHUNK_SIZE, "chunks": chunks}, out)
+    os.replace(tmp_name, target)
+
+
+def _segment(meeting_id: UUID, record: dict[str, Any]) -> Transcript:
+    created_at = record.get("createdAt")
+    return Transcript(
+        id=UUID(record["id"]),
+        meeting_id=meeting_id,
+        speaker=record["speaker"],
+        text=record["text"],
+        timestamp=record["timestamp"],
+        start_time=record.get("startTime"),
+        end_time=record.get("endTime"),
+        created_at=datetime.fromisoformat(created_at) if created_at else None,
+    )
+
+
+def _read(meeting_id: UUID, name: str, after: Optional[Position], limit: Optional[int]) -> list[Transcript]:
+    rows: list[Transcript] = []
+    for record in iter_archive(name, _chunk_offset(name, after)):
+        segment = _segment(meeting_id, record)
+        if after is not None and position(segment) <= after:
+            continue
+        rows.append(segment)
+        if limit is not None and len(rows) >= limit:
+            break
+    return rows
+
+
+async def read_archive(
+    meeting: Meeting, after: Optional[Position] = None, limit: Optional[int] = None
+) -> list[Transcript]:
+    """Archived segments of ``meeting`` past ``after``, as detached ``Transcript`` objects."""
+    if not meeting.transcript_archive:
+        return []
+    return await asyncio.to_thread(_read, meeting.id, meeting.transcript_archive, after, limit)
+
+
+def merge_segments(*parts: Iterable[Transcript]) -> list[Transcript]:
+    """Merge segment lists that are each already in transcript order."""
+    return list(heapq.merge(*parts, key=position))
+
+
+async def load_transcript(session: AsyncSession, meeting: Meeting) -> list[Transcript]:
+    """Every segment of ``meeting`` in order, whether archived or still in the table."""
+    res = await session.execute(
+        select(Transcript)
+        .where(Transcript.meeting_id == meeting.id)
+        .order_by(Transcript.created_at.asc(), Transcript.id.asc())
+    )
+    rows = list(res.scalars().all())
+    if not meeting.transcript_archive:
+        return rows
+    return merge_segments(await read_archive(meeting), rows)
+
+
+async def archivable_meetings(session: AsyncSession, older_than: timedelta, limit: int) -> list[Meeting]:
+    """Completed meetings untouched for ``older_than`` that still keep transcript rows."""
+    res = await session.execute(
+        select(Meeting)
+        .where(
+            Meeting.status == "completed",
+            Meeting.transcript_archive.is_(None),
+            Meeting.updated_at < utcnow() - older_than,
+            exists().where(Transcript.meeting_id == Meeting.id),
+        )
+        .order_by(Meeting.updated_at.asc())
+        .limit(limit)
+    )
+    return list(res.scalars().all())
+
+
+async def archive_meeting(session: AsyncSession, meeting: Meeting) -> int:
+    """Move a completed meeting's transcript rows into an archive file.
+
+    The file is written and renamed into place before the rows are deleted in
+    one transaction with the pointer update; returns the number of segments
+    archived.
+    """
+    if meeting.status != "completed" or meeting.transcript_archive:
+        return 0
+    codec = archive_codec()
+    name = f"{meeting.id}{SUFFIXES[codec]}"
+    path = archive_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    archived: list[UUID] = []
+    chunks: list[dict[str, Any]] = []
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fileobj:
+            rows = await session.stream_scalars(
+                select(Transcript)
+                .where(Transcript.meeting_id == meeting.id)
+                .order_by(Transcript.created_at.asc(), Transcript.id.asc())
+                .execution_options(yield_per=BATCH_SIZE)
+            )
+            chunk: list[dict[str, Any]] = []
+            async for row in rows:
+                chunk.append(_record(row))
+                archived.append(row.id)
+                if len(chunk) >= CHUNK_SIZE:
+                    chunks.append(_write_chunk(fileobj, codec, chunk))
+                    chunk = []
+            if chunk:
+                chunks.append(_write_chunk(fileobj, codec, chunk))
+            fileobj.flush()
+            os.fsync(fileobj.fileno())
+        if not archived:
+            os.unlink(tmp_name)
+            return 0
+        # The index goes first: an archive without one is still read from the start.
+        _write_index(name, chunks)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        index_path(name).unlink(missing_ok=True)
+        raise
+
+    try:
+        # Only the rows that made it into the file; a late segment stays in the table.
+        for start in range(0, len(archived), BATCH_SIZE):
+            await session.execute(delete(Transcript).where(Transcript.id.in_(archived[start : start + BATCH_SIZE])))
+        await session.execute(
+            update(Meeting)
+            .where(Meeting.id == meeting.id)
+            .values(transcript_archive=name, updated_at=Meeting.updated_at)
+        )
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        path.unlink(missing_ok=True)
+        index_path(name).unlink(missing_ok=True)
+        raise
+
+    size = path.stat().st_size
+    archived_segments.inc(len(archived), codec=codec)
+    archive_size.observe(size, codec=codec)
+    logger.info("Archived %d transcript segments of meeting %s into %s (%d bytes)", len(archived), meeting.id, name, size)
+    return len(archived)
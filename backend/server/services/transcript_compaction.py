@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Any, Optional
+
+from .. import metrics
+
+logger = logging.getLogger(__name__)
+
+# Standalone tokens that carry no meaning in meeting transcripts. Words such as
+# "그" or "like" are left alone because they are often part of the content.
+FILLER_WORDS = frozenset(
+    {
+        "음",
+        "음음",
+        "으음",
+        "어",
+        "어어",
+        "아",
+        "에",
+        "저기",
+        "뭐랄까",
+        "그러니까",
+        "um",
+        "umm",
+        "uh",
+        "uhh",
+        "uh-huh",
+        "erm",
+        "hmm",
+        "mm",
+    }
+)
+FILLER_PHRASES = ("you know", "i mean", "kind of like")
+NEAR_DUPLICATE_RATIO = 0.9
+MIN_OVERLAP_CHARS = 4
+# Longest stretch of text compared for near-duplicates and overlaps.
+COMPARE_CHARS = 300
+
+compression_ratio = metrics.histogram(
+    "llm_transcript_compression_ratio",
+    "Compacted / original estimated prompt tokens per LLM call",
+    buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0),
+)
+tokens_removed = metrics.counter(
+    "llm_transcript_tokens_removed_total",
+    "Estimated transcript tokens removed by compaction before prompting",
+)
+
+_PUNCTUATION = ".,!?…~"
+_SENTENCE_END = re.compile(r"(?<=[.!?…。])\s+")
+_PHRASE_PATTERN = re.compile(
+    r"(?<!\w)(?:" + "|".join(re.escape(phrase) for phrase in FILLER_PHRASES) + r")(?!\w)[,\s]*",
+    re.IGNORECASE,
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap local token estimate: ~1 token per Hangul/CJK char, ~4 chars otherwise."""
+    wide = sum(1 for ch in text if ord(ch) >= 0x1100)
+    return wide + (len(text) - wide + 3) // 4
+
+
+def format_segments(segments: list[dict[str, Any]]) -> str:
+    return "\n".join(f"{item.get('speaker', 'Speaker')}: {item.get('text', '')}" for item in segments)
+
+
+def _cut_characters(text: str, budget: int) -> list[str]:
+    pieces: list[str] = []
+    start = wide = narrow = 0
+    for index, ch in enumerate(text):
+        is_wide = ord(ch) >= 0x1100
+        tokens = wide + is_wide + (narrow + (not is_wide) + 3) // 4
+        if index > start and tokens > budget:
+            pieces.append(text[start:index])
+            start, wide, narrow = index, 0, 0
+        if is_wide:
+            wide += 1
+        else:
+            narrow += 1
+    pieces.append(text[start:])
+    return pieces
+
+
+def _split_text(text: str, budget: int, level: int = 0) -> list[str]:
+    """Cut ``text`` into pieces of at most ``budget`` tokens: by sentence, then word, then character."""
+    if estimate_tokens(text) <= budget:
+        return [text]
+    if level == 0:
+        units = _SENTENCE_END.split(text)
+    elif level == 1:
+        units = text.split()
+    else:
+        return _cut_characters(text, budget)
+    pieces: list[str] = []
+    current = ""
+    for unit in units:
+        for part in _split_text(unit, budget, level + 1):
+            candidate = f"{current} {part}" if current else part
+            if current and estimate_tokens(candidate) > budget:
+                pieces.append(current)
+                current = part
+            else:
+                current = candidate
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_segment(item: dict[str, Any], max_tokens: int) -> list[dict[str, Any]]:
+    """Cut a segment whose formatted line exceeds ``max_tokens`` into consecutive segments."""
+    if estimate_tokens(format_segments([item])) <= max_tokens:
+        return [item]
+    prefix = estimate_tokens(f"{item.get('speaker', 'Speaker')}: ")
+    budget = max(1, max_tokens - prefix)
+    return [{**item, "text": piece} for piece in _split_text(str(item.get("text") or ""), budget)]
+
+
+@dataclass
+class CompactionResult:
+    segments: list[dict[str, Any]]
+    original_tokens: int
+    compacted_tokens: int
+    omitted: int = 0
+
+    @property
+    def ratio(self) -> float:
+        if not self.original_tokens:
+            return 1.0
+        return self.compacted_tokens / self.original_tokens
+
+
+def strip_fillers(text: str) -> str:
+    text = _PHRASE_PATTERN.sub("", text)
+    kept = [word for word in text.split() if word.strip(_PUNCTUATION).lower() not in FILLER_WORDS]
+    return " ".join(kept)
+
+
+def _normalized(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def _near_duplicate(previous: str, current: str) -> bool:
+    matcher = SequenceMatcher(None, previous[:COMPARE_CHARS], current[:COMPARE_CHARS], autojunk=False)
+    return (
+        matcher.real_quick_ratio() >= NEAR_DUPLICATE_RATIO
+        and matcher.quick_ratio() >= NEAR_DUPLICATE_RATIO
+        and matcher.ratio() >= NEAR_DUPLICATE_RATIO
+    )
+
+
+class _Run:
+    """Merged text of consecutive segments from one speaker.
+
+    Each utterance is compared only with the one right before it, so a long
+    monologue compacts in linear time and an earlier "네" never swallows a
+    later one. The joined ``parts`` always end with ``previous``.
+    """
+
+    def __init__(self, text: str) -> None:
+        self.parts = [text]
+        self.previous = text
+
+    @property
+    def text(self) -> str:
+        return "".join(self.parts)
+
+    def _replace_previous(self, current: str) -> None:
+        remaining = len(self.previous)
+        while remaining:
+            last = self.parts.pop()
+            if len(last) > remaining:
+                self.parts.append(last[:-remaining])
+                break
+            remaining -= len(last)
+        self.parts.append(current)
+        self.previous = current
+
+    def add(self, current: str) -> None:
+        previous = self.previous
+        prev_norm, cur_norm = _normalized(previous), _normalized(current)
+        if not cur_norm or cur_norm == prev_norm:
+            return
+        if prev_norm in cur_norm:
+            # STT re-sent a growing partial; the longer text supersedes it.
+            self._replace_previous(current)
+            return
+        if _near_duplicate(prev_norm, cur_norm):
+            if len(cur_norm) >= len(prev_norm):
+                self._replace_previous(current)
+            return
+        limit = min(len(previous), len(current), COMPARE_CHARS)
+        for size in range(limit, MIN_OVERLAP_CHARS - 1, -1):
+            if previous.endswith(current[:size]):
+                self.parts.append(current[size:])
+                self.previous = current
+                return
+        self.parts.append(" " + current)
+        self.previous = current
+
+
+def _apply_budget(segments: list[dict[str, Any]], max_tokens: int) -> tuple[list[dict[str, Any]], int]:
+    """Drop the oldest segments until the formatted transcript fits ``max_tokens``."""
+    kept: list[dict[str, Any]] = []
+    used = 0
+    for item in reversed(segments):
+        tokens = estimate_tokens(format_segments([item])) + 1
+        if kept and used + tokens > max_tokens:
+            break
+        kept.append(item)
+        used += tokens
+    kept.reverse()
+    return kept, len(segments) - len(kept)
+
+
+def compact_transcript(
+    transcript: list[dict[str, Any]],
+    max_tokens: Optional[int] = None,
+    kind: str = "prompt",
+) -> CompactionResult:
+    """Shrink a transcript before it is formatted into an LLM prompt.
+
+    Fillers are stripped, consecutive segments from the same speaker are merged
+    and near-duplicate or overlapping STT text is collapsed. When ``max_tokens``
+    is given the oldest segments are dropped so the most recent discussion fits.
+    """
+    original_tokens = estimate_tokens(format_segments(transcript))
+    segments: list[dict[str, Any]] = []
+    runs: list[_Run] = []
+    for item in transcript:
+        text = strip_fillers(str(item.get("text") or "")).strip()
+        if not text:
+            continue
+        speaker = item.get("speaker")
+        if segments and segments[-1].get("speaker") == speaker:
+            runs[-1].add(text)
+            continue
+        segments.append({**item, "text": text})
+        runs.append(_Run(text))
+    for segment, run in zip(segments, runs):
+        segment["text"] = run.text
+
+    omitted = 0
+    if max_tokens is not None and max_tokens > 0:
+        segments, omitted = _apply_budget(segments, max_tokens)
+        if omitted:
+            logger.warning(
+                "Dropped the %d oldest of %d %s transcript segments to fit %d tokens",
+                omitted,
+                len(segments) + omitted,
+                kind,
+                max_tokens,
+            )
+
+    result = CompactionResult(
+        segments=segments,
+        original_tokens=original_tokens,
+        compacted_tokens=estimate_tokens(format_segments(segments)),
+        omitted=omitted,
+    )
+    compression_ratio.observe(result.ratio, kind=kind)
+    tokens_removed.inc(max(0, original_tokens - result.compacted_tokens), kind=kind)
+    logger.debug(
+        "Compacted %s transcript %d -> %d tokens (ratio %.2f, omitted %d segments)",
+        kind,
+        original_tokens,
+        result.compacted_tokens,
+        result.ratio,
+        omitted,
+    )
+    return result
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, func, literal, literal_column, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Meeting, Transcript, tsvector_sql
+from .text_search import contains, fts_keys, fts_match, fts_table, highlight, search_terms, split_terms
+
+_fts = fts_table("transcripts")
+_fts_keys = fts_keys("transcripts")
+# Same expression as ix_transcripts_text_tsv so Postgres can use the index.
+_tsvector = literal_column(tsvector_sql("transcripts.text"))
+
+
+@dataclass
+class SearchHit:
+    id: UUID
+    meeting_id: UUID
+    meeting_title: str
+    meeting_date: date
+    speaker: str
+    text: str
+    timestamp: str
+    score: float
+    highlight: str
+
+
+def _score_expression(dialect: str, query: str, indexed: list[str]):
+    if dialect == "sqlite":
+        if not indexed:
+            return literal(0.0)
+        # bm25() is lower-is-better; negate it so every dialect sorts by score descending.
+        return -func.bm25(literal_column("transcripts_fts"))
+    if dialect == "postgresql":
+        tsquery = func.websearch_to_tsquery("simple", query)
+        return func.ts_rank(_tsvector, tsquery) + func.similarity(
+            Transcript.text, query
+        )
+    return literal(0.0)
+
+
+def _base_query(dialect: str, team_id: UUID, query: str):
+    terms = search_terms(query)
+    indexed, short = split_terms(terms)
+    score = _score_expression(dialect, query, indexed).label("score")
+
+    stmt = select(
+        Transcript.id,
+        Transcript.meeting_id,
+        Transcript.speaker,
+        Transcript.text,
+        Transcript.timestamp,
+        Meeting.title.label("meeting_title"),
+        Meeting.date.label("meeting_date"),
+        score,
+    )
+    conditions = [Meeting.team_id == team_id]
+
+    if dialect == "sqlite" and indexed:
+        stmt = (
+            stmt.select_from(_fts)
+            .join(_fts_keys, _fts_keys.c.docid == _fts.c.rowid)
+            .join(Transcript, Transcript.id == _fts_keys.c.key)
+        )
+        conditions.append(fts_match("transcripts", indexed))
+        like_terms = short
+    elif dialect == "postgresql":
+        stmt = stmt.select_from(Transcript)
+        tsquery = func.websearch_to_tsquery("simple", query)
+        # Korean particles attach to words, so the trigram ILIKE branch catches
+        # substrings that the 'simple' tsvector does not tokenize separately.
+        conditions.append(
+            or_(
+                _tsvector.op("@@")(tsquery),
+                and_(*(contains(Transcript.text, term) for term in terms)),
+            )
+        )
+        like_terms = []
+    else:
+        stmt = stmt.select_from(Transcript)
+        like_terms = terms
+
+    for term in like_terms:
+        conditions.append(contains(Transcript.text, term))
+
+    stmt = stmt.join(Meeting, Meeting.id == Transcript.meeting_id).where(*conditions)
+    return stmt, terms
+
+
+async def count_archived_meetings(db: AsyncSession, team_id: UUID) -> int:
+    """Team meetings whose transcript moved to cold storage and is not searched."""
+    return await db.scalar(
+        select(func.count(Meeting.id)).where(Meeting.team_id == team_id, Meeting.transcript_archive.is_not(None))
+    ) or 0
+
+
+async def search_transcripts(
+    db: AsyncSession,
+    team_id: UUID,
+    query: str,
+    limit: int,
+    after: Optional[dict[str, Any]] = None,
+) -> tuple[list[SearchHit], Optional[dict[str, Any]]]:
+    """Return ranked hits for ``query`` within a team and the keyset for the next page.
+
+    Hits are ordered by score descending, then id, so ``after`` (the last hit's
+    score and id) resumes exactly where the previous page stopped.
+    """
+    dialect = db.get_bind().dialect.name
+    base, terms = _base_query(dialect, team_id, query)
+    ranked = base.subquery()
+
+    stmt = select(ranked)
+    if after is not None:
+        last_score = float(after["score"])
+        last_id = UUID(str(after["id"]))
+        stmt = stmt.where(
+            or_(ranked.c.score < last_score, and_(ranked.c.score == last_score, ranked.c.id > last_id))
+        )
+    stmt = stmt.order_by(ranked.c.score.desc(), ranked.c.id.asc()).limit(limit + 1)
+
+    rows = (await db.execute(stmt)).all()
+    hits = [
+        SearchHit(
+            id=row.id,
+            meeting_id=row.meeting_id,
+            meeting_title=row.meeting_title,
+            meeting_date=row.meeting_date,
+            speaker=row.speaker,
+            text=row.text,
+            timestamp=row.timestamp,
+            score=float(row.score or 0.0),
+            highlight=highlight(row.text, terms),
+        )
+        for row in rows[:limit]
+    ]
+    next_after = None
+    if len(rows) > limit and hits:
+        next_after = {"score": hits[-1].score, "id": str(hits[-1].id)}
+    return hits, next_after
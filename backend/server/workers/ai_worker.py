@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from contextlib import suppress
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import and_, or_, select, update
+
+from .. import metrics
+from ..config import (
+    AI_COMBINED_COMPLETION,
+    AI_JOB_VISIBILITY_TIMEOUT_SECONDS,
+    AI_ROLLING_SUMMARY_SETTLE_MS,
+    AI_WORKER_CONCURRENCY,
+)
+from ..db import AsyncSessionLocal, configure_engines
+from ..models import ActionItem, Meeting, Transcript
+from ..redis import get_redis, meeting_channel, serialize_message
+from ..services.action_item_counts import adjust_action_items_count
+from ..services.ai_jobs import (
+    JOB_MEETING_COMPLETION,
+    JOB_ROLLING_SUMMARY,
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    STATUS_RUNNING,
+    ack_job,
+    claim_job,
+    requeue_stale_jobs,
+    touch_job,
+    update_job,
+)
+from ..services.bulk_write import action_item_row, bulk_insert_returning
+from ..services.llm import get_llm_service
+from ..services.llm_cache import (
+    cached_extract_action_items,
+    cached_summarize,
+    cached_summarize_and_extract,
+)
+from ..services.rolling_summary import (
+    begin_fold,
+    decode_cursor,
+    encode_cursor,
+    fold_lock,
+    get_rolling_state,
+    save_rolling_state,
+)
+from ..services.transcript_archive import load_transcript
+
+logger = logging.getLogger("ai_worker")
+logging.basicConfig(level=logging.INFO)
+
+METRICS_PUSH_INTERVAL = 15.0
+QUEUE_POLL_TIMEOUT = 5
+REAP_INTERVAL = 30.0
+
+job_duration = metrics.histogram("ai_job_duration_seconds", "Time spent processing an AI job")
+jobs_processed = metrics.counter("ai_jobs_total", "AI jobs processed, labelled by type and status")
+jobs_requeued = metrics.counter("ai_jobs_requeued_total", "Claimed AI jobs put back on the queue after their worker stopped")
+
+
+async def _load_transcript(session, meeting: Meeting) -> list[dict[str, Any]]:
+    return [
+        {"speaker": t.speaker, "text": t.text, "timestamp": t.timestamp}
+        for t in await load_transcript(session, meeting)
+    ]
+
+
+async def process_meeting_completion(job_id: str, meeting_id: UUID) -> None:
+    """Summarize a completed meeting and extract its action items."""
+    async with AsyncSessionLocal() as session:
+        meeting = await session.get(Meeting, meeting_id)
+        if meeting is None:
+            raise LookupError(f"Meeting {meeting_id} not found")
+        transcript = await _load_transcript(session, meeting)
+
+    if not transcript:
+        return
+
+    llm_service = get_llm_service()
+    if AI_COMBINED_COMPLETION:
+        (summary, suggestions), _ = await cached_summarize_and_extract(llm_service, transcript)
+    else:
+        (summary, _), (suggestions, _) = await asyncio.gather(
+            cached_summarize(llm_service, transcript),
+            cached_extract_action_items(llm_service, transcript),
+        )
+
+    now = datetime.utcnow()
+    async with AsyncSessionLocal() as session:
+        # Claim the results for this job in the same transaction, so a job
+        # redelivered after a crash past this commit does not add them twice.
+        claimed = await session.execute(
+            update(Meeting)
+            .where(
+                Meeting.id == meeting_id,
+                or_(Meeting.completion_job_id.is_(None), Meeting.completion_job_id != job_id),
+            )
+            .values(summary=summary, updated_at=now, completion_job_id=job_id)
+            .execution_options(synchronize_session=False)
+        )
+        if not claimed.rowcount:
+            if await session.get(Meeting, meeting_id) is None:
+                raise LookupError(f"Meeting {meeting_id} not found")
+            logger.info("Job %s already applied to meeting %s, skipping", job_id, meeting_id)
+            return
+        created = await bulk_insert_returning(
+            session,
+            ActionItem,
+            [action_item_row(meeting_id, suggestion, now) for suggestion in suggestions or []],
+        )
+        await adjust_action_items_count(session, meeting_id, len(created))
+        await session.commit()
+
+    redis = get_redis()
+    channel = meeting_channel(meeting_id)
+    await redis.publish(
+        channel,
+        serialize_message(
+            "summary_update",
+            {"meetingId": str(meeting_id), "jobId": job_id, "summary": summary},
+        ),
+    )
+    await redis.publish(
+        channel,
+        serialize_message(
+            "action_items_update",
+            {
+                "meetingId": str(meeting_id),
+                "jobId": job_id,
+                "actionItems": [
+                    {
+                        "id": str(item.id),
+                        "meetingId": str(item.meeting_id),
+                        "type": item.type,
+                        "assignee": item.assignee,
+                        "content": item.content,
+                        "status": item.status,
+                        "dueDate": item.due_date.isoformat() if item.due_date else None,
+                    }
+                    for item in created
+                ],
+            },
+        ),
+    )
+
+
+async def process_rolling_summary(job_id: str, meeting_id: UUID) -> None:
+    """Fold transcript segments added since the last rolling summary into it.
+
+    Folds of one meeting run under a Redis lock and save with a compare-and-set
+    on the cursor. Segments are read in ``(created_at, id)`` order and only up
+    to ``AI_ROLLING_SUMMARY_SETTLE_MS`` ago, so a segment committed slightly
+    after a newer one is still ahead of the cursor when it is folded.
+    """
+    async with fold_lock(meeting_id):
+        await begin_fold(meeting_id)
+        state = await get_rolling_state(meeting_id)
+        stored_cursor = state.get("cursor") or ""
+        cursor = decode_cursor(stored_cursor)
+
+        settled = datetime.utcnow() - timedelta(milliseconds=AI_ROLLING_SUMMARY_SETTLE_MS)
+        stmt = select(Transcript).where(Transcript.meeting_id == meeting_id, Transcript.created_at <= settled)
+        if cursor:
+            created_at, last_id = cursor
+            if last_id is None:
+                stmt = stmt.where(Transcript.created_at > created_at)
+            else:
+                stmt = stmt.where(
+                    or_(
+                        Transcript.created_at > created_at,
+                        and_(Transcript.created_at == created_at, Transcript.id > last_id),
+                    )
+                )
+        async with AsyncSessionLocal() as session:
+            res = await session.execute(stmt.order_by(Transcript.created_at.asc(), Transcript.id.asc()))
+            rows = res.scalars().all()
+
+        previous = state.get("summary") or ""
+        segments = int(state.get("segments") or 0)
+        if rows:
+            # An LLM outage fails the job rather than saving a degraded fold, so the cursor stays put.
+            summary = await get_llm_service().fold_summary(
+                previous,
+                [{"speaker": row.speaker, "text": row.text, "timestamp": row.timestamp} for row in rows],
+                fallback=False,
+            )
+            segments += len(rows)
+            saved = await save_rolling_state(
+                meeting_id,
+                summary,
+                encode_cursor(rows[-1].created_at, rows[-1].id),
+                segments,
+                expected_cursor=stored_cursor,
+            )
+            if not saved:
+                logger.warning("Rolling summary of meeting %s advanced by another job; dropping fold", meeting_id)
+                return
+        elif previous:
+            summary = previous
+        else:
+            return
+
+    await get_redis().publish(
+        meeting_channel(meeting_id),
+        serialize_message(
+            "summary_update",
+            {
+                "meetingId": str(meeting_id),
+                "jobId": job_id,
+                "summary": summary,
+                "rolling": True,
+                "segments": segments,
+            },
+        ),
+    )
+
+
+HANDLERS = {
+    JOB_MEETING_COMPLETION: process_meeting_completion,
+    JOB_ROLLING_SUMMARY: process_rolling_summary,
+}
+
+
+async def _keep_alive(job_id: str) -> None:
+    """Touch a running job well within the visibility timeout so it is not requeued."""
+    interval = max(1.0, AI_JOB_VISIBILITY_TIMEOUT_SECONDS / 3)
+    while True:
+        await asyncio.sleep(interval)
+        with suppress(Exception):
+            await touch_job(job_id)
+
+
+async def handle_job(message: dict[str, Any]) -> None:
+    job_id = str(message.get("jobId") or "")
+    job_type = str(message.get("type") or "")
+    handler = HANDLERS.get(job_type)
+    if not job_id or handler is None:
+        logger.warning("Ignoring unknown AI job: %s", message)
+        return
+
+    await update_job(job_id, STATUS_RUNNING)
+    started = time.perf_counter()
+    heartbeat = asyncio.create_task(_keep_alive(job_id))
+    try:
+        await handler(job_id, UUID(str(message.get("meetingId"))))
+    except Exception as exc:
+        logger.exception("AI job %s (%s) failed: %s", job_id, job_type, exc)
+        jobs_processed.inc(type=job_type, status=STATUS_FAILED)
+        await update_job(job_id, STATUS_FAILED, error=str(exc))
+        return
+    finally:
+        heartbeat.cancel()
+        job_duration.observe(time.perf_counter() - started, type=job_type)
+    jobs_processed.inc(type=job_type, status=STATUS_COMPLETED)
+    await update_job(job_id, STATUS_COMPLETED)
+
+
+async def run_worker() -> None:
+    logger.info("AI worker started. Concurrency %s", AI_WORKER_CONCURRENCY)
+    semaphore = asyncio.Semaphore(max(1, AI_WORKER_CONCURRENCY))
+    tasks: set[asyncio.Task] = set()
+
+    async def run_one(raw: str, message: dict[str, Any]) -> None:
+        try:
+            await handle_job(message)
+            await ack_job(raw)
+        finally:
+            semaphore.release()
+
+    last_metrics_push = 0.0
+    last_reap = 0.0
+    while True:
+        if time.monotonic() - last_metrics_push >= METRICS_PUSH_INTERVAL:
+            last_metrics_push = time.monotonic()
+            with suppress(Exception):
+                await metrics.push_snapshot("ai_worker")
+        if time.monotonic() - last_reap >= REAP_INTERVAL:
+            last_reap = time.monotonic()
+            try:
+                requeued = await requeue_stale_jobs()
+            except Exception as exc:
+                logger.warning("Requeueing stale AI jobs failed: %s", exc)
+            else:
+                if requeued:
+                    logger.warning("Requeued %d AI jobs abandoned by their worker", requeued)
+                    jobs_requeued.inc(requeued)
+
+        await semaphore.acquire()
+        raw = await claim_job(QUEUE_POLL_TIMEOUT)
+        if raw is None:
+            semaphore.release()
+            continue
+        try:
+            message = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.warning("Invalid AI job payload: %s", raw[:80])
+            await ack_job(raw)
+            semaphore.release()
+            continue
+        task = asyncio.create_task(run_one(raw, message))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+
+if __name__ == "__main__":
+    configure_engines("ai")
+    try:
+        asyncio.run(run_worker())
+    except KeyboardInterrupt:
+        logger.info("AI worker stopped.")
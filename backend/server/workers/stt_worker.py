@@ -4,32 +4,194 @@ import asyncio
 import base64
 import json
 import logging
+import time
 import uuid
-from datetime import datetime
-from typing import Any, Optional
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
 from uuid import UUID
 
 from contextlib import suppress
+
 from google.api_core.exceptions import GoogleAPIError
 from google.cloud import speech
 
-from ..config import STT_LANGUAGE, STT_POLL_INTERVAL
-from ..db import AsyncSessionLocal
+from .. import metrics
+from ..config import (
+    STT_INTERIM_RESULTS,
+    STT_LANGUAGE,
+    STT_MIX_FRAME_MS,
+    STT_MIX_JITTER_MS,
+    STT_PARTIAL_INTERVAL_MS,
+    STT_POLL_INTERVAL,
+    STT_PREWARM_IDLE_SECONDS,
+    STT_REPLAY_SECONDS,
+    STT_SEAM_WINDOW_SECONDS,
+    STT_SILENCE_RMS_THRESHOLD,
+    STT_STREAM_ROTATE_SECONDS,
+)
+from ..db import AsyncSessionLocal, configure_engines
 from ..models import Meeting, Transcript, User
-from ..redis import get_redis, meeting_channel, serialize_message
+from ..redis import get_redis, meeting_channel, serialize_message, stt_control_key
+from ..services.audio_mixer import AudioMixer
+from ..services.rolling_summary import note_new_segment
 
 logger = logging.getLogger("stt_worker")
 logging.basicConfig(level=logging.INFO)
 
+METRICS_PUSH_INTERVAL = 15.0
+SAMPLE_RATE = 16000
+BYTES_PER_SECOND = SAMPLE_RATE * 2
+RESTART_BACKOFF_INITIAL = 0.5
+RESTART_BACKOFF_MAX = 10.0
+MIN_SEAM_OVERLAP_WORDS = 2
+_SEAM_PUNCTUATION = ".,!?…~"
+
+time_to_first_text = metrics.histogram(
+    "stt_time_to_first_text_seconds",
+    "Time from the first audio of an utterance to the first text published for it",
+)
+first_segment_latency = metrics.histogram(
+    "stt_first_segment_latency_seconds",
+    "Time from the first audio chunk of a session to its first final transcript",
+)
+prewarmed_sessions = metrics.counter(
+    "stt_prewarmed_sessions_total",
+    "Streaming sessions opened ahead of the first audio chunk",
+)
+prewarm_released = metrics.counter(
+    "stt_prewarm_released_total",
+    "Prewarmed sessions released after staying idle",
+)
+stream_restarts = metrics.counter(
+    "stt_stream_restarts_total",
+    "Recognition streams reopened, labelled by reason (rotation, ended, error)",
+)
+seam_duplicates = metrics.counter(
+    "stt_seam_duplicates_total",
+    "Final results dropped or trimmed because they repeated text across a stream seam",
+)
+partials_published = metrics.counter(
+    "stt_partials_published_total",
+    "Interim transcript events published after coalescing",
+)
+partials_coalesced = metrics.counter(
+    "stt_partials_coalesced_total",
+    "Interim results replaced by a newer one before publishing",
+)
+
+
+class PartialCoalescer:
+    """Publish at most one interim result per speaker every ``interval`` seconds.
+
+    Newer partials for a speaker overwrite older pending ones, so a burst of
+    interim results collapses into the latest text.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        publish: Callable[[dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        self.interval = interval
+        self._publish = publish
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def offer(self, speaker: str, data: dict[str, Any]) -> None:
+        if speaker in self._pending:
+            partials_coalesced.inc()
+        self._pending[speaker] = data
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_loop())
+
+    def discard(self, speaker: str) -> None:
+        """Drop a pending partial once the final result for it is known."""
+        self._pending.pop(speaker, None)
+
+    async def close(self) -> None:
+        self._pending.clear()
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _flush_loop(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.interval)
+            batch, self._pending = self._pending, {}
+            for data in batch.values():
+                try:
+                    await self._publish(data)
+                    partials_published.inc()
+                except Exception as exc:
+                    logger.warning("Failed to publish partial transcript: %s", exc)
+
+
+def _strip_seam_overlap(text: str, recent: list[str]) -> Optional[str]:
+    """Remove words of a replayed final that the previous stream already emitted.
+
+    Only called for finals whose audio starts inside the replayed span, so the
+    new stream re-recognizes the tail of the last utterance. A final made only
+    of a recent final's trailing words is dropped, and one that starts with at
+    least ``MIN_SEAM_OVERLAP_WORDS`` of them keeps only the new words.
+    """
+    words = text.split()
+    if not words:
+        return None
+    keys = [word.strip(_SEAM_PUNCTUATION).lower() for word in words]
+    for previous in reversed(recent):
+        prev = [word.strip(_SEAM_PUNCTUATION).lower() for word in previous.split()]
+        for size in range(min(len(prev), len(keys)), 0, -1):
+            if prev[-size:] != keys[:size]:
+                continue
+            if size == len(keys):
+                return None
+            if size >= MIN_SEAM_OVERLAP_WORDS:
+                return " ".join(words[size:])
+            break
+    return " ".join(words)
+
+
+@dataclass
+class _StreamState:
+    """Bookkeeping for one recognition stream between rotations."""
+
+    replay_seconds: float = 0.0
+    audio: int = 0
+    # Stream offset where the last final ended, i.e. where the next one starts.
+    final_end: float = 0.0
+
 
 class StreamingSession:
     """Manage a streaming STT session per meeting."""
 
-    def __init__(self, meeting_id: UUID, language_code: str = "ko-KR") -> None:
+    def __init__(
+        self,
+        meeting_id: UUID,
+        language_code: str = "ko-KR",
+        interim_results: bool = STT_INTERIM_RESULTS,
+        prewarmed: bool = False,
+    ) -> None:
         self.meeting_id = meeting_id
         self.language_code = language_code
+        self.interim_results = interim_results
+        self.prewarmed = prewarmed
+        self.created_at = time.monotonic()
+        self._first_audio_at: Optional[float] = None
+        self._first_segment_observed = False
         self._audio_queue: asyncio.Queue[Optional[dict[str, Any]]] = asyncio.Queue()
         self._responses_task: Optional[asyncio.Task] = None
+        self._draining: set[asyncio.Task] = set()
+        self._closed = False
+        self.rotate_seconds = STT_STREAM_ROTATE_SECONDS
+        self._replay: deque[bytes] = deque()
+        self._replay_bytes = 0
+        self._replay_limit = int(BYTES_PER_SECOND * STT_REPLAY_SECONDS)
+        self._recent_finals: deque[str] = deque(maxlen=5)
+        self._pending_get: Optional[asyncio.Future] = None
         self._client = speech.SpeechAsyncClient()
         self._config = speech.RecognitionConfig(
             encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
@@ -40,55 +202,205 @@ class StreamingSession:
         )
         self._streaming_config = speech.StreamingRecognitionConfig(
             config=self._config,
-            interim_results=False,
+            interim_results=self.interim_results,
             single_utterance=False,
         )
         self._last_meta: dict[str, Any] = {}
+        self._participant_meta: dict[str, dict[str, Any]] = {}
+        self._speaker_energy: dict[str, float] = {}
+        self._speaker_names: dict[str, str] = {}
+        self._utterance_started_at: Optional[float] = None
+        self._first_text_seen = False
+        self._partials = PartialCoalescer(
+            STT_PARTIAL_INTERVAL_MS / 1000.0, self._publish_partial
+        )
 
     async def start(self) -> None:
-        if self._responses_task:
+        if self._responses_task and not self._responses_task.done():
             return
         self._responses_task = asyncio.create_task(self._run())
 
+    async def warm(self, timeout: float = 5.0) -> None:
+        """Connect the gRPC channel before audio arrives.
+
+        The stream itself is opened by the first ``enqueue``: the provider
+        closes a streaming call that sends no audio for about ten seconds.
+        """
+        channel = getattr(self._client.transport, "grpc_channel", None)
+        if channel is None:
+            return
+        try:
+            await asyncio.wait_for(channel.channel_ready(), timeout=timeout)
+        except (asyncio.TimeoutError, Exception) as exc:
+            logger.warning("STT channel prewarm failed for meeting %s: %s", self.meeting_id, exc)
+
+    def is_idle_prewarm(self, idle_seconds: float) -> bool:
+        return (
+            self.prewarmed
+            and self._first_audio_at is None
+            and time.monotonic() - self.created_at > idle_seconds
+        )
+
     async def stop(self) -> None:
+        self._closed = True
         await self._audio_queue.put(None)
+        await self._partials.close()
+        tasks = list(self._draining)
         if self._responses_task:
-            self._responses_task.cancel()
+            tasks.append(self._responses_task)
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
             with suppress(asyncio.CancelledError):
-                await self._responses_task
-            self._responses_task = None
-
-    async def enqueue(self, audio_bytes: bytes, meta: dict[str, Any]) -> None:
+                await task
+        self._draining.clear()
+        self._responses_task = None
+        if self._pending_get is not None:
+            self._pending_get.cancel()
+            self._pending_get = None
+
+    async def enqueue(
+        self,
+        audio_bytes: bytes,
+        meta: dict[str, Any],
+        energy: Optional[dict[str, float]] = None,
+    ) -> None:
         if not audio_bytes:
             return
-        self._last_meta = meta
+        voiced = energy is None or bool(energy)
+        if meta:
+            self._last_meta = meta
+        for participant_id, value in (energy or {}).items():
+            self._speaker_energy[participant_id] = self._speaker_energy.get(participant_id, 0.0) + value
+        if energy and meta:
+            self._participant_meta[max(energy, key=energy.get)] = meta
+        if self._first_audio_at is None and voiced:
+            self._first_audio_at = time.monotonic()
+        if self._responses_task is None or self._responses_task.done():
+            # The stream may have been closed by the provider while idle.
+            await self.start()
+        if self._utterance_started_at is None and voiced:
+            self._utterance_started_at = time.monotonic()
+            self._first_text_seen = False
         await self._audio_queue.put({"audio": audio_bytes, "meta": meta})
 
-    async def _request_stream(self):
-        # First yield config, then audio chunks.
+    def _remember_audio(self, audio_bytes: bytes) -> None:
+        self._replay.append(audio_bytes)
+        self._replay_bytes += len(audio_bytes)
+        while self._replay and self._replay_bytes - len(self._replay[0]) >= self._replay_limit:
+            self._replay_bytes -= len(self._replay.popleft())
+
+    async def _next_audio(self, timeout: float) -> tuple[bool, Optional[dict[str, Any]]]:
+        """Wait up to ``timeout`` for queued audio without losing it to the timeout.
+
+        The pending ``get`` outlives a timed-out wait and the stream that started
+        it, so an item taken off the queue is always delivered to the next call.
+        """
+        if self._pending_get is None:
+            self._pending_get = asyncio.ensure_future(self._audio_queue.get())
+        done, _ = await asyncio.wait({self._pending_get}, timeout=timeout)
+        if not done:
+            return False, None
+        item = self._pending_get.result()
+        self._pending_get = None
+        return True, item
+
+    async def _request_stream(self, replay: list[bytes], rotate: asyncio.Event, stream: _StreamState):
+        # First yield config, then the replayed tail of the previous stream, then live audio.
         yield speech.StreamingRecognizeRequest(streaming_config=self._streaming_config)
+        for audio_bytes in replay:
+            yield speech.StreamingRecognizeRequest(audio_content=audio_bytes)
+        deadline = time.monotonic() + self.rotate_seconds
         while True:
-            item = await self._audio_queue.get()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # Half-close this stream; the caller opens the next one right away.
+                rotate.set()
+                return
+            ready, item = await self._next_audio(remaining)
+            if not ready:
+                continue
             if item is None:
-                break
+                self._closed = True
+                return
             audio_bytes = item.get("audio") or b""
             if not audio_bytes:
                 continue
+            stream.audio += 1
+            self._remember_audio(audio_bytes)
             yield speech.StreamingRecognizeRequest(audio_content=audio_bytes)
 
+    async def _run_stream(self, replay: list[bytes], rotate: asyncio.Event, stream: _StreamState) -> None:
+        responses = await self._client.streaming_recognize(
+            requests=self._request_stream(replay, rotate, stream)
+        )
+        async for response in responses:
+            await self._handle_response(response, stream)
+
     async def _run(self) -> None:
-        try:
-            responses = await self._client.streaming_recognize(
-                requests=self._request_stream()
-            )
-            async for response in responses:
-                await self._handle_response(response)
-        except GoogleAPIError as exc:
-            logger.error("Streaming STT failed for meeting %s: %s", self.meeting_id, exc)
-        except Exception as exc:
-            logger.exception("Unexpected error in streaming session %s: %s", self.meeting_id, exc)
+        backoff = RESTART_BACKOFF_INITIAL
+        replay: list[bytes] = []
+        while not self._closed:
+            rotate = asyncio.Event()
+            stream = _StreamState(replay_seconds=sum(len(chunk) for chunk in replay) / float(BYTES_PER_SECOND))
+            stream_task = asyncio.create_task(self._run_stream(replay, rotate, stream))
+            rotate_wait = asyncio.create_task(rotate.wait())
+            try:
+                await asyncio.wait({stream_task, rotate_wait}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                rotate_wait.cancel()
+
+            if rotate.is_set() and not stream_task.done():
+                # Let the half-closed stream deliver its last finals while the next one starts.
+                self._draining.add(stream_task)
+                stream_task.add_done_callback(self._draining.discard)
+                stream_task.add_done_callback(self._log_stream_error)
+                replay = list(self._replay)
+                stream_restarts.inc(reason="rotation")
+                backoff = RESTART_BACKOFF_INITIAL
+                continue
+
+            try:
+                await stream_task
+            except asyncio.CancelledError:
+                raise
+            except GoogleAPIError as exc:
+                if self._closed or stream.audio == 0:
+                    # Provider timed out an idle stream; enqueue() reopens it.
+                    break
+                logger.warning(
+                    "Streaming STT failed for meeting %s, reopening in %.1fs: %s",
+                    self.meeting_id,
+                    backoff,
+                    exc,
+                )
+                stream_restarts.inc(reason="error")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, RESTART_BACKOFF_MAX)
+                replay = list(self._replay)
+                continue
+            except Exception as exc:
+                logger.exception("Unexpected error in streaming session %s: %s", self.meeting_id, exc)
+                break
 
-    async def _handle_response(self, response: speech.StreamingRecognizeResponse) -> None:
+            if rotate.is_set():
+                replay = list(self._replay)
+                stream_restarts.inc(reason="rotation")
+                continue
+            if self._closed or stream.audio == 0:
+                # Closed, or the provider ended an idle stream; enqueue() reopens it.
+                break
+            stream_restarts.inc(reason="ended")
+            replay = list(self._replay)
+
+    def _log_stream_error(self, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.warning("Rotated STT stream for meeting %s ended with error: %s", self.meeting_id, exc)
+
+    async def _handle_response(self, response: speech.StreamingRecognizeResponse, stream: _StreamState) -> None:
         if not response.results:
             return
         for result in response.results:
@@ -97,14 +409,104 @@ class StreamingSession:
             text = (result.alternatives[0].transcript or "").strip()
             if not text:
                 continue
+            self._observe_first_text("final" if result.is_final else "partial")
             if not result.is_final:
-                # Skip interim results to avoid duplicates.
+                # Interim results are only published, never persisted.
+                if self.interim_results:
+                    await self._offer_partial(text, result.stability)
                 continue
-            await self._persist_transcript(text)
+            self._utterance_started_at = None
+            started = stream.final_end
+            end_time = getattr(result, "result_end_time", None)
+            if end_time is not None:
+                stream.final_end = end_time.total_seconds()
+            if started < stream.replay_seconds:
+                # This final covers replayed audio; the rotated stream may still be
+                # delivering the original, so let it finish before comparing.
+                if self._draining:
+                    await asyncio.wait(set(self._draining), timeout=STT_SEAM_WINDOW_SECONDS)
+                deduped = _strip_seam_overlap(text, list(self._recent_finals))
+                if deduped != " ".join(text.split()):
+                    seam_duplicates.inc()
+                if not deduped:
+                    continue
+                text = deduped
+            self._recent_finals.append(text)
+            self._observe_first_segment()
+            meta = self._utterance_meta()
+            self._speaker_energy.clear()
+            await self._persist_transcript(text, meta)
+
+    def _observe_first_segment(self) -> None:
+        if self._first_segment_observed or self._first_audio_at is None:
+            return
+        self._first_segment_observed = True
+        first_segment_latency.observe(
+            time.monotonic() - self._first_audio_at,
+            prewarmed=str(self.prewarmed).lower(),
+        )
+
+    def _observe_first_text(self, kind: str) -> None:
+        if self._first_text_seen or self._utterance_started_at is None:
+            return
+        self._first_text_seen = True
+        time_to_first_text.observe(time.monotonic() - self._utterance_started_at, kind=kind)
 
-    async def _persist_transcript(self, text: str) -> None:
-        meta = self._last_meta
+    async def _resolve_speaker(self, meta: dict[str, Any]) -> str:
         speaker = meta.get("speaker") or meta.get("userName") or meta.get("userId") or "참여자"
+        user_id_val = meta.get("userId")
+        if not user_id_val:
+            return speaker
+        cached = self._speaker_names.get(str(user_id_val))
+        if cached:
+            return cached
+        try:
+            user_uuid = UUID(str(user_id_val))
+            async with AsyncSessionLocal() as session:
+                user = await session.get(User, user_uuid)
+            if user and user.name:
+                speaker = user.name
+            elif user and user.email:
+                speaker = user.email
+        except Exception:
+            return speaker
+        self._speaker_names[str(user_id_val)] = speaker
+        return speaker
+
+    def _utterance_meta(self) -> dict[str, Any]:
+        """Attribute the current utterance to the participant with the most energy."""
+        if self._speaker_energy:
+            participant_id = max(self._speaker_energy, key=self._speaker_energy.get)
+            meta = self._participant_meta.get(participant_id)
+            if meta:
+                return meta
+        return self._last_meta
+
+    async def _offer_partial(self, text: str, stability: float) -> None:
+        meta = self._utterance_meta()
+        speaker = await self._resolve_speaker(meta)
+        self._partials.offer(
+            speaker,
+            {
+                "speaker": speaker,
+                "text": text,
+                "stability": round(float(stability or 0.0), 3),
+                "timestamp": meta.get("timestamp")
+                or meta.get("receivedAt")
+                or datetime.utcnow().isoformat(),
+            },
+        )
+
+    async def _publish_partial(self, data: dict[str, Any]) -> None:
+        redis = get_redis()
+        await redis.publish(
+            meeting_channel(self.meeting_id),
+            serialize_message("transcript_partial", data),
+        )
+
+    async def _persist_transcript(self, text: str, meta: dict[str, Any]) -> None:
+        speaker = await self._resolve_speaker(meta)
+        self._partials.discard(speaker)
         timestamp = (
             meta.get("timestamp")
             or meta.get("receivedAt")
@@ -112,19 +514,6 @@ class StreamingSession:
         )
 
         async with AsyncSessionLocal() as session:
-            # Resolve speaker from userId if provided
-            user_id_val = meta.get("userId")
-            if user_id_val:
-                try:
-                    user_uuid = UUID(str(user_id_val))
-                    user = await session.get(User, user_uuid)
-                    if user and user.name:
-                        speaker = user.name
-                    elif user and user.email:
-                        speaker = user.email
-                except Exception:
-                    pass
-
             transcript = Transcript(
                 id=uuid.uuid4(),
                 meeting_id=self.meeting_id,
@@ -149,9 +538,14 @@ class StreamingSession:
                 },
             ),
         )
+        try:
+            await note_new_segment(self.meeting_id)
+        except Exception as exc:
+            logger.warning("Failed to schedule rolling summary for %s: %s", self.meeting_id, exc)
 
 
 sessions: dict[UUID, StreamingSession] = {}
+mixers: dict[UUID, AudioMixer] = {}
 
 
 def _get_session(meeting_id: UUID) -> StreamingSession:
@@ -163,6 +557,48 @@ def _get_session(meeting_id: UUID) -> StreamingSession:
     return session
 
 
+async def _prewarm_session(meeting_id: UUID) -> None:
+    if meeting_id in sessions:
+        return
+    if not await _is_meeting_active(meeting_id):
+        return
+    session = StreamingSession(meeting_id, language_code=STT_LANGUAGE, prewarmed=True)
+    sessions[meeting_id] = session
+    prewarmed_sessions.inc()
+    await session.warm()
+    logger.info("Prewarmed STT session for meeting %s", meeting_id)
+
+
+async def _drain_control(redis) -> None:
+    while True:
+        raw = await redis.lpop(stt_control_key())
+        if raw is None:
+            return
+        try:
+            message = json.loads(raw)
+            meeting_id = UUID(str((message.get("data") or {}).get("meetingId")))
+        except (json.JSONDecodeError, ValueError, AttributeError):
+            logger.warning("Invalid STT control message: %s", str(raw)[:80])
+            continue
+        if message.get("type") == "prewarm":
+            try:
+                await _prewarm_session(meeting_id)
+            except Exception as exc:
+                logger.exception("Failed to prewarm STT session %s: %s", meeting_id, exc)
+
+
+async def _release_idle_sessions() -> None:
+    idle = [
+        meeting_id
+        for meeting_id, session in sessions.items()
+        if session.is_idle_prewarm(STT_PREWARM_IDLE_SECONDS)
+    ]
+    for meeting_id in idle:
+        await _stop_session(meeting_id)
+        prewarm_released.inc()
+        logger.info("Released idle prewarmed STT session for meeting %s", meeting_id)
+
+
 async def _handle_payload(meeting_id: UUID, payload: dict[str, Any]) -> None:
     chunk_payload = payload.get("chunk")
     if not chunk_payload:
@@ -194,8 +630,53 @@ async def _handle_payload(meeting_id: UUID, payload: dict[str, Any]) -> None:
         "receivedAt": payload.get("receivedAt"),
         "userId": payload.get("userId"),
     }
-    session = _get_session(meeting_id)
-    await session.enqueue(audio_bytes, meta)
+    participant_id = str(meta["userId"] or meta["speaker"] or "unknown")
+    _get_mixer(meeting_id).push(
+        participant_id,
+        audio_bytes,
+        _arrival_seconds(payload.get("receivedAt")),
+        meta,
+    )
+
+
+def _get_mixer(meeting_id: UUID) -> AudioMixer:
+    mixer = mixers.get(meeting_id)
+    if mixer is None:
+        mixer = AudioMixer(
+            sample_rate=SAMPLE_RATE,
+            jitter_seconds=STT_MIX_JITTER_MS / 1000.0,
+            frame_seconds=STT_MIX_FRAME_MS / 1000.0,
+            silence_rms=STT_SILENCE_RMS_THRESHOLD,
+        )
+        mixers[meeting_id] = mixer
+    return mixer
+
+
+def _arrival_seconds(received_at: Any) -> float:
+    if isinstance(received_at, str):
+        try:
+            parsed = datetime.fromisoformat(received_at)
+        except ValueError:
+            return time.time()
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    return time.time()
+
+
+async def _pump_mixers() -> bool:
+    """Feed every meeting's mixed frames into its single recognition stream."""
+    pumped = False
+    now = time.time()
+    for meeting_id, mixer in list(mixers.items()):
+        frames = mixer.pop_ready(now)
+        if not frames:
+            continue
+        session = _get_session(meeting_id)
+        for frame in frames:
+            await session.enqueue(frame.audio, frame.meta, frame.energy)
+        pumped = True
+    return pumped
 
 
 async def _drain_queue(redis, key: str, meeting_id: UUID) -> bool:
@@ -224,6 +705,7 @@ async def _is_meeting_active(meeting_id: UUID) -> bool:
 
 
 async def _stop_session(meeting_id: UUID) -> None:
+    mixers.pop(meeting_id, None)
     session = sessions.pop(meeting_id, None)
     if session:
         await session.stop()
@@ -232,9 +714,17 @@ async def _stop_session(meeting_id: UUID) -> None:
 async def run_worker() -> None:
     logger.info("STT streaming worker started. Poll interval %ss", STT_POLL_INTERVAL)
 
+    last_metrics_push = 0.0
     while True:
         redis = get_redis()
         processed = False
+        if time.monotonic() - last_metrics_push >= METRICS_PUSH_INTERVAL:
+            last_metrics_push = time.monotonic()
+            with suppress(Exception):
+                await metrics.push_snapshot("stt_worker")
+
+        await _drain_control(redis)
+        await _release_idle_sessions()
         async for key in redis.scan_iter(match="meeting:*:audio"):
             parts = key.split(":")
             if len(parts) < 3:
@@ -255,11 +745,14 @@ async def run_worker() -> None:
             consumed = await _drain_queue(redis, key, meeting_id)
             processed = processed or consumed
 
+        await _pump_mixers()
+
         if not processed:
             await asyncio.sleep(STT_POLL_INTERVAL)
 
 
 if __name__ == "__main__":
+    configure_engines("worker")
     try:
         asyncio.run(run_worker())
     except KeyboardInterrupt:
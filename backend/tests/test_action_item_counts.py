@@ -0,0 +1,45 @@
+import asyncio
+import uuid
+from datetime import date, datetime, time
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.server import migrations
+from backend.server.models import ActionItem, Meeting, Team
+from backend.server.services.action_item_counts import adjust_action_items_count, recount_action_items
+from backend.server.services.bulk_write import action_item_row, bulk_insert_returning
+
+
+def test_counter_follows_writes_and_repair_fixes_drift(tmp_path) -> None:
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'counts.db'}")
+        await migrations.upgrade(engine)
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        team_id, meeting_id = uuid.uuid4(), uuid.uuid4()
+        async with sessions() as session:
+            session.add(Team(id=team_id, name="team", invite_code="COUNTS"))
+            session.add(Meeting(id=meeting_id, team_id=team_id, title="m", date=date(2024, 1, 1), start_time=time(10)))
+            await session.commit()
+
+            rows = [action_item_row(meeting_id, {"type": "task", "content": f"todo {n}"}, datetime(2024, 1, 1)) for n in range(3)]
+            created = await bulk_insert_returning(session, ActionItem, rows)
+            await adjust_action_items_count(session, meeting_id, len(created))
+            await session.commit()
+            after_insert = (await session.get(Meeting, meeting_id)).action_items_count
+
+            # A write path that forgot the counter leaves it stale until repaired.
+            await session.execute(delete(ActionItem).where(ActionItem.id == created[0].id))
+            await session.commit()
+            fixed = await recount_action_items(session)
+            await session.commit()
+            session.expire_all()
+            after_repair = (await session.get(Meeting, meeting_id)).action_items_count
+            clean = await recount_action_items(session)
+        await engine.dispose()
+        return after_insert, fixed, after_repair, clean
+
+    after_insert, fixed, after_repair, clean = asyncio.run(scenario())
+
+    assert after_insert == 3
+    assert (fixed, after_repair, clean) == (1, 2, 0)
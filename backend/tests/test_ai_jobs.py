@@ -0,0 +1,196 @@
+import asyncio
+import json
+import uuid
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.server import migrations
+from backend.server.models import ActionItem, Base, Meeting, Team, TeamMember, Transcript, User
+from backend.server.redis import ai_job_key, ai_job_processing_key, ai_job_queue_key
+from backend.server.routers import ai
+from backend.server.services import ai_jobs
+from backend.server.workers import ai_worker
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(ai_jobs, "get_redis", lambda: client)
+    return client
+
+
+def test_enqueue_job_records_status_and_queues_payload(client) -> None:
+    meeting_id = uuid.uuid4()
+
+    async def scenario():
+        job_id = await ai_jobs.enqueue_job(ai_jobs.JOB_MEETING_COMPLETION, meeting_id)
+        return job_id, await ai_jobs.get_job(job_id), await client.lrange(ai_job_queue_key(), 0, -1)
+
+    job_id, job, queued = asyncio.run(scenario())
+
+    assert job["status"] == ai_jobs.STATUS_QUEUED
+    assert job["meetingId"] == str(meeting_id)
+    assert [json.loads(raw) for raw in queued] == [
+        {"jobId": job_id, "type": ai_jobs.JOB_MEETING_COMPLETION, "meetingId": str(meeting_id)}
+    ]
+
+
+def test_worker_dispatches_claimed_jobs_and_records_the_outcome(client, monkeypatch) -> None:
+    seen: list[uuid.UUID] = []
+
+    async def ok(job_id, meeting_id):
+        seen.append(meeting_id)
+
+    async def boom(job_id, meeting_id):
+        raise RuntimeError("provider exploded")
+
+    monkeypatch.setattr(ai_worker, "HANDLERS", {"ok": ok, "boom": boom})
+    meeting_id = uuid.uuid4()
+
+    async def scenario():
+        ids = [await ai_jobs.enqueue_job(job_type, meeting_id) for job_type in ("ok", "boom")]
+        for _ in ids:
+            raw = await ai_jobs.claim_job(1)
+            assert await client.lrange(ai_job_processing_key(), 0, -1) == [raw]
+            await ai_worker.handle_job(json.loads(raw))
+            await ai_jobs.ack_job(raw)
+        processing = await client.llen(ai_job_processing_key())
+        return [await ai_jobs.get_job(job_id) for job_id in ids], processing
+
+    (done, failed), processing = asyncio.run(scenario())
+
+    assert seen == [meeting_id]
+    assert done["status"] == ai_jobs.STATUS_COMPLETED
+    assert failed["status"] == ai_jobs.STATUS_FAILED
+    assert failed["error"] == "provider exploded"
+    assert processing == 0
+
+
+def test_abandoned_jobs_are_requeued_then_failed(client, monkeypatch) -> None:
+    monkeypatch.setattr(ai_jobs, "AI_JOB_MAX_ATTEMPTS", 2)
+    stale = (datetime.utcnow() - timedelta(hours=1)).isoformat()
+
+    async def abandon() -> None:
+        # A worker claims the job, marks it running and dies.
+        raw = await ai_jobs.claim_job(1)
+        job_id = json.loads(raw)["jobId"]
+        await ai_jobs.update_job(job_id, ai_jobs.STATUS_RUNNING)
+        await client.hset(ai_job_key(job_id), "updatedAt", stale)
+
+    async def scenario():
+        job_id = await ai_jobs.enqueue_job(ai_jobs.JOB_ROLLING_SUMMARY, uuid.uuid4())
+        # A claim that is still being worked on is left alone.
+        busy = await ai_jobs.claim_job(1)
+        assert await ai_jobs.requeue_stale_jobs() == 0
+        await ai_jobs.ack_job(busy)
+        await client.rpush(ai_job_queue_key(), busy)
+
+        await abandon()
+        first = await ai_jobs.requeue_stale_jobs()
+        requeued = await ai_jobs.get_job(job_id)
+        await abandon()
+        second = await ai_jobs.requeue_stale_jobs()
+        return (
+            first,
+            requeued,
+            second,
+            await ai_jobs.get_job(job_id),
+            await client.llen(ai_job_queue_key()),
+            await client.llen(ai_job_processing_key()),
+        )
+
+    first, requeued, second, final, queued, processing = asyncio.run(scenario())
+
+    assert first == 1
+    assert (requeued["status"], requeued["attempts"]) == (ai_jobs.STATUS_QUEUED, "1")
+    assert second == 0
+    assert final["status"] == ai_jobs.STATUS_FAILED
+    assert (queued, processing) == (0, 0)
+
+
+def test_redelivered_completion_job_applies_its_results_once(client, tmp_path, monkeypatch) -> None:
+    suggestions = [{"type": "task", "assignee": "민수", "content": "문서 정리"}, {"content": "배포"}]
+
+    async def summarize_and_extract(llm_service, transcript):
+        return ("요약", suggestions), False
+
+    monkeypatch.setattr(ai_worker, "get_redis", lambda: client)
+    monkeypatch.setattr(ai_worker, "get_llm_service", lambda: None)
+    monkeypatch.setattr(ai_worker, "AI_COMBINED_COMPLETION", True)
+    monkeypatch.setattr(ai_worker, "cached_summarize_and_extract", summarize_and_extract)
+    stale = (datetime.utcnow() - timedelta(hours=1)).isoformat()
+
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+        await migrations.upgrade(engine)
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        monkeypatch.setattr(ai_worker, "AsyncSessionLocal", sessions)
+        team = Team(id=uuid.uuid4(), name="팀", invite_code="REDELIVER")
+        meeting = Meeting(id=uuid.uuid4(), team_id=team.id, title="회의", date=date(2024, 5, 1), start_time=time(10))
+        async with sessions() as session:
+            session.add_all([team, meeting])
+            session.add(
+                Transcript(id=uuid.uuid4(), meeting_id=meeting.id, speaker="민수", text="문서 정리할게요", timestamp="00:01")
+            )
+            await session.commit()
+
+        job_id = await ai_jobs.enqueue_job(ai_jobs.JOB_MEETING_COMPLETION, meeting.id)
+        # The worker commits the results and dies before recording the outcome.
+        await ai_jobs.claim_job(1)
+        await ai_jobs.update_job(job_id, ai_jobs.STATUS_RUNNING)
+        await ai_worker.process_meeting_completion(job_id, meeting.id)
+        await client.hset(ai_job_key(job_id), "updatedAt", stale)
+
+        requeued = await ai_jobs.requeue_stale_jobs()
+        raw = await ai_jobs.claim_job(1)
+        await ai_worker.handle_job(json.loads(raw))
+        await ai_jobs.ack_job(raw)
+
+        async with sessions() as session:
+            items = await session.scalar(select(func.count(ActionItem.id)).where(ActionItem.meeting_id == meeting.id))
+            stored = await session.get(Meeting, meeting.id)
+        await engine.dispose()
+        return requeued, await ai_jobs.get_job(job_id), items, stored
+
+    requeued, job, items, stored = asyncio.run(scenario())
+
+    assert requeued == 1
+    assert job["status"] == ai_jobs.STATUS_COMPLETED
+    assert items == stored.action_items_count == len(suggestions)
+    assert (stored.summary, stored.completion_job_id) == ("요약", job["id"])
+
+
+def test_get_ai_job_returns_status_to_team_members_only(client) -> None:
+    async def scenario():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        member = User(id=uuid.uuid4(), email="a@example.com", name="민수", password_hash="x")
+        outsider = User(id=uuid.uuid4(), email="b@example.com", name="지은", password_hash="x")
+        team = Team(id=uuid.uuid4(), name="팀", invite_code="AIJOBS")
+        meeting = Meeting(id=uuid.uuid4(), team_id=team.id, title="회의", date=date(2024, 5, 1), start_time=time(10))
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            session.add_all([member, outsider, team, meeting])
+            session.add(TeamMember(id=uuid.uuid4(), team_id=team.id, user_id=member.id, role="owner"))
+            await session.commit()
+
+            job_id = await ai_jobs.enqueue_job(ai_jobs.JOB_MEETING_COMPLETION, meeting.id)
+            response = await ai.get_ai_job(job_id, db=session, current_user=member)
+            errors = []
+            for job, user in ((job_id, outsider), ("missing", member)):
+                with pytest.raises(HTTPException) as exc:
+                    await ai.get_ai_job(job, db=session, current_user=user)
+                errors.append(exc.value.status_code)
+        await engine.dispose()
+        return job_id, meeting.id, response, errors
+
+    job_id, meeting_id, response, errors = asyncio.run(scenario())
+
+    assert (response.id, response.meeting_id, response.status) == (job_id, meeting_id, ai_jobs.STATUS_QUEUED)
+    assert errors == [403, 404]
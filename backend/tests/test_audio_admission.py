@@ -0,0 +1,113 @@
+import asyncio
+import uuid
+
+import pytest
+
+from backend.server.redis import audio_rate_key, meeting_audio_key
+from backend.server.services import audio_admission
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def limits(monkeypatch):
+    def configure(user_rate=1.0, user_burst=3, meeting_rate=100.0, meeting_burst=100, max_len=0, policy="reject"):
+        monkeypatch.setattr(audio_admission, "AUDIO_USER_RATE_PER_SEC", user_rate)
+        monkeypatch.setattr(audio_admission, "AUDIO_USER_BURST", user_burst)
+        monkeypatch.setattr(audio_admission, "AUDIO_MEETING_RATE_PER_SEC", meeting_rate)
+        monkeypatch.setattr(audio_admission, "AUDIO_MEETING_BURST", meeting_burst)
+        monkeypatch.setattr(audio_admission, "AUDIO_QUEUE_MAX_LEN", max_len)
+        monkeypatch.setattr(audio_admission, "AUDIO_QUEUE_SHED_POLICY", policy)
+
+    return configure
+
+
+def _admit_all(client, meeting_id, users):
+    """Admit one chunk per user in order; returns the results and the queued chunks."""
+
+    async def scenario():
+        results = [
+            await audio_admission.admit_audio_chunk(client, meeting_id, user_id, f"chunk{n}")
+            for n, user_id in enumerate(users)
+        ]
+        return results, await client.lrange(meeting_audio_key(meeting_id), 0, -1)
+
+    return asyncio.run(scenario())
+
+
+def test_user_bucket_allows_a_burst_then_rejects_with_retry_after(limits) -> None:
+    limits(user_rate=2.0, user_burst=3)
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    meeting_id, user_id = uuid.uuid4(), uuid.uuid4()
+
+    results, queue = _admit_all(client, meeting_id, [user_id] * 4)
+
+    assert [r.reason for r in results] == ["ok", "ok", "ok", "user_rate"]
+    assert not results[-1].admitted
+    assert 0 < results[-1].retry_after_ms <= 500
+    assert queue == ["chunk0", "chunk1", "chunk2"]
+
+
+def test_user_bucket_refills_at_its_rate(limits) -> None:
+    limits(user_rate=2.0, user_burst=3)
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    meeting_id, user_id = uuid.uuid4(), uuid.uuid4()
+
+    def admit():
+        return audio_admission.admit_audio_chunk(client, meeting_id, user_id, "chunk")
+
+    async def scenario():
+        drained = [await admit() for _ in range(4)]
+        # Pretend a second passed: two tokens at 2/s, never more than the burst.
+        await client.hincrbyfloat(audio_rate_key("user", user_id), "ts", -1000)
+        refilled = [await admit() for _ in range(3)]
+        await client.hincrbyfloat(audio_rate_key("user", user_id), "ts", -60000)
+        capped = [await admit() for _ in range(4)]
+        return drained, refilled, capped
+
+    drained, refilled, capped = asyncio.run(scenario())
+
+    assert [r.admitted for r in drained] == [True, True, True, False]
+    assert [r.admitted for r in refilled] == [True, True, False]
+    assert [r.admitted for r in capped] == [True, True, True, False]
+
+
+def test_meeting_bucket_limits_all_participants_together(limits) -> None:
+    limits(user_burst=10, meeting_rate=1.0, meeting_burst=3)
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    meeting_id, first, second = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+
+    async def scenario():
+        results = [
+            await audio_admission.admit_audio_chunk(client, meeting_id, user_id, "chunk")
+            for user_id in (first, second, first, second)
+        ]
+        return results, await client.hget(audio_rate_key("user", second), "tokens")
+
+    results, user_tokens = asyncio.run(scenario())
+
+    assert [r.reason for r in results] == ["ok", "ok", "ok", "meeting_rate"]
+    # A chunk rejected by the meeting bucket does not spend the user's token.
+    assert float(user_tokens) == pytest.approx(9, abs=0.1)
+
+
+@pytest.mark.parametrize(
+    ("policy", "reasons", "queued"),
+    [
+        ("reject", ["ok", "ok", "queue_full"], ["chunk0", "chunk1"]),
+        ("drop_oldest", ["ok", "ok", "shed_oldest"], ["chunk1", "chunk2"]),
+    ],
+)
+def test_full_queue_follows_the_shed_policy(limits, policy, reasons, queued) -> None:
+    limits(user_burst=10, max_len=2, policy=policy)
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    meeting_id, user_id = uuid.uuid4(), uuid.uuid4()
+
+    results, queue = _admit_all(client, meeting_id, [user_id] * 3)
+
+    assert [r.reason for r in results] == reasons
+    assert queue == queued
+    if policy == "reject":
+        assert results[-1].retry_after_ms == audio_admission.AUDIO_QUEUE_RETRY_AFTER_MS
+    else:
+        assert results[-1].dropped == 1
@@ -0,0 +1,65 @@
+import numpy as np
+
+from backend.server.services.audio_mixer import AudioMixer
+
+
+def _pcm(amplitude: int, seconds: float, sample_rate: int = 16000) -> bytes:
+    return np.full(int(sample_rate * seconds), amplitude, dtype="<i2").tobytes()
+
+
+def test_mixer_sums_overlapping_participants_into_one_stream() -> None:
+    mixer = AudioMixer(jitter_seconds=0.2, frame_seconds=0.1)
+    mixer.push("a", _pcm(4000, 0.1), arrival=100.1)
+    mixer.push("b", _pcm(2000, 0.1), arrival=100.1)
+
+    assert mixer.pop_ready(now=100.25) == []
+
+    frames = mixer.pop_ready(now=100.3)
+    assert len(frames) == 1
+    mixed = np.frombuffer(frames[0].audio, dtype="<i2")
+    assert abs(int(mixed[0]) - 6000) <= 2
+    assert frames[0].speaker_id == "a"
+    assert frames[0].energy["a"] > frames[0].energy["b"]
+
+
+def test_mixer_normalizes_clipping_sum() -> None:
+    mixer = AudioMixer(jitter_seconds=0.0, frame_seconds=0.1)
+    mixer.push("a", _pcm(30000, 0.1), arrival=10.1)
+    mixer.push("b", _pcm(30000, 0.1), arrival=10.1)
+
+    frames = mixer.flush()
+    mixed = np.frombuffer(frames[0].audio, dtype="<i2")
+    assert int(mixed.max()) <= 32767
+    assert int(mixed.max()) > 30000
+
+
+def test_mixer_snaps_contiguous_chunks_from_same_participant() -> None:
+    mixer = AudioMixer(jitter_seconds=0.0, frame_seconds=0.1)
+    mixer.push("a", _pcm(1000, 0.1), arrival=5.1)
+    # Arrives 50ms late but continues the same talk spurt.
+    mixer.push("a", _pcm(1000, 0.1), arrival=5.25)
+
+    frames = mixer.flush()
+    assert [frame.speaker_id for frame in frames] == ["a", "a"]
+
+
+def test_quiet_participants_are_mixed_before_the_silence_gate() -> None:
+    mixer = AudioMixer(jitter_seconds=0.0, frame_seconds=0.1, silence_rms=300)
+    # Each voice alone is under the gate; together they are speech.
+    mixer.push("a", _pcm(200, 0.1), arrival=1.1)
+    mixer.push("b", _pcm(200, 0.1), arrival=1.1)
+
+    frames = mixer.flush()
+    assert len(frames) == 1
+    assert abs(int(np.frombuffer(frames[0].audio, dtype="<i2")[0]) - 400) <= 2
+
+
+def test_silence_gate_drops_quiet_mixed_frames_only_when_enabled() -> None:
+    gated = AudioMixer(jitter_seconds=0.0, frame_seconds=0.1, silence_rms=300, silence_fill_seconds=0.0)
+    ungated = AudioMixer(jitter_seconds=0.0, frame_seconds=0.1)
+    for mixer in (gated, ungated):
+        mixer.push("a", _pcm(100, 0.2), arrival=1.2)
+        mixer.push("a", _pcm(4000, 0.1), arrival=1.3)
+
+    assert [frame.speaker_id for frame in gated.flush()] == ["a"]
+    assert [frame.speaker_id for frame in ungated.flush()] == ["a", "a", "a"]
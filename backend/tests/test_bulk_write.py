@@ -0,0 +1,85 @@
+import asyncio
+import uuid
+from datetime import date, datetime, time
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.server.models import ActionItem, Base, Meeting, SpeakerStatistic, Team
+from backend.server.services.bulk_write import action_item_row, bulk_insert_returning, replace_speaker_stats
+
+
+def _run(scenario):
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        statements: list[str] = []
+        event.listen(
+            engine.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            team = Team(id=uuid.uuid4(), name="팀", invite_code="ABC123")
+            meeting = Meeting(id=uuid.uuid4(), team_id=team.id, title="주간 회의", date=date(2024, 5, 1), start_time=time(10))
+            session.add_all([team, meeting])
+            await session.commit()
+            statements.clear()
+            result = await scenario(session, meeting, statements)
+        await engine.dispose()
+        return result
+
+    return asyncio.run(main())
+
+
+def test_action_items_are_inserted_in_one_statement() -> None:
+    async def scenario(session, meeting, statements):
+        now = datetime.utcnow()
+        suggestions = [{"assignee": "민수", "content": f"작업 {i}"} for i in range(5)]
+        created = await bulk_insert_returning(
+            session, ActionItem, [action_item_row(meeting.id, item, now) for item in suggestions]
+        )
+        await session.commit()
+        inserts = [sql for sql in statements if sql.lstrip().upper().startswith("INSERT")]
+        return created, inserts
+
+    created, inserts = _run(scenario)
+
+    assert [item.content for item in created] == [f"작업 {i}" for i in range(5)]
+    assert all(item.id for item in created)
+    assert len(inserts) == 1
+
+
+def test_speaker_stats_are_upserted_and_replaced() -> None:
+    async def scenario(session, meeting, statements):
+        first = await replace_speaker_stats(
+            session,
+            meeting.id,
+            [
+                {"speaker": "민수", "speak_time": 10, "speak_count": 2},
+                {"speaker": "지은", "speak_time": 5, "speak_count": 1},
+            ],
+        )
+        await session.commit()
+        first_ids = {stat.speaker: stat.id for stat in first}
+
+        second = await replace_speaker_stats(
+            session,
+            meeting.id,
+            [
+                {"speaker": "지은", "speak_time": 8, "speak_count": 3},
+                {"speaker": "현우", "speak_time": 1, "speak_count": 1},
+            ],
+        )
+        await session.commit()
+        rows = (await session.scalars(select(SpeakerStatistic).where(SpeakerStatistic.meeting_id == meeting.id))).all()
+        return first_ids, second, rows
+
+    first_ids, second, rows = _run(scenario)
+
+    assert [stat.speaker for stat in second] == ["지은", "현우"]
+    assert second[0].speak_time == 8
+    assert second[0].id == first_ids["지은"]
+    assert sorted(stat.speaker for stat in rows) == ["지은", "현우"]
@@ -0,0 +1,40 @@
+import asyncio
+
+from sqlalchemy import text
+
+from backend.server import db
+
+
+def test_profile_engine_records_pool_wait(tmp_path) -> None:
+    engine = db.create_engine_for(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}", db.ENGINE_PROFILES["worker"])
+    before = db.pool_wait.count(profile="worker", role="primary")
+
+    async def scenario():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        await engine.dispose()
+
+    asyncio.run(scenario())
+
+    assert engine.pool.size() == db.ENGINE_PROFILES["worker"].pool_size
+    assert engine.echo is False
+    assert db.pool_wait.count(profile="worker", role="primary") == before + 1
+
+
+def test_reads_stick_to_primary_after_a_write(monkeypatch) -> None:
+    replica_engine = db.create_engine_for("sqlite+aiosqlite:///:memory:", db.ENGINE_PROFILES["api"], role="replica")
+    monkeypatch.setattr(db, "read_engine", replica_engine)
+    monkeypatch.setattr(db, "AsyncReadSessionLocal", db.async_sessionmaker(bind=replica_engine))
+
+    async def has_recent_write(subject):
+        return subject == "writer"
+
+    monkeypatch.setattr(db, "has_recent_write", has_recent_write)
+
+    async def scenario():
+        return await db.open_read_session("writer"), await db.open_read_session("reader")
+
+    writer, reader = asyncio.run(scenario())
+
+    assert writer.bind is db.engine
+    assert reader.bind is replica_engine
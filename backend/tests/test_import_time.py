@@ -0,0 +1,40 @@
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "3000"))
+DEFERRED_MODULES = ("langchain_core", "langchain_google_genai", "google.cloud.storage")
+
+
+def _import_main() -> subprocess.CompletedProcess:
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(REPO_ROOT),
+        "DATABASE_URL": os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./import_time.db"),
+    }
+    script = (
+        "import sys, backend.server.main; "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_main_import_defers_heavy_sdks_and_fits_budget() -> None:
+    result = _import_main()
+
+    assert result.stdout.strip() == "", f"imported at startup: {result.stdout.strip()}"
+
+    match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| backend\.server\.main$", result.stderr, re.MULTILINE)
+    assert match, "backend.server.main missing from -X importtime output"
+    cumulative_ms = int(match.group(1)) / 1000
+    assert cumulative_ms < IMPORT_BUDGET_MS, f"import took {cumulative_ms:.0f}ms (budget {IMPORT_BUDGET_MS:.0f}ms)"
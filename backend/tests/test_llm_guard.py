@@ -0,0 +1,113 @@
+import asyncio
+
+import httpx
+import pytest
+
+from backend.server.services.llm_guard import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+    LLMGuard,
+    LLMUnavailableError,
+    RetryBudget,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _http_error(status: int, retry_after: str | None = None) -> httpx.HTTPStatusError:
+    headers = {"retry-after": retry_after} if retry_after else {}
+    request = httpx.Request("POST", "https://example.invalid/v1beta/models/m:generateContent")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def _guard(breaker: CircuitBreaker, sleeps: list[float], max_retries: int = 3) -> LLMGuard:
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    return LLMGuard(
+        "test",
+        max_concurrency=2,
+        queue_timeout=0.1,
+        max_retries=max_retries,
+        base_delay=0.5,
+        max_delay=20.0,
+        breaker=breaker,
+        budget=RetryBudget(ratio=0.2, min_retries=10),
+        sleep=fake_sleep,
+    )
+
+
+def test_breaker_opens_then_probes_after_reset() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30, clock=clock)
+
+    breaker.record_failure()
+    assert breaker.state == STATE_CLOSED
+    breaker.record_failure()
+    assert breaker.state == STATE_OPEN
+    assert not breaker.allow()
+
+    clock.now = 31
+    assert breaker.allow()
+    assert breaker.state == STATE_HALF_OPEN
+    # Only one probe is let through while half-open.
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+
+
+def test_retries_honour_retry_after() -> None:
+    sleeps: list[float] = []
+    guard = _guard(CircuitBreaker("test", failure_threshold=10), sleeps)
+    calls = 0
+
+    async def flaky() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise _http_error(429, retry_after="7")
+        return "ok"
+
+    assert asyncio.run(guard.call(flaky)) == "ok"
+    assert sleeps == [7.0]
+
+
+def test_open_circuit_fails_fast() -> None:
+    sleeps: list[float] = []
+    guard = _guard(CircuitBreaker("test", failure_threshold=2), sleeps, max_retries=1)
+    calls = 0
+
+    async def failing() -> str:
+        nonlocal calls
+        calls += 1
+        raise _http_error(503)
+
+    with pytest.raises(LLMUnavailableError):
+        asyncio.run(guard.call(failing))
+    assert guard.breaker.state == STATE_OPEN
+
+    with pytest.raises(LLMUnavailableError):
+        asyncio.run(guard.call(failing))
+    assert calls == 2
+
+
+def test_client_errors_are_not_retried() -> None:
+    sleeps: list[float] = []
+    guard = _guard(CircuitBreaker("test", failure_threshold=1), sleeps)
+
+    async def bad_request() -> str:
+        raise _http_error(400)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(guard.call(bad_request))
+    assert sleeps == []
+    assert guard.breaker.state == STATE_CLOSED
@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import uvicorn
+
+from backend.server.services import llm
+from backend.server.services.llm_guard import CircuitBreaker, RetryBudget
+from backend.tools.gemini_stub import StubConfig, create_app
+
+
+@pytest.fixture()
+def stub_config() -> StubConfig:
+    return StubConfig(latency_ms=20)
+
+
+@pytest.fixture()
+def gemini_stub(monkeypatch, stub_config):
+    monkeypatch.setattr(llm.llm_guard, "breaker", CircuitBreaker("test", failure_threshold=100))
+    monkeypatch.setattr(llm.llm_guard, "budget", RetryBudget(ratio=1.0, min_retries=100))
+    app = create_app(stub_config)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.time() + 10
+    while not server.started and time.time() < deadline:
+        time.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+    monkeypatch.setattr(llm, "GEMINI_API_BASE", f"http://127.0.0.1:{port}")
+    yield app
+    server.should_exit = True
+    thread.join(timeout=5)
+
+
+def _service() -> llm.LLMService:
+    service = llm.LLMService()
+    service.provider = "gemini"
+    service.api_key = "stub"
+    return service
+
+
+def test_gemini_calls_reuse_pooled_connection(gemini_stub) -> None:
+    service = _service()
+
+    async def scenario() -> list[str]:
+        try:
+            return [await service._call_gemini("민수: 배포 일정 논의") for _ in range(10)]
+        finally:
+            await llm.close_http_client()
+
+    results = asyncio.run(scenario())
+
+    assert all(text.startswith("- ") for text in results)
+    assert gemini_stub.state.stats.requests == 10
+    assert len(gemini_stub.state.stats.connections) == 1
+
+
+def test_concurrent_gemini_calls_share_pool(gemini_stub) -> None:
+    service = _service()
+
+    async def scenario() -> float:
+        try:
+            started = time.perf_counter()
+            await asyncio.gather(*(service._call_gemini("지영: 회의록 정리") for _ in range(8)))
+            return time.perf_counter() - started
+        finally:
+            await llm.close_http_client()
+
+    elapsed = asyncio.run(scenario())
+
+    # Requests overlap instead of queueing behind a fresh client each time.
+    assert elapsed < 8 * 0.02
+    assert len(gemini_stub.state.stats.connections) <= 8
+
+
+@pytest.mark.parametrize("stub_config", [StubConfig(failure_rate=0.3, retry_after=0, seed=3)])
+def test_injected_failures_are_retried(gemini_stub) -> None:
+    service = _service()
+
+    async def scenario() -> list[str]:
+        try:
+            return [await service._call_gemini("민수: 배포 일정 논의") for _ in range(5)]
+        finally:
+            await llm.close_http_client()
+
+    results = asyncio.run(scenario())
+
+    assert all(text.startswith("- ") for text in results)
+    assert gemini_stub.state.stats.failures > 0
+    assert gemini_stub.state.stats.requests == 5 + gemini_stub.state.stats.failures
@@ -0,0 +1,191 @@
+import asyncio
+import re
+
+import pytest
+
+from backend.server.services.llm import LLMService
+from backend.server.services.llm_guard import LLMUnavailableError
+from backend.server.services.transcript_compaction import estimate_tokens
+
+
+def _transcript(count: int) -> list[dict[str, str]]:
+    return [
+        {"speaker": f"참여자{i % 3}", "text": f"{i}번째 안건에 대해 일정과 담당자를 논의했습니다"}
+        for i in range(count)
+    ]
+
+
+def _service() -> tuple[LLMService, list[str]]:
+    service = LLMService()
+    service.provider = "gemini"
+    service.use_langchain = False
+    service.window_tokens = 200
+    prompts: list[str] = []
+
+    async def fake_complete(prompt: str, temperature: float = 0.2) -> str:
+        prompts.append(prompt)
+        return f"요약 {len(prompts)}"
+
+    service._complete = fake_complete  # type: ignore[method-assign]
+    return service, prompts
+
+
+def test_long_transcript_is_summarized_by_windows_then_reduced() -> None:
+    service, prompts = _service()
+    transcript = _transcript(40)
+    windows = service._split_windows(transcript, service._window_budget())
+    assert len(windows) > 1
+
+    summary = asyncio.run(service.summarize(transcript))
+
+    assert summary.startswith("요약")
+    assert len(prompts) == len(windows) + 1
+
+
+def test_single_speaker_monologue_prompts_fit_the_window(monkeypatch) -> None:
+    from backend.server.services import llm
+
+    monkeypatch.setattr(llm, "AI_PROMPT_MAX_TOKENS", 200)
+    service, prompts = _service()
+    # Compaction merges the whole monologue into one segment far above the window.
+    monologue = [
+        {"speaker": "민수", "text": f"{i}번째 항목은 {i * 7}일까지 검토하고 담당자를 정합니다."} for i in range(150)
+    ]
+
+    async def fake_stream(prompt: str, temperature: float = 0.2):
+        prompts.append(prompt)
+        yield "요약"
+
+    async def collect() -> list[str]:
+        return [chunk async for chunk in service.stream_summary(monologue)]
+
+    async def fake_gemini(prompt: str, temperature: float = 0.2) -> str:
+        prompts.append(prompt)
+        return "[]"
+
+    service._stream_gemini = fake_stream  # type: ignore[method-assign]
+    service._call_gemini = fake_gemini  # type: ignore[method-assign]
+    asyncio.run(service.summarize(monologue))
+    asyncio.run(collect())
+    asyncio.run(service.extract_action_items(monologue))
+
+    assert len(prompts) > 3
+    assert max(estimate_tokens(prompt) for prompt in prompts) <= service.window_tokens
+    assert any("149번째 항목" in prompt for prompt in prompts)
+
+
+def test_resummarize_only_recomputes_tail_window() -> None:
+    service, prompts = _service()
+    transcript = _transcript(40)
+    asyncio.run(service.summarize(transcript))
+    prompts.clear()
+
+    asyncio.run(service.summarize(transcript + _transcript(2)))
+
+    # One call for the changed last window, one for the reduce step.
+    assert len(prompts) == 2
+
+
+def test_cache_key_is_content_addressed() -> None:
+    from backend.server.services.llm_cache import cache_key
+
+    base = [{"speaker": "민수", "text": "배포 일정 확인"}]
+    spaced = [{"speaker": "민수 ", "text": "배포  일정 확인 "}]
+
+    assert cache_key("summary", base, "gemini-pro", "v1") == cache_key("summary", spaced, "gemini-pro", "v1")
+    assert cache_key("summary", base, "gemini-pro", "v1") != cache_key("summary", base, "gemini-pro", "v2")
+    assert cache_key("summary", base, "gemini-pro", "v1") != cache_key("action_items", base, "gemini-pro", "v1")
+
+
+def test_combined_completion_uses_one_call() -> None:
+    service, prompts = _service()
+    service.window_tokens = 3000
+
+    async def fake_complete(prompt: str, temperature: float = 0.2) -> str:
+        prompts.append(prompt)
+        return '{"summary": ["배포 일정 확정"], "actionItems": [{"assignee": "민수", "content": "문서 정리"}]}'
+
+    service._complete = fake_complete  # type: ignore[method-assign]
+    summary, actions = asyncio.run(service.summarize_and_extract(_transcript(3)))
+
+    assert len(prompts) == 1
+    assert summary == "- 배포 일정 확정"
+    assert actions == [{"assignee": "민수", "content": "문서 정리"}]
+
+
+def test_combined_completion_falls_back_when_unparseable() -> None:
+    service, prompts = _service()
+    service.window_tokens = 3000
+    service._call_gemini = service._complete  # type: ignore[method-assign]
+
+    summary, actions = asyncio.run(service.summarize_and_extract(_transcript(3)))
+
+    # The combined reply is not JSON, so summary and action items are requested separately.
+    assert len(prompts) == 3
+    assert summary in {"요약 2", "요약 3"}
+    assert isinstance(actions, list)
+
+
+def test_stream_summary_yields_provider_chunks() -> None:
+    service, _ = _service()
+    service.window_tokens = 3000
+
+    async def fake_stream(prompt: str, temperature: float = 0.2):
+        for chunk in ("- 배포 ", "일정 ", "확정"):
+            yield chunk
+
+    service._stream_gemini = fake_stream  # type: ignore[method-assign]
+
+    async def collect() -> list[str]:
+        return [chunk async for chunk in service.stream_summary(_transcript(3))]
+
+    assert asyncio.run(collect()) == ["- 배포 ", "일정 ", "확정"]
+
+
+def test_fold_summary_only_sends_new_segments() -> None:
+    service, prompts = _service()
+    service.window_tokens = 3000
+    new_segments = [{"speaker": "지은", "text": "QA는 다음 주 월요일에 시작합니다"}]
+
+    summary = asyncio.run(service.fold_summary("- 배포 일정 확정", new_segments))
+
+    assert summary == "요약 1"
+    assert len(prompts) == 1
+    assert "- 배포 일정 확정" in prompts[0]
+    assert "QA는 다음 주 월요일에 시작합니다" in prompts[0]
+
+
+def test_fold_summary_keeps_previous_summary_when_llm_is_missing_or_down() -> None:
+    new_segments = [{"speaker": "지은", "text": "QA는 다음 주 월요일에 시작합니다"}]
+    offline = LLMService()
+    offline.provider = None
+    assert asyncio.run(offline.fold_summary("- 배포 일정 확정", new_segments)) == "- 배포 일정 확정"
+
+    service, _ = _service()
+
+    async def unavailable(prompt: str, temperature: float = 0.2) -> str:
+        raise LLMUnavailableError("circuit open")
+
+    service._complete = unavailable  # type: ignore[method-assign]
+    assert asyncio.run(service.fold_summary("- 배포 일정 확정", new_segments)) == "- 배포 일정 확정"
+    with pytest.raises(LLMUnavailableError):
+        asyncio.run(service.fold_summary("- 배포 일정 확정", new_segments, fallback=False))
+
+
+def test_long_transcript_extracts_action_items_from_every_window(monkeypatch) -> None:
+    from backend.server.services import llm
+
+    monkeypatch.setattr(llm, "AI_PROMPT_MAX_TOKENS", 200)
+    service, _ = _service()
+    transcript = _transcript(40)
+    windows = service._split_windows(service._compact(transcript, kind="action_items"), 200)
+    assert len(windows) > 1
+
+    async def fake_gemini(prompt: str, temperature: float = 0.2) -> str:
+        first = re.search(r"(?<!\d)0번째 안건", prompt) is not None
+        return '[{"type": "task", "assignee": "참여자0", "content": "%s"}]' % ("첫 안건 정리" if first else "후속 정리")
+
+    service._call_gemini = fake_gemini  # type: ignore[method-assign]
+    items = asyncio.run(service.extract_action_items(transcript))
+
+    assert [item["content"] for item in items] == ["첫 안건 정리", "후속 정리"]
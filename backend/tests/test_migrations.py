@@ -0,0 +1,109 @@
+import asyncio
+import os
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from backend.server import migrations
+from backend.server.migrations import ops
+from backend.server.models import Base
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+
+
+def _index_names(conn) -> set[str]:
+    rows = conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type IN ('index', 'table')").all()
+    return {row[0] for row in rows}
+
+
+def test_fresh_database_is_created_and_stamped(tmp_path) -> None:
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'fresh.db'}")
+        applied = await migrations.upgrade(engine)
+        left = await migrations.pending(engine)
+        async with engine.connect() as conn:
+            names = await conn.run_sync(_index_names)
+        await engine.dispose()
+        return applied, left, names
+
+    applied, left, names = asyncio.run(scenario())
+
+    assert applied == []
+    assert left == []
+    assert {"ix_transcripts_meeting_created", "ix_team_members_team_user", "transcripts_fts"} <= names
+
+
+def test_existing_database_gets_pending_revisions(tmp_path) -> None:
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'legacy.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            # Strip what the revisions add to mimic a database created before them.
+            for name in await conn.run_sync(_index_names):
+                if name.startswith("ix_"):
+                    await conn.exec_driver_sql(f"DROP INDEX {name}")
+            for column in ("action_items_count", "transcript_archive", "completion_job_id"):
+                await conn.exec_driver_sql(f"ALTER TABLE meetings DROP COLUMN {column}")
+            for table in ("transcripts_fts", "action_items_fts"):
+                for suffix in ("ai", "ad", "au"):
+                    await conn.exec_driver_sql(f"DROP TRIGGER {table}_{suffix}")
+                await conn.exec_driver_sql(f"DROP TABLE {table}")
+                await conn.exec_driver_sql(f"DROP TABLE {table}_keys")
+            await conn.execute(
+                text(
+                    "INSERT INTO teams (id, name, invite_code) VALUES ('00000000000000000000000000000001', 'team', 'LEGACY')"
+                )
+            )
+            await conn.execute(
+                text(
+                    "INSERT INTO meetings (id, team_id, title, date, start_time, status) "
+                    "VALUES ('00000000000000000000000000000002', '00000000000000000000000000000001', "
+                    "'meeting', '2024-01-01', '10:00:00', 'completed')"
+                )
+            )
+            for n in range(2):
+                await conn.execute(
+                    text(
+                        "INSERT INTO action_items (id, meeting_id, type, assignee, content, status) "
+                        f"VALUES ('0000000000000000000000000000010{n}', '00000000000000000000000000000002', "
+                        "'task', 'someone', 'todo', 'pending')"
+                    )
+                )
+
+        applied = await migrations.upgrade(engine)
+        again = await migrations.upgrade(engine)
+        async with engine.connect() as conn:
+            names = await conn.run_sync(_index_names)
+            counts = (await conn.exec_driver_sql("SELECT action_items_count FROM meetings")).scalars().all()
+        await engine.dispose()
+        return applied, again, names, counts
+
+    applied, again, names, counts = asyncio.run(scenario())
+
+    assert applied == ["0001", "0002", "0003", "0004", "0005", "0006"]
+    assert counts == [2]
+    assert again == []
+    assert {"ix_meetings_team_date_start", "ix_action_items_meeting_status_due", "action_items_fts"} <= names
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+def test_invalid_concurrent_index_is_rebuilt() -> None:
+    async def scenario():
+        engine = create_async_engine(POSTGRES_URL)
+        async with engine.connect() as conn:
+            autocommit = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await autocommit.exec_driver_sql("DROP TABLE IF EXISTS plan_ops")
+            await autocommit.exec_driver_sql("CREATE TABLE plan_ops (value integer)")
+            await autocommit.exec_driver_sql("INSERT INTO plan_ops VALUES (1), (1)")
+            # A failed concurrent build leaves the index behind, marked INVALID.
+            with pytest.raises(Exception):
+                await autocommit.exec_driver_sql("CREATE UNIQUE INDEX CONCURRENTLY ix_plan_ops_value ON plan_ops (value)")
+            before = await autocommit.run_sync(ops.index_is_valid, "ix_plan_ops_value")
+            await autocommit.run_sync(ops.create_index, "ix_plan_ops_value", "plan_ops", ("value",))
+            after = await autocommit.run_sync(ops.index_is_valid, "ix_plan_ops_value")
+            await autocommit.exec_driver_sql("DROP TABLE plan_ops")
+        await engine.dispose()
+        return before, after
+
+    assert asyncio.run(scenario()) == (False, True)
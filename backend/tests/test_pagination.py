@@ -0,0 +1,91 @@
+import asyncio
+import uuid
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.server import pagination
+from backend.server.models import ActionItem, Base, Meeting, Team, TeamMember, User
+from backend.server.routers.action_items import list_team_action_items
+
+
+def _run(scenario):
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            user = User(id=uuid.uuid4(), email="a@example.com", name="민수", password_hash="x")
+            team = Team(id=uuid.uuid4(), name="팀", invite_code="PAGE01")
+            meeting = Meeting(id=uuid.uuid4(), team_id=team.id, title="회의", date=date(2024, 5, 1), start_time=time(10))
+            session.add_all([user, team, meeting])
+            session.add(TeamMember(id=uuid.uuid4(), team_id=team.id, user_id=user.id, role="owner"))
+            created = datetime(2024, 5, 1, 9)
+            for i in range(11):
+                session.add(
+                    ActionItem(
+                        id=uuid.uuid4(),
+                        meeting_id=meeting.id,
+                        type="task",
+                        assignee="민수",
+                        content=f"작업 {i}",
+                        # Undated items and ties on created_at exercise every key of the sort.
+                        due_date=None if i % 3 == 0 else date(2024, 5, 10 + i % 2),
+                        created_at=created + timedelta(minutes=i // 2),
+                    )
+                )
+            await session.commit()
+            result = await scenario(session, team, user)
+        await engine.dispose()
+        return result
+
+    return asyncio.run(main())
+
+
+async def _list(session, team, user, cursor=None, limit=None):
+    return await list_team_action_items(
+        team.id,
+        assignee=None,
+        status_filter=None,
+        search=None,
+        cursor=cursor,
+        limit=limit,
+        db=session,
+        current_user=user,
+    )
+
+
+def test_cursor_pages_match_the_legacy_full_listing() -> None:
+    async def scenario(session, team, user):
+        full = await _list(session, team, user)
+        pages = []
+        cursor = None
+        while True:
+            page = await _list(session, team, user, cursor=cursor, limit=4)
+            pages.append(page)
+            cursor = page.next_cursor
+            if cursor is None:
+                return full, pages
+
+    full, pages = _run(scenario)
+
+    assert full.next_cursor is None
+    assert [len(page.action_items) for page in pages] == [4, 4, 3]
+    paged = [item.id for page in pages for item in page.action_items]
+    assert paged == [item.id for item in full.action_items]
+    assert full.action_items[-1].due_date is None
+
+
+def test_malformed_cursor_is_rejected() -> None:
+    with pytest.raises(HTTPException) as exc:
+        pagination.paginate(
+            select(ActionItem),
+            (pagination.SortKey("id", ActionItem.id, parse=pagination.parse_uuid),),
+            pagination.encode_cursor({"id": "not-a-uuid"}),
+            10,
+        )
+
+    assert exc.value.status_code == 400
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+import uuid
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.server import query_stats
+from backend.server.main import app
+from backend.server.models import ActionItem, Base, Meeting, SpeakerStatistic, Team, TeamMember, Transcript, User
+from backend.server.routers import meetings, transcripts
+
+
+def _run(scenario):
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            user = User(id=uuid.uuid4(), email="a@example.com", name="민수", password_hash="x")
+            team = Team(id=uuid.uuid4(), name="팀", invite_code="BUDGET")
+            session.add_all([user, team, TeamMember(id=uuid.uuid4(), team_id=team.id, user_id=user.id, role="owner")])
+            started = datetime(2024, 5, 1, 10)
+            for n in range(3):
+                meeting = Meeting(
+                    id=uuid.uuid4(), team_id=team.id, title=f"회의 {n}", date=date(2024, 5, 1 + n), start_time=time(10), status="completed"
+                )
+                session.add(meeting)
+                session.add(SpeakerStatistic(id=uuid.uuid4(), meeting_id=meeting.id, speaker="민수", speak_time=60, speak_count=3))
+                for i in range(4):
+                    session.add(
+                        Transcript(
+                            id=uuid.uuid4(),
+                            meeting_id=meeting.id,
+                            speaker="민수",
+                            text=f"발언 {i}",
+                            timestamp=f"00:0{i}",
+                            created_at=started + timedelta(seconds=i),
+                        )
+                    )
+                    session.add(ActionItem(id=uuid.uuid4(), meeting_id=meeting.id, type="task", assignee="민수", content=f"작업 {i}"))
+            await session.commit()
+            session.expunge_all()
+            result = await scenario(session, team, meeting, user)
+        await engine.dispose()
+        return result
+
+    return asyncio.run(main())
+
+
+# Endpoint -> statements it may issue, not counting the auth lookup of the user.
+BUDGETS = {
+    "list_team_meetings": 2,
+    "get_meeting": 4,
+    "get_transcript": 2,
+}
+
+
+@pytest.mark.parametrize("endpoint", sorted(BUDGETS))
+def test_endpoint_query_budgets(endpoint) -> None:
+    calls = {
+        "list_team_meetings": lambda s, team, meeting, user: meetings.list_team_meetings(
+            team.id, status_filter=None, cursor=None, limit=None, db=s, current_user=user
+        ),
+        "get_meeting": lambda s, team, meeting, user: meetings.get_meeting(meeting.id, db=s, current_user=user),
+        "get_transcript": lambda s, team, meeting, user: transcripts.get_transcript(
+            meeting.id, cursor=None, limit=2, db=s, current_user=user
+        ),
+    }
+
+    async def scenario(session, team, meeting, user):
+        with query_stats.query_budget(BUDGETS[endpoint]) as stats:
+            await calls[endpoint](session, team, meeting, user)
+        return stats
+
+    stats = _run(scenario)
+
+    assert not stats.repeated(1)
+
+
+def test_repeated_statement_shape_is_reported_as_n_plus_one(caplog) -> None:
+    async def scenario(session, team, meeting, user):
+        with query_stats.track_queries() as stats:
+            with pytest.raises(AssertionError, match="13 queries issued, budget is 5"):
+                with query_stats.query_budget(5):
+                    for item_id in (await session.scalars(select(ActionItem.id))).all():
+                        await session.execute(select(ActionItem).where(ActionItem.id == item_id))
+        return stats
+
+    stats = _run(scenario)
+    before = query_stats.n_plus_one.value(route="/test")
+    with caplog.at_level(logging.WARNING, logger=query_stats.__name__):
+        query_stats.report(stats, "/test")
+
+    assert stats.count == 13
+    assert list(stats.repeated(query_stats.SQL_N_PLUS_ONE_THRESHOLD).values()) == [12]
+    assert query_stats.n_plus_one.value(route="/test") == before + 1
+    assert "Possible N+1 on /test" in caplog.text
+
+
+def test_responses_carry_server_timing() -> None:
+    response = TestClient(app).get("/api/health")
+
+    assert response.headers["server-timing"].startswith("db;dur=")
@@ -0,0 +1,248 @@
+"""EXPLAIN the statements that hot endpoints actually issue and fail on full table scans.
+
+The SQLite cases always run. Set ``TEST_POSTGRES_URL`` to a scratch database
+(``postgresql+asyncpg://...``) to run the same checks on Postgres, where
+sequential scans are disabled so any ``Seq Scan`` left means no usable index.
+"""
+import asyncio
+import os
+import re
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.server import migrations
+from backend.server.deps import ensure_meeting_access, ensure_team_member
+from backend.server.models import ActionItem, Base, Meeting, Team, TeamMember, Transcript, User
+from backend.server.routers import action_items, meetings, teams, transcripts
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+URLS = ["sqlite"] + ([POSTGRES_URL] if POSTGRES_URL else [])
+
+TEAMS = 3
+MEMBERS_PER_TEAM = 10
+MEETINGS_PER_TEAM = 40
+SEGMENTS_PER_MEETING = 30
+ACTIONS_PER_MEETING = 5
+# Users outside the seeded teams, so user lookups are selective as in production.
+OTHER_USERS = 500
+
+
+@dataclass
+class Seeded:
+    team_id: uuid.UUID
+    meeting_id: uuid.UUID
+    user: User
+
+
+async def _seed(conn) -> Seeded:
+    users, members, meeting_rows, segment_rows, action_rows = [], [], [], [], []
+    team_rows = [{"id": uuid.uuid4(), "name": f"팀 {i}", "invite_code": f"PLAN{i:02d}"} for i in range(TEAMS)]
+    now = datetime(2024, 5, 1, 9)
+    for team_index, team in enumerate(team_rows):
+        for m in range(MEMBERS_PER_TEAM):
+            user_id = uuid.uuid4()
+            users.append(
+                {"id": user_id, "email": f"u{team_index}-{m}@example.com", "name": f"사용자{m}", "password_hash": "x"}
+            )
+            members.append({"id": uuid.uuid4(), "team_id": team["id"], "user_id": user_id, "role": "member"})
+        for n in range(MEETINGS_PER_TEAM):
+            meeting_id = uuid.uuid4()
+            meeting_rows.append(
+                {
+                    "id": meeting_id,
+                    "team_id": team["id"],
+                    "title": f"회의 {n}",
+                    "date": date(2024, 1, 1) + timedelta(days=n),
+                    "start_time": time(10),
+                    "status": "completed",
+                }
+            )
+            for s in range(SEGMENTS_PER_MEETING):
+                segment_rows.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "meeting_id": meeting_id,
+                        "speaker": f"사용자{s % 4}",
+                        "text": f"{s}번째 발언: 배포 체크리스트와 일정 검토",
+                        "timestamp": f"00:{s:02d}",
+                        "created_at": now + timedelta(seconds=s),
+                    }
+                )
+            for a in range(ACTIONS_PER_MEETING):
+                action_rows.append(
+                    {
+                        "id": uuid.uuid4(),
+                        "meeting_id": meeting_id,
+                        "type": "task",
+                        "assignee": "민수",
+                        "assignee_user_id": users[-1 - a]["id"],
+                        "content": f"배포 체크리스트 {a} 정리",
+                        "status": "pending" if a % 2 else "done",
+                        "created_at": now,
+                    }
+                )
+
+    others = [
+        {"id": uuid.uuid4(), "email": f"other{i}@example.com", "name": f"외부{i}", "password_hash": "x"}
+        for i in range(OTHER_USERS)
+    ]
+    for table, rows in (
+        (User.__table__, users + others),
+        (Team.__table__, team_rows),
+        (TeamMember.__table__, members),
+        (Meeting.__table__, meeting_rows),
+        (Transcript.__table__, segment_rows),
+        (ActionItem.__table__, action_rows),
+    ):
+        await conn.execute(table.insert(), rows)
+    await conn.exec_driver_sql("ANALYZE")
+
+    user = User(id=users[0]["id"], email=users[0]["email"], name=users[0]["name"], password_hash="x")
+    return Seeded(team_id=team_rows[0]["id"], meeting_id=meeting_rows[0]["id"], user=user)
+
+
+def _seq_scans(dialect: str, plan: str) -> list[str]:
+    tables = set(Base.metadata.tables)
+    if dialect == "sqlite":
+        found = re.findall(r"\bSCAN (\w+)$", plan, flags=re.MULTILINE)
+    else:
+        found = re.findall(r"Seq Scan on (\w+)", plan)
+    return [table for table in found if table in tables]
+
+
+def _plans(url: str, scenario) -> list[tuple[str, str]]:
+    """Run ``scenario(session, seeded)`` and return ``(statement, plan)`` for each SELECT it issued."""
+
+    async def main():
+        engine = create_async_engine(url)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(migrations.schema_migrations.drop, checkfirst=True)
+        await migrations.upgrade(engine)
+        async with engine.begin() as conn:
+            seeded = await _seed(conn)
+
+        captured: list[tuple[str, object]] = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                captured.append((statement, parameters))
+
+        event.listen(engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+                await scenario(session, seeded)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+        prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+        results = []
+        async with engine.connect() as conn:
+            if engine.dialect.name == "postgresql":
+                await conn.exec_driver_sql("SET enable_seqscan = off")
+            for statement, parameters in captured:
+                rows = (await conn.exec_driver_sql(prefix + statement, parameters)).all()
+                results.append((statement, "\n".join(" ".join(str(value) for value in row) for row in rows)))
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(migrations.schema_migrations.drop, checkfirst=True)
+        await engine.dispose()
+        return results
+
+    return asyncio.run(main())
+
+
+def _url(param: str, tmp_path) -> str:
+    return f"sqlite+aiosqlite:///{tmp_path / 'plans.db'}" if param == "sqlite" else param
+
+
+async def _deps(session, seeded):
+    await ensure_team_member(session, seeded.team_id, seeded.user.id)
+    await ensure_meeting_access(session, seeded.meeting_id, seeded.user.id)
+
+
+async def _list_meetings(session, seeded):
+    await meetings.list_team_meetings(
+        seeded.team_id, status_filter=None, cursor=None, limit=None, db=session, current_user=seeded.user
+    )
+
+
+async def _get_meeting(session, seeded):
+    await meetings.get_meeting(seeded.meeting_id, db=session, current_user=seeded.user)
+
+
+async def _get_transcript(session, seeded):
+    page = await transcripts.get_transcript(seeded.meeting_id, cursor=None, limit=10, db=session, current_user=seeded.user)
+    await transcripts.get_transcript(
+        seeded.meeting_id, cursor=page.next_cursor, limit=10, db=session, current_user=seeded.user
+    )
+
+
+async def _list_action_items(session, seeded):
+    await action_items.list_team_action_items(
+        seeded.team_id,
+        assignee=None,
+        status_filter="pending",
+        search=None,
+        cursor=None,
+        limit=None,
+        db=session,
+        current_user=seeded.user,
+    )
+    await action_items.list_team_action_items(
+        seeded.team_id,
+        assignee=seeded.user.id,
+        status_filter=None,
+        search="체크리스트",
+        cursor=None,
+        limit=None,
+        db=session,
+        current_user=seeded.user,
+    )
+
+
+async def _teams(session, seeded):
+    await teams.list_my_teams(db=session, current_user=seeded.user)
+    await teams.get_team(seeded.team_id, cursor=None, limit=5, db=session, current_user=seeded.user)
+
+
+HOT_PATHS = {
+    "deps": _deps,
+    "list_team_meetings": _list_meetings,
+    "get_meeting": _get_meeting,
+    "get_transcript": _get_transcript,
+    "list_team_action_items": _list_action_items,
+    "teams": _teams,
+}
+
+
+@pytest.mark.parametrize("url", URLS, ids=["sqlite", "postgres"][: len(URLS)])
+@pytest.mark.parametrize("path", sorted(HOT_PATHS))
+def test_hot_queries_avoid_full_table_scans(url, path, tmp_path) -> None:
+    plans = _plans(_url(url, tmp_path), HOT_PATHS[path])
+    dialect = "sqlite" if url == "sqlite" else "postgresql"
+
+    assert plans, "scenario issued no SELECT statements"
+    for statement, plan in plans:
+        assert not _seq_scans(dialect, plan), f"full scan in plan:\n{plan}\nfor:\n{statement}"
+
+
+def test_action_item_filters_use_composite_indexes(tmp_path) -> None:
+    plans = [plan for statement, plan in _plans(_url("sqlite", tmp_path), _list_action_items) if "FROM action_items" in statement]
+    status_plan, search_plan = plans
+
+    assert "ix_meetings_team_date_start" in status_plan
+    assert "ix_action_items_meeting_status_due" in status_plan
+    assert "action_items_fts VIRTUAL TABLE INDEX" in search_plan
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+def test_postgres_action_item_search_uses_trigram_index() -> None:
+    plans = [plan for statement, plan in _plans(POSTGRES_URL, _list_action_items) if "FROM action_items" in statement]
+
+    assert "ix_action_items_content_trgm" in plans[-1]
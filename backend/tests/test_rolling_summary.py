@@ -0,0 +1,123 @@
+import asyncio
+import uuid
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.server import migrations
+from backend.server.models import Meeting, Team, Transcript
+from backend.server.services import rolling_summary
+from backend.server.workers import ai_worker
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class FakeLLM:
+    def __init__(self) -> None:
+        self.folded: list[str] = []
+
+    async def fold_summary(self, previous_summary, new_segments, fallback=True) -> str:
+        await asyncio.sleep(0.01)
+        self.folded.extend(segment["text"] for segment in new_segments)
+        return f"{previous_summary}+{len(new_segments)}"
+
+
+def _segment(meeting_id: uuid.UUID, text: str, created_at: datetime) -> Transcript:
+    return Transcript(
+        id=uuid.uuid4(), meeting_id=meeting_id, speaker="화자", text=text, timestamp="00:00", created_at=created_at
+    )
+
+
+async def _setup(tmp_path, monkeypatch):
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    llm = FakeLLM()
+    monkeypatch.setattr(rolling_summary, "get_redis", lambda: client)
+    monkeypatch.setattr(ai_worker, "get_redis", lambda: client)
+    monkeypatch.setattr(ai_worker, "get_llm_service", lambda: llm)
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'rolling.db'}")
+    await migrations.upgrade(engine)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(ai_worker, "AsyncSessionLocal", sessions)
+
+    team_id, meeting_id = uuid.uuid4(), uuid.uuid4()
+    async with sessions() as session:
+        session.add_all(
+            [
+                Team(id=team_id, name="team", invite_code="ROLLING"),
+                Meeting(id=meeting_id, team_id=team_id, title="m", date=date(2024, 1, 1), start_time=time(10)),
+            ]
+        )
+        await session.commit()
+    return engine, sessions, meeting_id, llm
+
+
+def test_concurrent_folds_fold_each_segment_once(tmp_path, monkeypatch) -> None:
+    async def scenario():
+        engine, sessions, meeting_id, llm = await _setup(tmp_path, monkeypatch)
+        start = datetime.utcnow() - timedelta(minutes=5)
+        async with sessions() as session:
+            # Equal timestamps are ordered by id, so none of them is skipped.
+            session.add_all(_segment(meeting_id, f"발언{n}", start + timedelta(seconds=n // 2)) for n in range(6))
+            await session.commit()
+
+        await asyncio.gather(*(ai_worker.process_rolling_summary(f"job{n}", meeting_id) for n in range(3)))
+        state = await rolling_summary.get_rolling_state(meeting_id)
+        await engine.dispose()
+        return llm.folded, state
+
+    folded, state = asyncio.run(scenario())
+
+    assert sorted(folded) == [f"발언{n}" for n in range(6)]
+    assert state["segments"] == "6"
+
+
+def test_late_commit_behind_a_newer_segment_is_folded(tmp_path, monkeypatch) -> None:
+    async def scenario():
+        engine, sessions, meeting_id, llm = await _setup(tmp_path, monkeypatch)
+        now = datetime.utcnow()
+        async with sessions() as session:
+            session.add_all(
+                [_segment(meeting_id, "이전", now - timedelta(minutes=1)), _segment(meeting_id, "최신", now)]
+            )
+            await session.commit()
+
+        await ai_worker.process_rolling_summary("job1", meeting_id)
+        first = list(llm.folded)
+
+        # Created before "최신" but committed after the first fold ran.
+        async with sessions() as session:
+            session.add(_segment(meeting_id, "지연", now - timedelta(milliseconds=500)))
+            await session.commit()
+        monkeypatch.setattr(ai_worker, "AI_ROLLING_SUMMARY_SETTLE_MS", 0)
+        await ai_worker.process_rolling_summary("job2", meeting_id)
+        await engine.dispose()
+        return first, llm.folded[len(first) :]
+
+    first, second = asyncio.run(scenario())
+
+    assert first == ["이전"]
+    assert second == ["지연", "최신"]
+
+
+def test_save_rolling_state_rejects_a_stale_cursor(monkeypatch) -> None:
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(rolling_summary, "get_redis", lambda: client)
+    meeting_id = uuid.uuid4()
+    created_at = datetime(2024, 1, 1, 10)
+    first = rolling_summary.encode_cursor(created_at, uuid.uuid4())
+    second = rolling_summary.encode_cursor(created_at + timedelta(seconds=1), uuid.uuid4())
+
+    async def scenario():
+        saved = await rolling_summary.save_rolling_state(meeting_id, "A", first, 1)
+        advanced = await rolling_summary.save_rolling_state(meeting_id, "B", second, 2, expected_cursor=first)
+        stale = await rolling_summary.save_rolling_state(meeting_id, "C", second, 2, expected_cursor=first)
+        return saved, advanced, stale, await rolling_summary.get_rolling_state(meeting_id)
+
+    saved, advanced, stale, state = asyncio.run(scenario())
+
+    assert (saved, advanced, stale) == (True, True, False)
+    assert state["summary"] == "B"
+    assert rolling_summary.decode_cursor(state["cursor"]) == rolling_summary.decode_cursor(second)
+    assert rolling_summary.decode_cursor(created_at.isoformat()) == (created_at, None)
@@ -0,0 +1,38 @@
+import asyncio
+
+from backend.server.workers.stt_worker import PartialCoalescer
+
+
+def test_partial_coalescer_keeps_latest_text_per_speaker() -> None:
+    published: list[dict] = []
+
+    async def publish(data: dict) -> None:
+        published.append(data)
+
+    async def scenario() -> None:
+        coalescer = PartialCoalescer(0.01, publish)
+        coalescer.offer("민수", {"speaker": "민수", "text": "안녕"})
+        coalescer.offer("민수", {"speaker": "민수", "text": "안녕하세요"})
+        coalescer.offer("지영", {"speaker": "지영", "text": "네"})
+        await asyncio.sleep(0.05)
+        await coalescer.close()
+
+    asyncio.run(scenario())
+    assert sorted(item["text"] for item in published) == ["네", "안녕하세요"]
+
+
+def test_partial_coalescer_discard_drops_pending_partial() -> None:
+    published: list[dict] = []
+
+    async def publish(data: dict) -> None:
+        published.append(data)
+
+    async def scenario() -> None:
+        coalescer = PartialCoalescer(0.01, publish)
+        coalescer.offer("민수", {"speaker": "민수", "text": "회의를"})
+        coalescer.discard("민수")
+        await asyncio.sleep(0.03)
+        await coalescer.close()
+
+    asyncio.run(scenario())
+    assert published == []
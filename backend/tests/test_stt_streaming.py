@@ -0,0 +1,151 @@
+import asyncio
+import uuid
+from datetime import timedelta
+from types import SimpleNamespace
+
+from backend.server.workers import stt_worker
+from backend.server.workers.stt_worker import _strip_seam_overlap
+
+
+class FakeSpeechClient:
+    """Finalizes every audio chunk as its own utterance, transcribed as its label."""
+
+    def __init__(self) -> None:
+        self.streams: list[list[str]] = []
+        self.channels_ready = 0
+        self.transport = SimpleNamespace(grpc_channel=SimpleNamespace(channel_ready=self._channel_ready))
+
+    async def _channel_ready(self) -> None:
+        self.channels_ready += 1
+
+    async def streaming_recognize(self, requests):
+        heard: list[str] = []
+        self.streams.append(heard)
+
+        async def responses():
+            async for request in requests:
+                if not request.audio_content:
+                    continue
+                heard.append(request.audio_content.rstrip(b"\0").decode())
+                yield stt_worker.speech.StreamingRecognizeResponse(
+                    results=[
+                        stt_worker.speech.StreamingRecognitionResult(
+                            alternatives=[stt_worker.speech.SpeechRecognitionAlternative(transcript=heard[-1])],
+                            is_final=True,
+                            result_end_time=timedelta(seconds=len(heard) / 10),
+                        )
+                    ]
+                )
+
+        return responses()
+
+
+def test_strip_seam_overlap_drops_repeated_final() -> None:
+    recent = ["다음 주까지 API 문서를 정리하겠습니다"]
+    assert _strip_seam_overlap("API 문서를 정리하겠습니다", recent) is None
+
+
+def test_strip_seam_overlap_keeps_only_new_tail() -> None:
+    recent = ["배포는 금요일에 진행하고"]
+    assert _strip_seam_overlap("금요일에 진행하고 리뷰는 월요일", recent) == "리뷰는 월요일"
+
+
+def test_strip_seam_overlap_passes_unrelated_text() -> None:
+    assert _strip_seam_overlap("새로운 안건입니다", ["이전 발화"]) == "새로운 안건입니다"
+
+
+def test_strip_seam_overlap_keeps_a_single_shared_word() -> None:
+    recent = ["네 알겠습니다"]
+    assert _strip_seam_overlap("알겠습니다. 다음 안건으로", recent) == "알겠습니다. 다음 안건으로"
+    assert _strip_seam_overlap("알겠습니다 다음 안건으로", ["네 알겠습니다 다음"]) == "안건으로"
+
+
+def test_rotation_replays_audio_without_losing_or_repeating_finals(monkeypatch) -> None:
+    client = FakeSpeechClient()
+    monkeypatch.setattr(stt_worker.speech, "SpeechAsyncClient", lambda: client)
+    persisted: list[str] = []
+    labels = ["하나", "둘", "셋", "넷", "다섯", "여섯"]
+
+    async def persist(text, meta) -> None:
+        persisted.append(text)
+
+    async def scenario() -> None:
+        session = stt_worker.StreamingSession(uuid.uuid4())
+        session.rotate_seconds = 0.2
+        # Replay exactly the last 0.1s chunk into the next stream.
+        session._replay_limit = 3200
+        session._persist_transcript = persist
+        for label in labels[:3]:
+            await session.enqueue(label.encode().ljust(3200, b"\0"), {})
+        await asyncio.sleep(0.3)
+        for label in labels[3:]:
+            await session.enqueue(label.encode().ljust(3200, b"\0"), {})
+        await asyncio.sleep(0.05)
+        await session.stop()
+
+    asyncio.run(scenario())
+
+    assert client.streams[:2] == [labels[:3], labels[2:]]
+    assert persisted == labels
+
+
+def _prewarm(monkeypatch, client, idle_seconds: float):
+    async def active(meeting_id) -> bool:
+        return True
+
+    monkeypatch.setattr(stt_worker.speech, "SpeechAsyncClient", lambda: client)
+    monkeypatch.setattr(stt_worker, "sessions", {})
+    monkeypatch.setattr(stt_worker, "_is_meeting_active", active)
+    monkeypatch.setattr(stt_worker, "STT_PREWARM_IDLE_SECONDS", idle_seconds)
+
+
+def test_prewarmed_session_is_reused_by_the_first_chunk(monkeypatch) -> None:
+    client = FakeSpeechClient()
+    _prewarm(monkeypatch, client, idle_seconds=60)
+    persisted: list[str] = []
+
+    async def persist(text, meta) -> None:
+        persisted.append(text)
+
+    async def scenario():
+        meeting_id = uuid.uuid4()
+        await stt_worker._prewarm_session(meeting_id)
+        warmed = stt_worker.sessions[meeting_id]
+        await asyncio.sleep(0.02)
+        # Only the channel is connected; no stream is left waiting for audio.
+        streams_before_audio = len(client.streams)
+        session = stt_worker._get_session(meeting_id)
+        session._persist_transcript = persist
+        await session.enqueue("안녕하세요".encode().ljust(3200, b"\0"), {})
+        await asyncio.sleep(0.05)
+        await stt_worker._release_idle_sessions()
+        reused = session is warmed and meeting_id in stt_worker.sessions
+        await stt_worker._stop_session(meeting_id)
+        return streams_before_audio, reused
+
+    streams_before_audio, reused = asyncio.run(scenario())
+
+    assert client.channels_ready == 1
+    assert streams_before_audio == 0
+    assert reused
+    assert client.streams == [["안녕하세요"]]
+    assert persisted == ["안녕하세요"]
+
+
+def test_idle_prewarmed_session_is_closed(monkeypatch) -> None:
+    client = FakeSpeechClient()
+    _prewarm(monkeypatch, client, idle_seconds=0.01)
+
+    async def scenario():
+        meeting_id = uuid.uuid4()
+        await stt_worker._prewarm_session(meeting_id)
+        await stt_worker._release_idle_sessions()
+        kept = meeting_id in stt_worker.sessions
+        await asyncio.sleep(0.02)
+        await stt_worker._release_idle_sessions()
+        return kept, meeting_id in stt_worker.sessions
+
+    kept, still_open = asyncio.run(scenario())
+
+    assert (kept, still_open) == (True, False)
+    assert client.streams == []
@@ -0,0 +1,110 @@
+import asyncio
+import uuid
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.server import migrations
+from backend.server.models import Meeting, Team, TeamMember, Transcript, User
+from backend.server.routers import transcripts
+from backend.server.services import transcript_archive
+
+
+@pytest.mark.parametrize("codec", ["gzip", "zstd"])
+def test_archived_transcript_reads_through(codec, tmp_path, monkeypatch) -> None:
+    if codec == "zstd" and transcript_archive.zstandard is None:
+        pytest.skip("zstandard is not installed")
+    monkeypatch.setattr(transcript_archive, "TRANSCRIPT_ARCHIVE_DIR", str(tmp_path / "archive"))
+    monkeypatch.setattr(transcript_archive, "TRANSCRIPT_ARCHIVE_CODEC", codec)
+    monkeypatch.setattr(transcript_archive, "CHUNK_SIZE", 2)
+    start = datetime(2024, 1, 1, 10)
+
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'archive.db'}")
+        await migrations.upgrade(engine)
+        sessions = async_sessionmaker(engine, expire_on_commit=False)
+        user = User(id=uuid.uuid4(), email="a@example.com", name="사용자", password_hash="x")
+        team_id, meeting_id = uuid.uuid4(), uuid.uuid4()
+        async with sessions() as session:
+            session.add_all(
+                [
+                    user,
+                    Team(id=team_id, name="team", invite_code="ARCHIVE"),
+                    TeamMember(id=uuid.uuid4(), team_id=team_id, user_id=user.id, role="member"),
+                    Meeting(
+                        id=meeting_id,
+                        team_id=team_id,
+                        title="m",
+                        date=date(2024, 1, 1),
+                        start_time=time(10),
+                        status="completed",
+                        updated_at=start,
+                    ),
+                ]
+            )
+            session.add_all(
+                Transcript(
+                    id=uuid.uuid4(),
+                    meeting_id=meeting_id,
+                    speaker=f"화자{n % 3}",
+                    text=f"{n}번째 발언",
+                    timestamp=f"00:{n:02d}",
+                    created_at=start + timedelta(seconds=n),
+                )
+                for n in range(7)
+            )
+            await session.commit()
+            original = [row.text for row in await transcript_archive.load_transcript(session, await session.get(Meeting, meeting_id))]
+
+            candidates = await transcript_archive.archivable_meetings(session, timedelta(days=1), limit=10)
+            archived = await transcript_archive.archive_meeting(session, candidates[0])
+            left = await session.scalar(select(func.count(Transcript.id)))
+
+            # A segment written after archival is merged back in order.
+            session.add(
+                Transcript(
+                    id=uuid.uuid4(),
+                    meeting_id=meeting_id,
+                    speaker="화자0",
+                    text="늦은 발언",
+                    timestamp="00:59",
+                    created_at=start + timedelta(minutes=1),
+                )
+            )
+            await session.commit()
+
+            meeting = await session.get(Meeting, meeting_id)
+            full = [row.text for row in await transcript_archive.load_transcript(session, meeting)]
+            paged, cursor = [], None
+            while True:
+                page = await transcripts.get_transcript(
+                    meeting_id, cursor=cursor, limit=3, db=session, current_user=user
+                )
+                paged.extend(item.text for item in page.transcript)
+                cursor = page.next_cursor
+                if cursor is None:
+                    break
+            pointer = meeting.transcript_archive
+
+            # A later page starts at its own chunk; without the index it reads from the start.
+            archived_rows = await transcript_archive.read_archive(meeting)
+            after = transcript_archive.position(archived_rows[3])
+            offset = transcript_archive._chunk_offset(pointer, after)
+            seeked = [row.text for row in await transcript_archive.read_archive(meeting, after=after, limit=2)]
+            transcript_archive.index_path(pointer).unlink()
+            unindexed = [row.text for row in await transcript_archive.read_archive(meeting, after=after, limit=2)]
+        await engine.dispose()
+        return original, archived, left, full, paged, pointer, offset, seeked, unindexed
+
+    original, archived, left, full, paged, pointer, offset, seeked, unindexed = asyncio.run(scenario())
+
+    assert archived == 7
+    assert left == 0
+    assert (tmp_path / "archive" / pointer).exists()
+    assert full == original + ["늦은 발언"]
+    assert paged == full
+    assert pointer.endswith(transcript_archive.SUFFIXES[codec])
+    assert offset > 0
+    assert seeked == unindexed == original[4:6]
@@ -0,0 +1,78 @@
+import time
+
+from backend.server.services.transcript_compaction import (
+    compact_transcript,
+    estimate_tokens,
+    format_segments,
+    split_segment,
+    strip_fillers,
+)
+
+
+def test_fillers_are_stripped() -> None:
+    assert strip_fillers("음 그러니까 배포는 어 금요일에 해요") == "배포는 금요일에 해요"
+    assert strip_fillers("Um, you know, we ship on Friday") == "we ship on Friday"
+
+
+def test_same_speaker_segments_are_merged_without_duplicates() -> None:
+    transcript = [
+        {"speaker": "민수", "text": "배포 일정은"},
+        {"speaker": "민수", "text": "배포 일정은 금요일로 하죠"},
+        {"speaker": "지은", "text": "좋아요 문서는 제가 정리할게요"},
+        {"speaker": "지은", "text": "제가 정리할게요 목요일까지"},
+        {"speaker": "지은", "text": "음"},
+    ]
+
+    result = compact_transcript(transcript)
+
+    assert result.segments == [
+        {"speaker": "민수", "text": "배포 일정은 금요일로 하죠"},
+        {"speaker": "지은", "text": "좋아요 문서는 제가 정리할게요 목요일까지"},
+    ]
+    assert result.ratio < 1.0
+
+
+def test_budget_keeps_most_recent_segments() -> None:
+    transcript = [{"speaker": f"참여자{i % 2}", "text": f"{i}번 안건 논의"} for i in range(50)]
+
+    result = compact_transcript(transcript, max_tokens=40)
+
+    assert result.compacted_tokens <= 40
+    assert result.omitted > 0
+    assert result.segments[-1]["text"] == "49번 안건 논의"
+
+
+def test_long_single_speaker_run_compacts_quickly() -> None:
+    transcript = [{"speaker": "민수", "text": f"{i}번째 항목은 배포 전에 다시 확인하겠습니다"} for i in range(2000)]
+
+    started = time.perf_counter()
+    result = compact_transcript(transcript)
+
+    assert time.perf_counter() - started < 0.5
+    assert len(result.segments) == 1
+    assert result.segments[0]["text"].endswith("1999번째 항목은 배포 전에 다시 확인하겠습니다")
+
+
+def test_short_answers_are_kept_unless_repeated_back_to_back() -> None:
+    transcript = [
+        {"speaker": "지은", "text": "네"},
+        {"speaker": "지은", "text": "배포는 금요일에 해요"},
+        {"speaker": "지은", "text": "네"},
+        {"speaker": "지은", "text": "네"},
+    ]
+
+    result = compact_transcript(transcript)
+
+    assert result.segments[0]["text"] == "네 배포는 금요일에 해요 네"
+
+
+def test_oversized_segment_is_split_by_sentence_then_character() -> None:
+    item = {"speaker": "민수", "text": "배포는 금요일입니다. QA는 월요일입니다. " + "가" * 50, "timestamp": "00:01"}
+
+    pieces = split_segment(item, 20)
+
+    assert all(estimate_tokens(format_segments([piece])) <= 20 for piece in pieces)
+    assert pieces[0]["text"] == "배포는 금요일입니다."
+    assert all(piece["timestamp"] == "00:01" for piece in pieces)
+    assert "".join(piece["text"] for piece in pieces).replace(" ", "") == item["text"].replace(" ", "")
+    assert split_segment(item, 1000) == [item]
@@ -0,0 +1,135 @@
+import asyncio
+import uuid
+from datetime import date, time
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.server.models import Base, Meeting, Team, Transcript
+from backend.server.services.text_search import highlight
+from backend.server.services.transcript_search import count_archived_meetings, search_transcripts
+
+
+def _run(scenario):
+    async def main():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            team = Team(id=uuid.uuid4(), name="팀", invite_code="ABC123")
+            other = Team(id=uuid.uuid4(), name="다른 팀", invite_code="XYZ789")
+            meeting = Meeting(id=uuid.uuid4(), team_id=team.id, title="주간 회의", date=date(2024, 5, 1), start_time=time(10))
+            foreign = Meeting(id=uuid.uuid4(), team_id=other.id, title="외부 회의", date=date(2024, 5, 2), start_time=time(11))
+            texts = [
+                "배포 일정은 금요일로 확정했습니다",
+                "배포일정 관련해서 QA 팀과 다시 이야기할게요",
+                "디자인 시안은 다음 주에 공유합니다",
+                "배포 전에 회귀 테스트를 돌려야 해요",
+            ]
+            session.add_all([team, other, meeting, foreign])
+            session.add_all(
+                Transcript(id=uuid.uuid4(), meeting_id=meeting.id, speaker="민수", text=text, timestamp=f"00:0{i}")
+                for i, text in enumerate(texts)
+            )
+            session.add(Transcript(id=uuid.uuid4(), meeting_id=foreign.id, speaker="지은", text="배포 일정 공유", timestamp="00:00"))
+            await session.commit()
+            result = await scenario(session, team)
+        await engine.dispose()
+        return result
+
+    return asyncio.run(main())
+
+
+def test_korean_substring_matches_are_ranked_and_scoped_to_team() -> None:
+    async def scenario(session, team):
+        return await search_transcripts(session, team.id, "일정", limit=10)
+
+    hits, next_after = _run(scenario)
+
+    assert {hit.text for hit in hits} == {
+        "배포 일정은 금요일로 확정했습니다",
+        "배포일정 관련해서 QA 팀과 다시 이야기할게요",
+    }
+    assert all(hit.meeting_title == "주간 회의" for hit in hits)
+    assert next_after is None
+
+
+def test_trigram_terms_use_the_fts_index() -> None:
+    async def scenario(session, team):
+        return await search_transcripts(session, team.id, "회귀 테스트", limit=10)
+
+    hits, _ = _run(scenario)
+
+    assert [hit.text for hit in hits] == ["배포 전에 회귀 테스트를 돌려야 해요"]
+    assert hits[0].score > 0
+    assert "<mark>회귀</mark> <mark>테스트</mark>" in hits[0].highlight
+
+
+def test_cursor_pages_through_every_hit_once() -> None:
+    async def scenario(session, team):
+        pages = []
+        after = None
+        while True:
+            hits, after = await search_transcripts(session, team.id, "배포", limit=2, after=after)
+            pages.append(hits)
+            if after is None:
+                return pages
+
+    pages = _run(scenario)
+
+    ids = [hit.id for page in pages for hit in page]
+    assert [len(page) for page in pages] == [2, 1]
+    assert len(set(ids)) == 3
+
+
+def test_archived_meetings_are_counted_for_the_search_response() -> None:
+    async def scenario(session, team):
+        before = await count_archived_meetings(session, team.id)
+        meeting = await session.scalar(select(Meeting).where(Meeting.team_id == team.id))
+        meeting.transcript_archive = f"{meeting.id}.ndjson.gz"
+        await session.commit()
+        return before, await count_archived_meetings(session, team.id)
+
+    assert _run(scenario) == (0, 1)
+
+
+def test_highlight_escapes_html_and_trims_long_text() -> None:
+    text = "가" * 100 + " <b>배포</b> " + "나" * 100
+    snippet = highlight(text, ["배포"], context=10)
+
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert "&lt;b&gt;<mark>배포</mark>&lt;/b&gt;" in snippet
+
+
+def test_index_stays_in_sync_after_deletes_updates_and_vacuum(tmp_path) -> None:
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'vacuum.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            team = Team(id=uuid.uuid4(), name="팀", invite_code="VACUUM")
+            meeting = Meeting(id=uuid.uuid4(), team_id=team.id, title="회의", date=date(2024, 5, 1), start_time=time(10))
+            rows = [
+                Transcript(id=uuid.uuid4(), meeting_id=meeting.id, speaker="민수", text=f"{i}번 발언 일반 안건", timestamp="00:00")
+                for i in range(20)
+            ]
+            session.add_all([team, meeting, *rows])
+            await session.commit()
+            for row in rows[:15]:
+                await session.delete(row)
+            rows[-1].text = "회귀 테스트 결과 공유"
+            await session.commit()
+        async with engine.connect() as conn:
+            autocommit = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await autocommit.exec_driver_sql("VACUUM")
+        async with async_sessionmaker(engine, expire_on_commit=False)() as session:
+            updated, _ = await search_transcripts(session, team.id, "회귀 테스트", limit=10)
+            remaining, _ = await search_transcripts(session, team.id, "일반 안건", limit=10)
+        await engine.dispose()
+        return updated, remaining, rows
+
+    updated, remaining, rows = asyncio.run(main())
+
+    assert [hit.id for hit in updated] == [rows[-1].id]
+    assert {hit.id for hit in remaining} == {row.id for row in rows[15:19]}
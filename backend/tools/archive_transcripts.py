@@ -0,0 +1,46 @@
+"""Move transcripts of long-completed meetings into compressed archive files.
+
+    python -m backend.tools.archive_transcripts [--older-than-days N] [--limit N]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from datetime import timedelta
+
+from backend.server import db
+from backend.server.config import TRANSCRIPT_ARCHIVE_AFTER_DAYS
+from backend.server.services.transcript_archive import archivable_meetings, archive_meeting, logger
+
+BATCH = 50
+
+
+async def run(older_than: timedelta, limit: int) -> tuple[int, int]:
+    meetings_done = segments = 0
+    async with db.AsyncSessionLocal() as session:
+        while meetings_done < limit:
+            batch = await archivable_meetings(session, older_than, min(BATCH, limit - meetings_done))
+            if not batch:
+                break
+            for meeting in batch:
+                segments += await archive_meeting(session, meeting)
+                meetings_done += 1
+    await db.engine.dispose()
+    return meetings_done, segments
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--older-than-days", type=int, default=TRANSCRIPT_ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--limit", type=int, default=1000, help="maximum number of meetings to archive")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    logger.setLevel(logging.INFO)
+    db.configure_engines("worker")
+    meetings, segments = asyncio.run(run(timedelta(days=args.older_than_days), args.limit))
+    print(f"archived {segments} segment(s) from {meetings} meeting(s)")
+
+
+if __name__ == "__main__":
+    main()
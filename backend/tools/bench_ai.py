@@ -0,0 +1,215 @@
+"""Benchmark summary and action-item generation at increasing concurrency.
+
+By default the benchmark starts the Gemini stub in-process and drives
+``LLMService`` directly, so changes to the service can be compared without
+network access or API keys::
+
+    python -m backend.tools.bench_ai --concurrency 1,4,16,64 --requests 200 --latency-ms 300
+
+To exercise the full HTTP path, run the API against the stub and pass
+``--api-url`` with a bearer token; requests then go to ``/api/ai/*`` with the
+result cache bypassed.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from .gemini_stub import add_stub_arguments, config_from_args, create_app
+
+OPERATIONS = ("summarize", "extract-action-items")
+
+
+@dataclass
+class LevelResult:
+    operation: str
+    concurrency: int
+    requests: int
+    errors: int
+    p50_ms: float
+    p99_ms: float
+    throughput_rps: float
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def make_transcript(index: int, segments: int) -> list[dict[str, str]]:
+    # Vary the text per request so window and result caches never short-circuit a call.
+    return [
+        {"speaker": f"참여자{i % 4}", "text": f"[{index}] {i}번째 안건: 배포 일정과 담당자를 확인하고 다음 주까지 정리할게요"}
+        for i in range(segments)
+    ]
+
+
+async def run_level(
+    operation: str,
+    concurrency: int,
+    total: int,
+    call: Callable[[int], Awaitable[Any]],
+) -> LevelResult:
+    latencies: list[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker() -> None:
+        nonlocal errors
+        for index in counter:
+            started = time.perf_counter()
+            try:
+                await call(index)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return LevelResult(
+        operation=operation,
+        concurrency=concurrency,
+        requests=total,
+        errors=errors,
+        p50_ms=round(statistics.median(latencies), 1) if latencies else 0.0,
+        p99_ms=round(percentile(latencies, 99), 1),
+        throughput_rps=round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+    )
+
+
+def _service_caller(operation: str, segments: int) -> Callable[[int], Awaitable[Any]]:
+    from backend.server.services.llm import LLMService
+
+    service = LLMService()
+    service.provider = "gemini"
+    service.api_key = service.api_key or "stub"
+
+    async def call(index: int) -> Any:
+        transcript = make_transcript(index, segments)
+        if operation == "summarize":
+            return await service.summarize(transcript, fallback=False)
+        return await service.extract_action_items(transcript, fallback=False)
+
+    return call
+
+
+def _api_caller(
+    operation: str, segments: int, api_url: str, token: str
+) -> tuple[Callable[[int], Awaitable[Any]], Callable[[], Awaitable[None]]]:
+    import httpx
+
+    client = httpx.AsyncClient(
+        base_url=api_url.rstrip("/"),
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=120.0,
+    )
+
+    async def call(index: int) -> Any:
+        res = await client.post(
+            f"/api/ai/{operation}",
+            json={"transcript": make_transcript(index, segments), "bypassCache": True},
+        )
+        res.raise_for_status()
+        return res.json()
+
+    return call, client.aclose
+
+
+def _start_stub(args: argparse.Namespace) -> tuple[str, Callable[[], None]]:
+    import uvicorn
+
+    server = uvicorn.Server(
+        uvicorn.Config(create_app(config_from_args(args)), host="127.0.0.1", port=0, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.time() + 10
+    while not server.started and time.time() < deadline:
+        time.sleep(0.01)
+    port = server.servers[0].sockets[0].getsockname()[1]
+
+    def stop() -> None:
+        server.should_exit = True
+        thread.join(timeout=5)
+
+    return f"http://127.0.0.1:{port}", stop
+
+
+async def run_benchmark(args: argparse.Namespace) -> list[LevelResult]:
+    from backend.server.services import llm
+
+    stop_stub: Optional[Callable[[], None]] = None
+    if not args.api_url:
+        stub_url = args.stub_url
+        if not stub_url:
+            stub_url, stop_stub = _start_stub(args)
+        llm.GEMINI_API_BASE = stub_url
+
+    results: list[LevelResult] = []
+    try:
+        for operation in args.operations:
+            for concurrency in args.concurrency:
+                close: Optional[Callable[[], Awaitable[None]]] = None
+                if args.api_url:
+                    call, close = _api_caller(operation, args.segments, args.api_url, args.token)
+                else:
+                    call = _service_caller(operation, args.segments)
+                try:
+                    result = await run_level(operation, concurrency, args.requests, call)
+                finally:
+                    if close is not None:
+                        await close()
+                results.append(result)
+                print(
+                    f"{result.operation:<22} c={result.concurrency:<4} n={result.requests:<5} "
+                    f"err={result.errors:<4} p50={result.p50_ms:>8.1f}ms p99={result.p99_ms:>8.1f}ms "
+                    f"{result.throughput_rps:>8.2f} req/s",
+                    flush=True,
+                )
+    finally:
+        await llm.close_http_client()
+        if stop_stub is not None:
+            stop_stub()
+    return results
+
+
+def _int_list(value: str) -> list[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 4, 16, 64])
+    parser.add_argument("--requests", type=int, default=100, help="requests per concurrency level")
+    parser.add_argument("--segments", type=int, default=40, help="transcript segments per request")
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument("--stub-url", help="use an already running Gemini stub")
+    parser.add_argument("--api-url", help="benchmark a running API instead of LLMService")
+    parser.add_argument("--token", default="", help="bearer token for --api-url")
+    parser.add_argument("--json", dest="json_path", help="write results to this file")
+    parser.add_argument("--verbose", action="store_true", help="show retry and fallback warnings")
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+    if not args.verbose:
+        logging.getLogger("backend.server.services").setLevel(logging.ERROR)
+
+    results = asyncio.run(run_benchmark(args))
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as fh:
+            json.dump([asdict(result) for result in results], fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Seed a synthetic transcript corpus and measure search latency.
+
+Creates one team with ``--meetings`` meetings and ``--segments`` transcript
+rows in total, then times a fixed set of Korean and mixed queries::
+
+    python -m backend.tools.bench_transcript_search --database-url sqlite+aiosqlite:///./search_bench.db --segments 2000000
+
+Seeding is skipped when the target team already has segments, so repeated
+runs against the same database only measure queries.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+import uuid
+from datetime import date, time as dtime, timedelta
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.server import migrations
+from backend.server.models import Meeting, Team, Transcript
+from backend.server.services.transcript_search import search_transcripts
+
+from .bench_ai import percentile
+
+BENCH_TEAM_ID = uuid.UUID("00000000-0000-4000-8000-00000000b3c4")
+QUERIES = ("배포 일정", "회귀 테스트", "디자인 시안", "QA", "고객 피드백 정리", "예산")
+WORDS = (
+    "배포", "일정", "회귀", "테스트", "디자인", "시안", "고객", "피드백", "정리", "예산",
+    "검토", "담당자", "다음", "주까지", "공유", "회의", "안건", "확인", "QA", "릴리스",
+)
+PARTICLES = ("", "은", "는", "이", "가", "을", "를", "에서", "으로", "도")
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) + rng.choice(PARTICLES) for _ in range(rng.randint(6, 16)))
+
+
+async def seed(session_factory, meetings: int, segments: int, batch_size: int, seed_value: int) -> int:
+    async with session_factory() as session:
+        existing = await session.scalar(
+            select(func.count(Transcript.id)).join(Meeting).where(Meeting.team_id == BENCH_TEAM_ID)
+        )
+        if existing:
+            return existing
+
+        session.add(Team(id=BENCH_TEAM_ID, name="검색 벤치마크", invite_code="BENCH1"))
+        meeting_ids = [uuid.uuid4() for _ in range(meetings)]
+        await session.execute(
+            insert(Meeting),
+            [
+                {
+                    "id": meeting_id,
+                    "team_id": BENCH_TEAM_ID,
+                    "title": f"회의 {index}",
+                    "date": date(2024, 1, 1) + timedelta(days=index % 365),
+                    "start_time": dtime(10),
+                }
+                for index, meeting_id in enumerate(meeting_ids)
+            ],
+        )
+        await session.commit()
+
+        rng = random.Random(seed_value)
+        for start in range(0, segments, batch_size):
+            rows = [
+                {
+                    "id": uuid.uuid4(),
+                    "meeting_id": meeting_ids[index % meetings],
+                    "speaker": f"참여자{index % 6}",
+                    "text": _sentence(rng),
+                    "timestamp": f"{(index // 60) % 60:02d}:{index % 60:02d}",
+                }
+                for index in range(start, min(segments, start + batch_size))
+            ]
+            await session.execute(insert(Transcript), rows)
+            await session.commit()
+            print(f"seeded {start + len(rows)}/{segments}", end="\r", flush=True)
+        print()
+        return segments
+
+
+async def run(args: argparse.Namespace) -> None:
+    engine = create_async_engine(args.database_url)
+    await migrations.upgrade(engine)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    started = time.perf_counter()
+    total = await seed(session_factory, args.meetings, args.segments, args.batch_size, args.seed)
+    print(f"corpus: {total} segments ({time.perf_counter() - started:.1f}s)")
+
+    async with session_factory() as session:
+        for query in QUERIES:
+            latencies: list[float] = []
+            hits = []
+            for _ in range(args.repeat):
+                began = time.perf_counter()
+                hits, after = await search_transcripts(session, BENCH_TEAM_ID, query, args.limit)
+                if args.pages > 1 and after is not None:
+                    for _ in range(args.pages - 1):
+                        _, after = await search_transcripts(session, BENCH_TEAM_ID, query, args.limit, after)
+                        if after is None:
+                            break
+                latencies.append((time.perf_counter() - began) * 1000)
+            print(
+                f"{query:<16} hits={len(hits):<4} p50={percentile(latencies, 50):>8.1f}ms "
+                f"p99={percentile(latencies, 99):>8.1f}ms",
+                flush=True,
+            )
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///./search_bench.db")
+    parser.add_argument("--segments", type=int, default=1_000_000)
+    parser.add_argument("--meetings", type=int, default=2_000)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=1, help="follow the cursor this many pages per sample")
+    parser.add_argument("--repeat", type=int, default=20, help="samples per query")
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Local stand-in for the Gemini ``generateContent`` / ``streamGenerateContent`` endpoints.
+
+Run it and point the API at it to exercise LLM code paths offline::
+
+    python -m backend.tools.gemini_stub --port 8089 --latency-ms 300 --tokens-per-second 80
+    GEMINI_API_BASE=http://127.0.0.1:8089 GEMINI_API_KEY=stub uvicorn backend.server.main:app
+
+Replies are deterministic for a given prompt, and injected failures follow a
+seeded random sequence so benchmark runs can be repeated.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+from dataclasses import dataclass, field
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+STREAM_CHUNK_CHARS = 8
+
+
+@dataclass
+class StubConfig:
+    latency_ms: float = 0.0
+    # Generation speed for the reply; 0 returns the whole reply after ``latency_ms``.
+    tokens_per_second: float = 0.0
+    failure_rate: float = 0.0
+    failure_status: int = 503
+    retry_after: Optional[float] = None
+    seed: int = 0
+
+
+@dataclass
+class StubStats:
+    requests: int = 0
+    failures: int = 0
+    connections: set[tuple[str, int]] = field(default_factory=set)
+
+
+def _prompt_text(body: dict) -> str:
+    parts = []
+    for content in body.get("contents") or []:
+        for part in content.get("parts") or []:
+            parts.append(str(part.get("text") or ""))
+    return "\n".join(parts)
+
+
+def _reply_for(prompt: str) -> str:
+    action_item = {"type": "task", "assignee": "참여자", "content": "후속 작업 정리", "dueDate": "이번주 금요일"}
+    lines = [line for line in prompt.splitlines() if ":" in line][:3]
+    bullets = [f"- {line.split(':', 1)[1].strip()[:60]}" for line in lines] or ["- 논의 내용 없음"]
+    if '"actionItems"' in prompt:
+        return json.dumps({"summary": bullets, "actionItems": [action_item]}, ensure_ascii=False)
+    if "JSON" in prompt:
+        return json.dumps([action_item], ensure_ascii=False)
+    return "\n".join(bullets)
+
+
+def _estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 2)
+
+
+async def _stream_chunks(text: str, seconds_per_char: float):
+    for start in range(0, len(text), STREAM_CHUNK_CHARS):
+        piece = text[start : start + STREAM_CHUNK_CHARS]
+        await asyncio.sleep(seconds_per_char * len(piece))
+        chunk = {"candidates": [{"content": {"role": "model", "parts": [{"text": piece}]}}]}
+        yield f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+
+
+def create_app(config: StubConfig | None = None) -> FastAPI:
+    config = config or StubConfig()
+    app = FastAPI(title="Gemini stub")
+    app.state.config = config
+    app.state.stats = StubStats()
+    rng = random.Random(config.seed)
+
+    @app.post("/v1beta/models/{model_action}", response_model=None)
+    async def generate_content(model_action: str, request: Request) -> dict | JSONResponse | StreamingResponse:
+        stats: StubStats = app.state.stats
+        stats.requests += 1
+        if request.client:
+            stats.connections.add((request.client.host, request.client.port))
+
+        body = await request.json()
+        prompt = _prompt_text(body)
+        if config.latency_ms:
+            await asyncio.sleep(config.latency_ms / 1000.0)
+
+        if config.failure_rate and rng.random() < config.failure_rate:
+            stats.failures += 1
+            headers = {}
+            if config.retry_after is not None:
+                headers["Retry-After"] = str(config.retry_after)
+            return JSONResponse(
+                {"error": {"code": config.failure_status, "message": "Injected failure", "status": "UNAVAILABLE"}},
+                status_code=config.failure_status,
+                headers=headers,
+            )
+
+        text = _reply_for(prompt)
+        generation_seconds = (
+            _estimate_tokens(text) / config.tokens_per_second if config.tokens_per_second > 0 else 0.0
+        )
+        if model_action.endswith(":streamGenerateContent"):
+            return StreamingResponse(
+                _stream_chunks(text, generation_seconds / max(1, len(text))),
+                media_type="text/event-stream",
+            )
+        if generation_seconds:
+            await asyncio.sleep(generation_seconds)
+        return {
+            "candidates": [{"content": {"role": "model", "parts": [{"text": text}]}}],
+            "usageMetadata": {
+                "promptTokenCount": _estimate_tokens(prompt),
+                "candidatesTokenCount": _estimate_tokens(text),
+            },
+        }
+
+    @app.get("/stats")
+    async def stats() -> dict:
+        stats: StubStats = app.state.stats
+        return {
+            "requests": stats.requests,
+            "failures": stats.failures,
+            "connections": len(stats.connections),
+        }
+
+    return app
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--tokens-per-second", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--failure-status", type=int, default=503)
+    parser.add_argument("--retry-after", type=float, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def config_from_args(args: argparse.Namespace) -> StubConfig:
+    return StubConfig(
+        latency_ms=args.latency_ms,
+        tokens_per_second=args.tokens_per_second,
+        failure_rate=args.failure_rate,
+        failure_status=args.failure_status,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+    uvicorn.run(create_app(config_from_args(args)), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
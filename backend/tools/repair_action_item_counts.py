@@ -0,0 +1,32 @@
+"""Recompute ``meetings.action_items_count`` from the action_items table.
+
+    python -m backend.tools.repair_action_item_counts [--meeting-id UUID ...]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import uuid
+
+from backend.server.db import AsyncSessionLocal, engine
+from backend.server.services.action_item_counts import recount_action_items
+
+
+async def run(meeting_ids: list[uuid.UUID] | None) -> int:
+    async with AsyncSessionLocal() as session:
+        fixed = await recount_action_items(session, meeting_ids)
+        await session.commit()
+    await engine.dispose()
+    return fixed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meeting-id", dest="meeting_ids", type=uuid.UUID, action="append")
+    args = parser.parse_args()
+    fixed = asyncio.run(run(args.meeting_ids))
+    print(f"repaired {fixed} meeting(s)")
+
+
+if __name__ == "__main__":
+    main()